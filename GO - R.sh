@@ -6,4 +6,4 @@
 cd "$(dirname "$0")"
 
 # 2. Execute the python script using the absolute path.
-/usr/bin/python3 "GO - R/ui.py"
\ No newline at end of file
+/usr/bin/python3 "GO - R/ui.py" "$@"
\ No newline at end of file
@@ -0,0 +1,207 @@
+# GoRBench.py
+# MIDI throughput benchmarks for GoRLib that need no keyboard: every case runs against an
+# in-process mock output (default) or an rtmidi virtual port, and the results are saved as
+# JSON so runs before and after a pacing/batching change can be compared.
+#
+#   python3 GoRBench.py                       # mock backend, print + save bench_results.json
+#   python3 GoRBench.py --backend virtual     # real rtmidi virtual port
+#   python3 GoRBench.py --backend emu         # in-process GoREmu keyboard emulator (answers RQ1)
+#   python3 GoRBench.py --compare old.json    # show the change against an earlier run
+import argparse, json, os, platform, sys, time
+
+import GoRLib
+import GoRPatches
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# --- Backends ---
+class CountingMidiOut:
+    """rtmidi.MidiOut stand-in that counts traffic and forwards it to `inner` (or drops it)."""
+
+    def __init__(self, inner=None, name="GoRBench Mock"):
+        self.inner = inner
+        self.name = name
+        self.messages = 0
+        self.bytes = 0
+        self._open = False
+
+    def get_ports(self):
+        return self.inner.get_ports() if self.inner else [self.name]
+
+    def open_port(self, index=0, name=None):
+        if self.inner:
+            self.inner.open_port(index)
+        self._open = True
+
+    def open_virtual_port(self, name=None):
+        self.inner.open_virtual_port(name)
+        self._open = True
+
+    def is_port_open(self):
+        return self._open
+
+    def close_port(self):
+        if self.inner:
+            self.inner.close_port()
+        self._open = False
+
+    def send_message(self, message):
+        if self.inner:
+            self.inner.send_message(message)
+        self.messages += 1
+        self.bytes += len(message)
+
+def open_backend(kind: str) -> tuple:
+    """Returns (MidiManager, CountingMidiOut) installed as GoRLib's active connection."""
+    if kind == "virtual":
+        out = CountingMidiOut(GoRLib.rtmidi.MidiOut())
+        manager = GoRLib.MidiManager(midiout=out)
+        manager.open_virtual_port("GoRBench")
+    elif kind == "emu":
+        import GoREmu
+        emu = GoREmu.GoREmu()
+        emu.start()
+        out = CountingMidiOut(GoREmu.EmulatedMidiOut(emu))
+        manager = GoRLib.MidiManager(midiout=out)
+        manager.open_port()
+        manager.midiin = GoREmu.EmulatedMidiIn(emu, manager.midi_callback)
+    else:
+        out = CountingMidiOut()
+        manager = GoRLib.MidiManager(midiout=out)
+        manager.open_port()
+    GoRLib.set_midi_manager(manager)
+    return manager, out
+
+
+# --- Cases ---
+# name -> (default iterations, function(i) doing one call)
+def _zone_patch(i):
+    GoRLib.invalidate_shadow()  # bank CCs would otherwise be skipped as unchanged
+    GoRLib.zone_patch(1 + i % 16, 87, 64, 1 + i % 128)
+
+def _zone_patch_record(i):
+    GoRLib.invalidate_shadow()
+    GoRLib.zone_patch_record(1 + i % 16, i % len(GoRLib.get_patch_table()))
+
+def _part_patch(i):
+    GoRLib.invalidate_shadow()
+    GoRLib.part_patch_SysEx(1 + i % 16, 87, 64, 1 + i % 128)
+
+def _part_patch_record(i):
+    GoRLib.invalidate_shadow()
+    GoRLib.part_patch_record_SysEx(1 + i % 16, i % len(GoRLib.get_patch_table()))
+
+def _setup_split(i):
+    GoRLib.invalidate_shadow()  # measure the full sequence, not a no-op diff
+    GoRLib.setup_split_SysEx(split_point=48 + i % 24)
+
+def _reset(i):
+    GoRLib.invalidate_shadow()
+    GoRLib.reset_to_default_SysEx()
+
+def _zone_layout(i):
+    GoRLib.invalidate_shadow()
+    GoRLib.apply_zone_layout({zone: {"patch": (87, 64, 1 + (i + zone) % 128), "enabled": zone <= 2,
+                                     "octave": 0, "low": 0, "high": 127} for zone in range(1, 17)})
+
+def _raw_burst(i):
+    send = GoRLib._midi_manager_instance.send_message
+    for note in range(128):
+        send([0x90, note, 100])
+        send([0x80, note, 0])
+
+CASES = {
+    "zone_patch": (200, _zone_patch),
+    "zone_patch_record": (200, _zone_patch_record),
+    "apply_zone_layout": (50, _zone_layout),
+    "part_patch_SysEx": (10, _part_patch),
+    "part_patch_record_SysEx": (10, _part_patch_record),
+    "setup_split_SysEx": (3, _setup_split),
+    "reset_to_default_SysEx": (2, _reset),
+    "send_message_burst": (20, _raw_burst),
+}
+
+def run_case(name, iterations, out) -> dict:
+    func = CASES[name][1]
+    GoRLib.LATENCY.reset()
+    messages, nbytes = out.messages, out.bytes
+    calls = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        t = time.perf_counter()
+        func(i)
+        calls.append(time.perf_counter() - t)
+    wall = time.perf_counter() - start
+
+    sleep = GoRLib.LATENCY.summary("sleep")
+    sleep_s = sleep["total"] / 1000 if sleep else 0.0
+    messages, nbytes = out.messages - messages, out.bytes - nbytes
+    calls.sort()
+    return {
+        "iterations": iterations,
+        "wall_s": wall,
+        "per_call_ms": {"mean": wall / iterations * 1000, "p50": calls[len(calls) // 2] * 1000, "max": calls[-1] * 1000},
+        "messages": messages,
+        "bytes": nbytes,
+        "messages_per_s": messages / wall if wall else 0.0,
+        "bytes_per_s": nbytes / wall if wall else 0.0,
+        "sleep_s": sleep_s,
+        "sleep_pct": 100 * sleep_s / wall if wall else 0.0,
+    }
+
+
+# --- Reporting ---
+def print_results(results, baseline=None):
+    print(f"{'case':<24}{'calls':>6}{'ms/call':>10}{'msgs':>7}{'msg/s':>10}{'B/s':>10}{'sleep%':>8}")
+    for name, r in results["cases"].items():
+        line = (f"{name:<24}{r['iterations']:>6}{r['per_call_ms']['mean']:>10.2f}{r['messages']:>7}"
+                f"{r['messages_per_s']:>10.0f}{r['bytes_per_s']:>10.0f}{r['sleep_pct']:>7.1f}%")
+        old = (baseline or {}).get("cases", {}).get(name)
+        if old:
+            change = lambda new, was: f"{(new - was) / was * 100:+.0f}%" if was else "n/a"
+            line += (f"   vs base: ms/call {change(r['per_call_ms']['mean'], old['per_call_ms']['mean'])},"
+                     f" msgs/call {change(r['messages'] / r['iterations'], old['messages'] / old['iterations'])}")
+        print(line)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark GoRLib MIDI throughput without a keyboard.")
+    parser.add_argument('--backend', choices=("mock", "virtual", "emu"), default="mock")
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--iterations', type=int, help="override every case's iteration count")
+    parser.add_argument('--pacing', choices=("fixed", "verified"), default="fixed")
+    parser.add_argument('--out', default=os.path.join(SCRIPT_DIR, 'bench_results.json'))
+    parser.add_argument('--compare', help="earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    try:
+        manager, out = open_backend(args.backend)
+    except GoRLib.GoRLibMIDIError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    GoRLib.set_sysex_pacing(args.pacing)
+    GoRLib.set_patch_table(GoRPatches.load().ids())
+
+    results = {"backend": args.backend, "pacing": args.pacing, "python": platform.python_version(),
+               "machine": platform.machine(), "time": time.strftime("%Y-%m-%d %H:%M:%S"), "cases": {}}
+    for name in args.cases:
+        iterations = args.iterations or CASES[name][0]
+        print(f"running {name} x{iterations} ...", file=sys.stderr)
+        results["cases"][name] = run_case(name, iterations, out)
+    manager.close_port()
+    if args.backend == "emu":
+        print("emulator:", file=sys.stderr)
+        out.inner.emu.print_stats()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    with open(args.out, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"saved {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
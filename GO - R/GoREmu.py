@@ -0,0 +1,309 @@
+# GoREmu.py
+# Software stand-in for a GO:PIANO / GO:KEYS: a Roland-style parameter memory that answers
+# DT1 writes, RQ1 reads and identity requests, so GoRLib's SysEx code can be tested without
+# the keyboard. Runs on a virtual MIDI port (Linux/macOS) or in-process (open_emulated).
+#
+#   python3 GoREmu.py                               # GO:PIANO on virtual port "GoREmu"
+#   python3 GoREmu.py --model GK --latency 2 --buffer 256
+#   python3 GoRBench.py --backend emu               # benchmarks against the in-process emulator
+import argparse, sys, threading, time
+from collections import Counter, deque
+
+import GoRLib
+
+DEVICE_ID = 0x10
+REPLY_CHUNK = 0x80      # RQ1 replies are split into DT1 messages of at most this many data bytes
+DEFAULT_BUFFER = 1024   # receive buffer (bytes); messages arriving while it is full are lost
+
+# --- Address Map ---
+# Same addressing as GoRLib: 16 part blocks and 16 zone blocks of the temporary performance.
+# Sizes are in bytes; addresses carry 7 bits per byte, as on the real keyboard.
+AREAS = {
+    "setup": (GoRLib.SETUP, 0x100),
+    "system common": (GoRLib.SYS_COMMON, 0x100),
+    "system control": (GoRLib.SYS_CTRL, 0x100),
+    "sound demo": (GoRLib.SOUND_DEMO_SWITCH, 1),
+    "parts": (GoRLib.PART_BASE, 16 * GoRLib.PART_BLOCK_SIZE),
+    "zones": (GoRLib.ZONE_BASE, 16 * GoRLib.ZONE_BLOCK_SIZE),
+}
+
+class DeviceMemory:
+    """The emulated parameter memory: one bytearray per area of AREAS, with power-on defaults."""
+
+    def __init__(self):
+        self.areas = {name: (start, bytearray(size)) for name, (start, size) in AREAS.items()}
+        self.reset()
+
+    def reset(self):
+        for _, data in self.areas.values():
+            data[:] = bytes(len(data))
+        for n in range(16):
+            part = GoRLib._part_address(n + 1)
+            self.write(part + GoRLib.OFF_PART_RX_CHAN, bytes([n]))
+            self.write(part + GoRLib.OFF_PART_RX_SW, bytes([1 if n == 0 else 0]))
+            self.write(part + GoRLib.OFF_PART_BANK_MSB, bytes([87, 64, 1]))
+            zone = GoRLib._zone_address(n + 1)
+            self.write(zone + GoRLib.OFF_ZONE_SW, bytes([1 if n == 0 else 0, 64]))
+            self.write(zone + GoRLib.OFF_ZONE_LOW, bytes([0, 127]))
+
+    def _locate(self, address, size):
+        offset = GoRLib._linear(address)
+        for start, data in self.areas.values():
+            if 0 <= offset - GoRLib._linear(start) <= len(data) - size:
+                return data, offset - GoRLib._linear(start)
+        return None, 0
+
+    def mapped(self, address: int, size: int = 1) -> bool:
+        return self._locate(address, size)[0] is not None
+
+    def read(self, address: int, size: int) -> bytes | None:
+        data, offset = self._locate(address, size)
+        return None if data is None else bytes(data[offset:offset + size])
+
+    def write(self, address: int, values: bytes) -> bool:
+        data, offset = self._locate(address, len(values))
+        if data is None:
+            return False
+        data[offset:offset + len(values)] = values
+        return True
+
+
+# --- Device ---
+class GoREmu:
+    """
+    The emulated keyboard. receive() takes raw MIDI messages (any thread); they go through a
+    bounded receive buffer and are processed on the emulator's own thread, `latency` seconds
+    each. Replies are passed to on_reply(message).
+    """
+
+    def __init__(self, model="GP", latency=0.0, buffer_size=DEFAULT_BUFFER, device_id=DEVICE_ID):
+        if model not in GoRLib.MODEL_IDS:
+            raise ValueError(f"Unknown model '{model}', expected one of {', '.join(GoRLib.MODEL_IDS)}")
+        self.model = model
+        self.model_id = bytes.fromhex(GoRLib.MODEL_IDS[model])
+        self.device_id = device_id
+        self.latency = latency
+        self.buffer_size = buffer_size
+        self.memory = DeviceMemory()
+        self.channels = [{"program": None, "cc": {}} for _ in range(16)]
+        self.stats = Counter()
+        self.on_reply = None
+        self._sysex = GoRLib.SysExAssembler()
+        self._queue = deque()
+        self._queued_bytes = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._busy = False
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="GoREmu", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread:
+            self._thread.join()
+
+    def receive(self, message):
+        """Called by the MIDI driver (or EmulatedMidiOut) for every incoming message."""
+        with self._cond:
+            if self._queued_bytes + len(message) > self.buffer_size:
+                self.stats["buffer overflows"] += 1
+                return
+            self._queue.append(list(message))
+            self._queued_bytes += len(message)
+            self.stats["max buffered bytes"] = max(self.stats["max buffered bytes"], self._queued_bytes)
+            self._cond.notify()
+
+    def wait_idle(self, timeout=5.0) -> bool:
+        """Blocks until every received message has been processed."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                message = self._queue.popleft()
+                self._busy = True
+            if self.latency:
+                time.sleep(self.latency)
+            try:
+                self.process(message)
+            finally:
+                with self._cond:
+                    self._queued_bytes -= len(message)
+                    self._busy = False
+                    self._cond.notify_all()
+
+    # --- Message handling ---
+    def process(self, message):
+        self.stats["messages"] += 1
+        status = message[0] & 0xF0
+        if message[0] == 0xF0 or (self._sysex.active and message[0] < 0x80):
+            for sysex in self._sysex.feed(message):
+                self._handle_sysex(sysex)
+        elif status == GoRLib.CONTROL_CHANGE_STATUS and len(message) == 3:
+            self.channels[message[0] & 0x0F]["cc"][message[1]] = message[2]
+            self.stats["control changes"] += 1
+        elif status == GoRLib.PROGRAM_CHANGE_STATUS and len(message) == 2:
+            self.channels[message[0] & 0x0F]["program"] = message[1]
+            self.stats["program changes"] += 1
+
+    def _handle_sysex(self, msg):
+        if any(b & 0x80 for b in msg[1:-1]):
+            # On a real wire a byte >= 0x80 is a status byte and ends the SysEx
+            self.stats["malformed"] += 1
+            return
+        if len(msg) == 6 and msg[1] == 0x7E and msg[2] in (self.device_id, 0x7F) and msg[3:5] == b'\x06\x01':
+            self.stats["identity requests"] += 1
+            self._reply(self.identity_reply())
+            return
+        if len(msg) < 14 or msg[1] != 0x41 or msg[2] not in (self.device_id, 0x7F) or bytes(msg[3:7]) != self.model_id:
+            self.stats["ignored (other device)"] += 1
+            return
+        command, payload, checksum = msg[7], bytes(msg[8:-2]), msg[-2]
+        if (sum(payload) + checksum) % 128:
+            self.stats["checksum errors"] += 1
+            return
+        address = int.from_bytes(payload[:4], 'big')
+        if command == GoRLib.DT1:
+            if self.memory.write(address, payload[4:]):
+                self.stats["DT1 writes"] += 1
+            else:
+                self.stats["DT1 unmapped"] += 1
+        elif command == GoRLib.RQ1 and len(payload) == 8:
+            size = GoRLib._linear(int.from_bytes(payload[4:], 'big'))
+            data = self.memory.read(address, size)
+            if data is None:
+                self.stats["RQ1 unmapped"] += 1
+                return
+            self.stats["RQ1 replies"] += 1
+            for offset in range(0, size, REPLY_CHUNK):
+                self._reply(self.dt1(GoRLib._address_add(address, offset), data[offset:offset + REPLY_CHUNK]))
+        else:
+            self.stats["unknown commands"] += 1
+
+    def dt1(self, address: int, data: bytes) -> list:
+        payload = address.to_bytes(4, 'big') + data
+        return [0xF0, 0x41, self.device_id, *self.model_id, GoRLib.DT1, *payload, (128 - sum(payload) % 128) & 0x7F, 0xF7]
+
+    def identity_reply(self) -> list:
+        # Roland layout: family code (2), family number (2), software revision (4). The real
+        # GO:PIANO/GO:KEYS codes are not documented here, so the family code is the model ID's last byte.
+        return GoRLib.IDENTITY_REPLY_START[:2] + [self.device_id] + GoRLib.IDENTITY_REPLY_START[3:] + \
+            [self.model_id[3], 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0xF7]
+
+    def _reply(self, message):
+        self.stats["replies"] += 1
+        if self.on_reply:
+            self.on_reply(message)
+
+    def print_stats(self, file=sys.stderr):
+        for key, value in sorted(self.stats.items()):
+            print(f"  {key:<24}{value:>8}", file=file)
+
+
+# --- In-process connection ---
+class EmulatedMidiOut:
+    """rtmidi.MidiOut stand-in that hands every message straight to a GoREmu."""
+
+    def __init__(self, emu):
+        self.emu = emu
+        self._open = False
+
+    def get_ports(self):
+        return [f"GoREmu {self.emu.model}"]
+
+    def open_port(self, index=0, name=None):
+        self._open = True
+
+    def is_port_open(self):
+        return self._open
+
+    def close_port(self):
+        self._open = False
+
+    def send_message(self, message):
+        self.emu.receive(message)
+
+class EmulatedMidiIn:
+    """Delivers the emulator's replies to a MidiManager's input callback."""
+
+    def __init__(self, emu, callback):
+        self.emu = emu
+        emu.on_reply = lambda message: callback((message, 0.0))
+
+    def close_port(self):
+        self.emu.on_reply = None
+
+def open_emulated(model="GP", latency=0.0, buffer_size=DEFAULT_BUFFER, async_send=False):
+    """
+    Starts an emulator and installs a MidiManager wired to it in-process as GoRLib's active
+    connection (no MIDI driver involved). Returns (manager, emu).
+    """
+    emu = GoREmu(model, latency, buffer_size)
+    emu.start()
+    manager = GoRLib.MidiManager(async_send=async_send, midiout=EmulatedMidiOut(emu))
+    manager.open_port()
+    if manager.midiin:
+        manager.midiin.close_port()
+    manager.midiin = EmulatedMidiIn(emu, manager.midi_callback)
+    GoRLib.set_midi_manager(manager)
+    return manager, emu
+
+
+# --- Virtual port ---
+def serve_virtual(emu, name="GoREmu"):
+    """Opens a virtual MIDI input and output port pair called name, wired to emu."""
+    midiin = GoRLib.rtmidi.MidiIn(name=name)
+    midiin.ignore_types(sysex=False)
+    midiin.set_callback(lambda event, data=None: emu.receive(event[0]))
+    midiin.open_virtual_port(name)
+    midiout = GoRLib.rtmidi.MidiOut(name=name)
+    midiout.open_virtual_port(name)
+    emu.on_reply = midiout.send_message
+    return midiin, midiout
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Emulate a GO:PIANO / GO:KEYS on a virtual MIDI port.")
+    parser.add_argument('--model', choices=list(GoRLib.MODEL_IDS), default="GP")
+    parser.add_argument('--name', default="GoREmu", help="virtual port name")
+    parser.add_argument('--latency', type=float, default=0.0, help="processing time per message (ms)")
+    parser.add_argument('--buffer', type=int, default=DEFAULT_BUFFER, help="receive buffer size (bytes)")
+    args = parser.parse_args(argv)
+
+    emu = GoREmu(args.model, args.latency / 1000, args.buffer)
+    emu.start()
+    try:
+        ports = serve_virtual(emu, args.name)
+    except Exception as e:
+        print(f"ERROR: cannot open virtual port: {e}", file=sys.stderr)
+        return 1
+    print(f"GoREmu ({args.model}) listening on virtual port '{args.name}', Ctrl+C to stop", file=sys.stderr)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    for port in ports:
+        port.close_port()
+    emu.stop()
+    emu.print_stats()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
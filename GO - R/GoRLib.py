@@ -1,6 +1,17 @@
 # GoRLib.py
-import argparse, copy, threading, time
+# MIDI library behind GO:R; also a headless command line (no pygame needed):
+#
+#   python3 GoRLib.py ports
+#   python3 GoRLib.py --port "GO:PIANO" patch 1 87 64 1     # or: patch 1 ConcertGrand
+#   python3 GoRLib.py --sync apply setup.json               # parts/zones/split/layer in one pass
+#   python3 GoRLib.py --record split.gor apply split.json   # log the traffic, then:
+#   python3 GoRLib.py replay split.gor --timing fast        # send it again (or: dump split.gor)
+import argparse, atexit, bisect, copy, functools, glob, json, os, queue, re, struct, threading, time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 import sys  # Added 'sys' for clean error logging
+from array import array
+from collections import deque
 from operator import itemgetter
 import rtmidi
 from rtmidi.midiutil import open_midiinput, open_midioutput
@@ -36,25 +47,273 @@ PROGRAM_CHANGE_STATUS = 0xC0
 CC_BANK_MSB = 0x00
 CC_BANK_LSB = 0x20
 
+# Zone CCs (CC-based zone API)
+CC_ZONE_ENABLE = 85
+CC_ZONE_OCTAVE = 86
+CC_ZONE_LOW = 87
+CC_ZONE_HIGH = 88
+
 # --- Global State ---
 _midi_manager_instance = None
+_port_watcher = None
+_local = threading.local()  # .manager: the pool connection whose transmit thread this is (see MidiPool)
+
+def _get_manager():
+    """The connection GoRLib calls act on: the pool connection running the call, else the active one."""
+    return getattr(_local, 'manager', None) or _midi_manager_instance
 
 # --- Custom exception
 class GoRLibMIDIError(RuntimeError):
     """Raised for MIDI-related errors in GoRLib"""
     pass
 
+# --- Latency Instrumentation ---
+class LatencyStats:
+    """
+    Rolling timing samples per stage (last `window` values each) with percentile summaries.
+    Stages recorded by GoRLib: build (message encode), send (rtmidi call), sleep (pacing),
+    input_to_send (mark_input() to first byte out) and op:<function> for whole calls.
+    """
+
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, window=512):
+        self.window = window
+        self.enabled = True
+        self._samples = {}  # stage -> deque of seconds
+        self._counts = {}   # stage -> total number of samples
+        self._totals = {}   # stage -> total seconds
+        self._lock = threading.Lock()
+        self._input_mark = None
+
+    def record(self, stage: str, seconds: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+            self._totals[stage] = self._totals.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def mark_input(self):
+        """Call when a user action is dequeued; the next send records input_to_send."""
+        self._input_mark = time.perf_counter()
+
+    def sent(self):
+        mark, self._input_mark = self._input_mark, None
+        if mark is not None:
+            self.record("input_to_send", time.perf_counter() - mark)
+
+    def stages(self) -> list:
+        with self._lock:
+            return list(self._samples)
+
+    def summary(self, stage: str) -> dict | None:
+        """{"count", "total", "p50", "p95", "p99", "max", "histogram"} in milliseconds, or None if never recorded."""
+        with self._lock:
+            samples = sorted(self._samples.get(stage, ()))
+            count = self._counts.get(stage, 0)
+            total = self._totals.get(stage, 0.0)
+        if not samples:
+            return None
+        pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+        histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        for value in samples:
+            histogram[bisect.bisect_left(self.BUCKETS_MS, value * 1000)] += 1
+        return {"count": count, "total": total * 1000, "p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99),
+                "max": samples[-1] * 1000, "histogram": histogram}
+
+    def export(self, path: str):
+        """Writes all stage summaries to path (.csv or .json)."""
+        rows = {stage: self.summary(stage) for stage in self.stages()}
+        if path.endswith('.csv'):
+            with open(path, 'w') as f:
+                f.write("stage,count,p50_ms,p95_ms,p99_ms,max_ms," + ",".join(f"le_{b}ms" for b in self.BUCKETS_MS) + ",gt\n")
+                for stage, row in rows.items():
+                    f.write(f"{stage},{row['count']},{row['p50']:.3f},{row['p95']:.3f},{row['p99']:.3f},{row['max']:.3f},"
+                            + ",".join(map(str, row['histogram'])) + "\n")
+        else:
+            with open(path, 'w') as f:
+                json.dump({"buckets_ms": self.BUCKETS_MS, "stages": rows}, f, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._totals.clear()
+
+LATENCY = LatencyStats()
+
+def _timed(func):
+    """Records the wall time of a public GoRLib call as op:<name>."""
+    stage = f"op:{func.__name__}"
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            LATENCY.record(stage, time.perf_counter() - start)
+    return wrapper
+
+def _sleep(seconds: float):
+    """time.sleep for pacing, recorded as the 'sleep' stage."""
+    if seconds > 0:
+        time.sleep(seconds)
+        LATENCY.record("sleep", seconds)
+
+def _run_job(future, func, args, kwargs):
+    """Runs one submitted job, unless it was cancelled first, and stores its outcome in future."""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+# --- Input Capture ---
+class InputRing:
+    """
+    Fixed-size capture of incoming MIDI with timestamps. The rtmidi thread only copies each
+    message into preallocated slots (no locks, no allocation); readers take snapshots with
+    read(since) at their own pace. Channel messages live in the ring, complete SysEx messages
+    (rare, any length) in a short log of their own. Message numbers (seq) count from 0.
+    """
+    SLOT = 4  # length byte + up to 3 message bytes; length 0 marks a SysEx
+
+    def __init__(self, capacity: int = 4096, sysex_capacity: int = 32):
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))   # time.monotonic() per slot
+        self.data = bytearray(self.SLOT * capacity)
+        self.sysex = deque(maxlen=sysex_capacity)       # (seq, time, bytes)
+        self.written = 0                                # messages captured so far
+
+    def write(self, message, timestamp: float):
+        """Captures one message (rtmidi thread). Only the written counter is shared with readers."""
+        seq = self.written
+        slot = seq % self.capacity
+        at = slot * self.SLOT
+        size = len(message)
+        if size > 3:
+            self.sysex.append((seq, timestamp, bytes(message)))
+            size = 0
+        else:
+            self.data[at + 1:at + 1 + size] = message
+        self.data[at] = size
+        self.times[slot] = timestamp
+        self.written = seq + 1
+
+    def read(self, since: int = 0, limit: int | None = None) -> tuple:
+        """
+        Messages captured from seq `since` on, as (next_since, [(seq, time, bytes)]). Messages
+        overwritten before they were read are skipped; at most limit (newest) are returned.
+        """
+        end = self.written
+        start = max(since, end - self.capacity + 1, end - limit if limit else 0)
+        sysex = {seq: message for seq, _, message in list(self.sysex) if seq >= start}
+        data, times, capacity = self.data, self.times, self.capacity
+        out = []
+        for seq in range(start, end):
+            slot = seq % capacity
+            at = slot * self.SLOT
+            size = data[at]
+            message = bytes(data[at + 1:at + 1 + size]) if size else sysex.get(seq)
+            if message is not None:
+                out.append((seq, times[slot], message))
+        # The writer may have lapped a slot while it was copied: drop anything it reached
+        first_valid = self.written - capacity + 1
+        if out and out[0][0] < first_valid:
+            out = [m for m in out if m[0] >= first_valid]
+        return end, out
+
+    def rate(self, window: float = 1.0) -> float:
+        """Messages per second over the last window seconds."""
+        end = self.written
+        if not end:
+            return 0.0
+        cutoff = time.monotonic() - window
+        count = 0
+        for seq in range(end - 1, max(-1, end - self.capacity), -1):
+            if self.times[seq % self.capacity] < cutoff:
+                break
+            count += 1
+        return count / window
+
+
 # --- MidiManager Class ---
 class MidiManager:
     """Handles MIDI connection, sending, receiving, and SysEx communication."""
 
-    def __init__(self, port_name=None):
+    def __init__(self, port_name=None, async_send=False, queue_size=64, midiout=None):
         self.port_name = port_name
-        self.midiout = rtmidi.MidiOut()
+        self.midiout = midiout or rtmidi.MidiOut()  # any object with the rtmidi.MidiOut interface
         self.midiin = None
         self.midiin_port_index = -1
         self.midiout_port_index = -1
         self.is_connected = False
+        # SysEx write batching (see sysex_batch); kept per calling thread, so a direct call from
+        # the UI thread never joins or flushes a batch running on the transmit thread
+        self._sysex_local = threading.local()
+        # Optional background transmit thread (see submit)
+        self.async_send = async_send
+        self.queue_size = queue_size
+        self._send_lock = threading.RLock()
+        self._tx_queue = None
+        self._tx_thread = None
+        # key -> (timer, future) of the newest submit_latest() job not yet started
+        self._latest = {}
+        self._latest_lock = threading.Lock()
+        # DT1 replies to RQ1 requests, filled by midi_callback (see request_data)
+        self._rx_cond = threading.Condition()
+        self._rx_replies = {}
+        self._sysex_in = SysExAssembler()
+        self.on_receive = None  # optional callback(message) for every incoming message (rtmidi thread)
+        self.input = InputRing()  # everything the device sends, with timestamps (see get_input_ring)
+        self.pacer = SysExPacer()
+        self.model_id = None  # DT1/RQ1 model ID found by detect_model(); None = the default (_model_id)
+        self.recorder = None  # TrafficRecorder logging everything sent and received (see start_recording)
+        # Last known device state; writes that would not change it are skipped
+        self.shadow = DeviceShadow()
+
+    @property
+    def _sysex_batch_depth(self) -> int:
+        return getattr(self._sysex_local, 'depth', 0)
+
+    @_sysex_batch_depth.setter
+    def _sysex_batch_depth(self, depth: int):
+        self._sysex_local.depth = depth
+
+    @property
+    def _sysex_pending(self) -> dict:
+        local = self._sysex_local
+        if not hasattr(local, 'pending'):
+            local.pending = {}
+        return local.pending
+
+    @_sysex_pending.setter
+    def _sysex_pending(self, pending: dict):
+        self._sysex_local.pending = pending
+
+    @property
+    def _sysex_settle_time(self) -> float:
+        return getattr(self._sysex_local, 'settle', 0.0)
+
+    @_sysex_settle_time.setter
+    def _sysex_settle_time(self, seconds: float):
+        self._sysex_local.settle = seconds
 
     def get_ports(self):
         """Helper to get available output ports."""
@@ -83,21 +342,47 @@ class MidiManager:
             self.is_connected = True
 
             input_ports = rtmidi.MidiIn().get_ports()
-            if self.port_name in input_ports:
+            if self.port_name not in input_ports:
+                # Virtual ports (e.g. GoREmu) have separate in/out clients: match by name only
+                input_ports = [p for p in input_ports if _port_key(p) == _port_key(self.port_name)]
+                input_name = input_ports[0] if input_ports else None
+            else:
+                input_name = self.port_name
+            if input_name:
                 try:
-                    self.midiin, port_name = open_midiinput(self.port_name, client_name="GoRLib MIDI RX", api=rtmidi.API_UNSPECIFIED)
+                    self.midiin, port_name = open_midiinput(input_name, client_name="GoRLib MIDI RX", api=rtmidi.API_UNSPECIFIED)
+                    self.midiin.ignore_types(sysex=False)  # RQ1 replies arrive as SysEx
                     self.midiin.set_callback(self.midi_callback)
                 except Exception as e:
                     raise GoRLibMIDIError(f"Could not open MIDI Input port: {e}")
 
+            if self.async_send:
+                self.start_sender()
             return True
 
         except Exception as e:
             self.is_connected = False
             raise GoRLibMIDIError(f"Failed to open MIDI port {self.port_name}: {e}")
 
+    def open_virtual_port(self, name="GO:R"):
+        """Opens a virtual output port other programs can connect to (not available on Windows)."""
+        if self.is_connected:
+            self.close_port()
+        try:
+            self.midiout.open_virtual_port(name)
+        except Exception as e:
+            raise GoRLibMIDIError(f"Failed to open virtual MIDI port {name}: {e}")
+        self.port_name = name
+        self.is_connected = True
+        if self.async_send:
+            self.start_sender()
+        return True
+
     def close_port(self):
         """Closes the MIDI ports."""
+        self.stop_sender()
+        if self.recorder:
+            self.recorder.flush()
         if self.midiout.is_port_open():
             self.midiout.close_port()
         if self.midiin:
@@ -107,14 +392,205 @@ class MidiManager:
 
     def send_message(self, message):
         """Sends a raw MIDI message."""
-        if self.midiout.is_port_open():
-            self.midiout.send_message(message)
+        with self._send_lock:
+            if self.midiout.is_port_open():
+                start = time.perf_counter()
+                self.midiout.send_message(message)
+                LATENCY.record("send", time.perf_counter() - start)
+                LATENCY.sent()
+                if self.recorder:
+                    self.recorder.write(message)
+            else:
+                raise IOError("MIDI output port is not open.")
+
+    def send_stream(self, data: bytes) -> int:
+        """
+        Sends a run of channel messages (running status allowed) in one pass and returns the
+        number of driver calls. Outputs with send_stream (RawMidiOut) take the bytes in a single
+        write; rtmidi only accepts one message per call, so the stream is split for it.
+        """
+        with self._send_lock:
+            if not self.midiout.is_port_open():
+                raise IOError("MIDI output port is not open.")
+            start = time.perf_counter()
+            write = getattr(self.midiout, 'send_stream', None)
+            if write:
+                write(data)
+                calls = 1
+            else:
+                messages = _split_running_status(data)
+                send = self.midiout.send_message
+                for message in messages:
+                    send(message)
+                calls = len(messages)
+            LATENCY.record("send", time.perf_counter() - start)
+            LATENCY.sent()
+            if self.recorder:
+                self.recorder.write(data)
+            return calls
+
+    def send_cc(self, channel: int, controller: int, value: int, force: bool = False) -> bool:
+        """Sends a Control Change unless the device already has that value. True if sent."""
+        if not force and self.shadow.cc(channel, controller) == value:
+            return False
+        self.send_message([CONTROL_CHANGE_STATUS | channel, controller, value])
+        self.shadow.set_cc(channel, controller, value)
+        return True
+
+    def send_program(self, channel: int, bank_msb: int, bank_lsb: int, pc: int, force: bool = False) -> bool:
+        """Sends bank select + Program Change, skipping whatever the device already has. True if sent."""
+        shadow = self.shadow
+        if not force and shadow.program(channel) == pc and shadow.cc(channel, CC_BANK_MSB) == bank_msb \
+                and shadow.cc(channel, CC_BANK_LSB) == bank_lsb:
+            return False
+        # Bank select only takes effect on the next PC, so the PC is always sent
+        self.send_cc(channel, CC_BANK_MSB, bank_msb, force)
+        self.send_cc(channel, CC_BANK_LSB, bank_lsb, force)
+        self.send_message([PROGRAM_CHANGE_STATUS | channel, pc])
+        shadow.set_program(channel, pc)
+        return True
+
+    # --- Background transmit ---
+    def start_sender(self):
+        """Starts the transmit thread; submit() then queues jobs instead of running them."""
+        if self._tx_thread and self._tx_thread.is_alive():
+            return
+        self._tx_queue = queue.Queue(maxsize=self.queue_size)
+        self._tx_thread = threading.Thread(target=self._sender_loop, name="GoRLib MIDI TX", daemon=True)
+        self._tx_thread.start()
+
+    def stop_sender(self, timeout=5.0):
+        """Cancels queued jobs, lets the running one finish and stops the transmit thread."""
+        self.cancel_latest()
+        thread, self._tx_thread = self._tx_thread, None
+        if not thread:
+            return
+        while True:
+            try:
+                job = self._tx_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job:
+                job[0].cancel()
+        self._tx_queue.put(None)
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _sender_loop(self):
+        _local.manager = self  # GoRLib calls run by this thread act on this connection
+        tx_queue = self._tx_queue
+        while True:
+            job = tx_queue.get()
+            if job is None:
+                break
+            _run_job(*job)
+
+    def submit(self, func, *args, callback=None, **kwargs) -> Future:
+        """
+        Runs func(*args, **kwargs) on the transmit thread and returns a Future.
+        callback(future) is called on completion (from the transmit thread).
+        Without a running sender (or when called from a job) func runs immediately.
+        Blocks only while the bounded queue is full.
+        """
+        future = Future()
+        if callback:
+            future.add_done_callback(callback)
+        self._enqueue(future, func, args, kwargs)
+        return future
+
+    def _enqueue(self, future, func, args, kwargs):
+        thread = self._tx_thread
+        if thread is None or thread is threading.current_thread():
+            _run_job(future, func, args, kwargs)
         else:
-            raise IOError("MIDI output port is not open.")
+            self._tx_queue.put((future, func, args, kwargs))
+
+    def submit_latest(self, key, func, *args, delay=0.0, callback=None, **kwargs) -> Future:
+        """
+        Like submit(), but only the newest job per key is sent: a job still waiting out its
+        delay (or still queued) is cancelled when a newer one with the same key arrives.
+        With delay > 0 the job is held back until no newer one has come for that long,
+        so e.g. scrolling through patches only sends the patch the selection settles on.
+        Superseded jobs' futures end up cancelled (their callbacks still run).
+        """
+        future = Future()
+        future.add_done_callback(lambda f: self._forget_latest(key, f))
+        if callback:
+            future.add_done_callback(callback)
+        timer = None
+        if delay > 0:
+            timer = threading.Timer(delay, self._release_latest, (key, future, func, args, kwargs))
+            timer.daemon = True
+        with self._latest_lock:
+            old = self._latest.get(key)
+            self._latest[key] = (timer, future)
+        if old:
+            if old[0]:
+                old[0].cancel()
+            old[1].cancel()  # no-op once it is running
+        if timer:
+            timer.start()
+        else:
+            self._enqueue(future, func, args, kwargs)
+        return future
+
+    def _release_latest(self, key, future, func, args, kwargs):
+        # Debounce expired: hand the job to the sender. It stays registered under key so
+        # a newer job can still cancel it while it waits in the queue.
+        if not future.done():
+            self._enqueue(future, func, args, kwargs)
+
+    def _forget_latest(self, key, future):
+        with self._latest_lock:
+            entry = self._latest.get(key)
+            if entry and entry[1] is future:
+                del self._latest[key]
+
+    def cancel_latest(self):
+        """Drops every submit_latest() job that has not started yet."""
+        with self._latest_lock:
+            pending, self._latest = self._latest, {}
+        for timer, future in pending.values():
+            if timer:
+                timer.cancel()
+            future.cancel()
+
+    def wait_idle(self, timeout=None) -> bool:
+        """Blocks until every job queued so far has been sent. False on timeout."""
+        try:
+            self.submit(lambda: None).result(timeout)
+            return True
+        except FutureTimeoutError:
+            return False
 
     def midi_callback(self, message, data=None):
-        """Callback function for incoming MIDI messages."""
-        pass
+        """Callback function for incoming MIDI messages (runs on the rtmidi thread)."""
+        msg, _delta = message
+        if not msg:
+            return
+        now = time.monotonic()
+        if self.recorder:
+            self.recorder.write(msg, incoming=True)
+        if self.on_receive:
+            self.on_receive(msg)
+        status = msg[0] & 0xF0
+        if msg[0] == 0xF0 or (self._sysex_in.active and msg[0] < 0x80):
+            for sysex in self._sysex_in.feed(msg):
+                self.input.write(sysex, now)
+                reply = _parse_dt1(sysex)
+                if reply:
+                    with self._rx_cond:
+                        if len(self._rx_replies) > 256:  # nobody is collecting these
+                            self._rx_replies.clear()
+                        self._rx_replies[reply[0]] = reply[1]
+                        self._rx_cond.notify_all()
+            return
+        self.input.write(msg, now)
+        # Panel changes echoed by the keyboard keep the channel shadow honest
+        if status == CONTROL_CHANGE_STATUS and len(msg) >= 3:
+            self.shadow.set_cc(msg[0] & 0x0F, msg[1], msg[2])
+        elif status == PROGRAM_CHANGE_STATUS and len(msg) >= 2:
+            self.shadow.set_program(msg[0] & 0x0F, msg[1])
 
     def send_identity_request(self):
         """Sends the Universal System Exclusive Identity Request."""
@@ -124,9 +600,46 @@ class MidiManager:
             raise GoRLibMIDIError("Cannot send SysEx, MIDI not connected.")
 
 
+# --- Raw ALSA Output ---
+class RawMidiOut:
+    """
+    rtmidi.MidiOut stand-in that writes straight to an ALSA rawmidi device (Linux only).
+    Ports are the device paths, e.g. MidiManager('/dev/snd/midiC1D0', midiout=RawMidiOut()).
+    Unlike rtmidi it takes whole byte streams, so batches keep running status and need one write.
+    """
+    DEVICE_PATTERN = '/dev/snd/midiC*D*'
+
+    def __init__(self):
+        self._fd = None
+
+    def get_ports(self):
+        return sorted(glob.glob(self.DEVICE_PATTERN))
+
+    def open_port(self, index=0, name=None):
+        self._fd = os.open(self.get_ports()[index], os.O_WRONLY)
+
+    def is_port_open(self):
+        return self._fd is not None
+
+    def close_port(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def send_message(self, message):
+        self.send_stream(bytes(message))
+
+    def send_stream(self, data):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+
 # --- Wrapper Functions ---
 def get_output_ports():
-    """Returns a list of available MIDI output port names."""
+    """Returns a list of available MIDI output port names (the watcher's cached list when it runs)."""
+    if _port_watcher and _port_watcher.ports is not None:
+        return list(_port_watcher.ports)
     try:
         midi_out = rtmidi.MidiOut()
         return midi_out.get_ports()
@@ -137,9 +650,10 @@ def enable_multi_zone_mode() -> None:
     """Legacy — not needed on GO:PIANO, kept for compatibility."""
     pass
 
-def init_midi_connection(port_name):
+def init_midi_connection(port_name, async_send=False):
     """
     Initializes and opens the MIDI connection using the MidiManager class.
+    With async_send=True all submit() jobs run on a background transmit thread.
     """
     global _midi_manager_instance
 
@@ -151,7 +665,7 @@ def init_midi_connection(port_name):
         _midi_manager_instance = None
 
     try:
-        manager = MidiManager(port_name)
+        manager = MidiManager(port_name, async_send=async_send)
         if manager.open_port():
             _midi_manager_instance = manager
             return True
@@ -163,23 +677,63 @@ def init_midi_connection(port_name):
         _midi_manager_instance = None
         raise GoRLibMIDIError(f"MidiManager connection failed: {e}")
 
+def set_midi_manager(manager):
+    """Makes an already opened MidiManager (e.g. on a virtual or mock port) the active connection."""
+    global _midi_manager_instance
+    if _midi_manager_instance and _midi_manager_instance is not manager:
+        try:
+            _midi_manager_instance.close_port()
+        except Exception:
+            pass
+    _midi_manager_instance = manager
+
+def set_receive_callback(callback) -> None:
+    """Calls callback(message) for every message the keyboard sends (on the rtmidi thread)."""
+    manager = _get_manager()
+    if not manager:
+        raise GoRLibMIDIError("MIDI not connected")
+    manager.on_receive = callback
+
+def get_input_ring() -> InputRing | None:
+    """Everything the keyboard has sent on the active connection (see InputRing), or None."""
+    manager = _get_manager()
+    return manager.input if manager else None
+
+def submit(func, *args, callback=None, **kwargs) -> Future:
+    """Queues any GoRLib call (e.g. setup_split_SysEx) on the active connection; returns a Future."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    return manager.submit(func, *args, callback=callback, **kwargs)
+
+def submit_latest(key, func, *args, delay=0.0, callback=None, **kwargs) -> Future:
+    """Queues a call that supersedes any not yet started call with the same key (see MidiManager.submit_latest)."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    return manager.submit_latest(key, func, *args, delay=delay, callback=callback, **kwargs)
+
 
 # ===================================================================
 # ZONE API — Standard CC-based (for reference / other keyboards)
 # ===================================================================
 
+@_timed
 def zone_enable(zone: int, on: bool = True) -> None:
-    if not _midi_manager_instance or not _midi_manager_instance.is_connected:
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
         raise GoRLibMIDIError("MIDI not connected")
     if not 1 <= zone <= 16:
         raise ValueError(f"Zone must be 1–16, got {zone}")
 
     channel = zone - 1
     value = 127 if on else 0
-    _midi_manager_instance.send_message([0xB0 | channel, 85, value])
+    manager.send_cc(channel, 85, value)
 
+@_timed
 def zone_patch(zone: int, bank_msb: int, bank_lsb: int = 0, pc: int = 0) -> None:
-    if not _midi_manager_instance or not _midi_manager_instance.is_connected:
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
         raise GoRLibMIDIError("MIDI not connected")
     if not 1 <= zone <= 16:
         raise ValueError(f"Zone must be 1–16, got {zone}")
@@ -189,12 +743,12 @@ def zone_patch(zone: int, bank_msb: int, bank_lsb: int = 0, pc: int = 0) -> None
     bank_lsb &= 0x7F
     pc &= 0x7F
 
-    _midi_manager_instance.send_message([0xB0 | channel, 0, bank_msb])
-    _midi_manager_instance.send_message([0xB0 | channel, 32, bank_lsb])
-    _midi_manager_instance.send_message([0xC0 | channel, pc])
+    manager.send_program(channel, bank_msb, bank_lsb, pc)
 
+@_timed
 def zone_octave(zone: int, shift: int) -> None:
-    if not _midi_manager_instance or not _midi_manager_instance.is_connected:
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
         raise GoRLibMIDIError("MIDI not connected")
     if not 1 <= zone <= 16:
         raise ValueError(f"Zone must be 1–16, got {zone}")
@@ -202,10 +756,12 @@ def zone_octave(zone: int, shift: int) -> None:
         raise ValueError(f"Octave shift must be -4 to +4, got {shift}")
 
     channel = zone - 1
-    _midi_manager_instance.send_message([0xB0 | channel, 86, shift + 64])
+    manager.send_cc(channel, 86, shift + 64)
 
+@_timed
 def zone_key_range(zone: int, low: int | None = None, high: int | None = None) -> None:
-    if not _midi_manager_instance or not _midi_manager_instance.is_connected:
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
         raise GoRLibMIDIError("MIDI not connected")
     if not 1 <= zone <= 16:
         raise ValueError(f"Zone must be 1–16, got {zone}")
@@ -213,10 +769,98 @@ def zone_key_range(zone: int, low: int | None = None, high: int | None = None) -
     channel = zone - 1
     if low is not None:
         low = max(0, min(127, low))
-        _midi_manager_instance.send_message([0xB0 | channel, 87, low])
+        manager.send_cc(channel, 87, low)
     if high is not None:
         high = max(0, min(127, high))
-        _midi_manager_instance.send_message([0xB0 | channel, 88, high])
+        manager.send_cc(channel, 88, high)
+
+# --- Zone Layouts ---
+def _data_length(status: int) -> int:
+    return 1 if status & 0xF0 in (0xC0, 0xD0) else 2
+
+def _split_running_status(data: bytes) -> list:
+    """Expands a channel-message stream (running status allowed) into one list per message."""
+    messages = []
+    status = 0
+    i = 0
+    while i < len(data):
+        if data[i] & 0x80:
+            status = data[i]
+            i += 1
+        n = _data_length(status)
+        messages.append([status, *data[i:i + n]])
+        i += n
+    return messages
+
+def encode_zone_layout(layout: dict, shadow=None) -> bytes:
+    """
+    Encodes a full zone layout as one MIDI byte stream, zones in channel order: each channel's
+    CCs share a single running status, followed by its Program Change.
+    layout maps zone (1-16) to a dict with any of: patch (msb, lsb, pc), enabled, octave (-4..4),
+    low, high. With a DeviceShadow, values the device already has are left out.
+    """
+    out = bytearray()
+    for zone in sorted(layout):
+        if not 1 <= zone <= 16:
+            raise ValueError(f"Zone must be 1–16, got {zone}")
+        settings = layout[zone]
+        channel = zone - 1
+        ccs = []
+        if settings.get('enabled') is not None:
+            ccs.append((CC_ZONE_ENABLE, 127 if settings['enabled'] else 0))
+        if settings.get('octave') is not None:
+            if not -4 <= settings['octave'] <= 4:
+                raise ValueError(f"Octave shift must be -4 to +4, got {settings['octave']}")
+            ccs.append((CC_ZONE_OCTAVE, settings['octave'] + 64))
+        if settings.get('low') is not None:
+            ccs.append((CC_ZONE_LOW, max(0, min(127, settings['low']))))
+        if settings.get('high') is not None:
+            ccs.append((CC_ZONE_HIGH, max(0, min(127, settings['high']))))
+        pc = None
+        if settings.get('patch'):
+            msb, lsb, pc = (v & 0x7F for v in settings['patch'])
+            if shadow and shadow.program(channel) == pc and shadow.cc(channel, CC_BANK_MSB) == msb \
+                    and shadow.cc(channel, CC_BANK_LSB) == lsb:
+                pc = None
+            else:
+                # Bank select only takes effect on the next PC, so the PC is always sent
+                ccs += [(CC_BANK_MSB, msb), (CC_BANK_LSB, lsb)]
+        if shadow:
+            ccs = [(cc, value) for cc, value in ccs if shadow.cc(channel, cc) != value]
+        if ccs:
+            out.append(CONTROL_CHANGE_STATUS | channel)
+            for cc, value in ccs:
+                out += bytes((cc, value))
+        if pc is not None:
+            out += bytes((PROGRAM_CHANGE_STATUS | channel, pc))
+    return bytes(out)
+
+@_timed
+def apply_zone_layout(layout: dict, force: bool = False) -> int:
+    """
+    Applies patch/enable/octave/range for any number of zones in a single pass (see
+    encode_zone_layout). Settings the device already has are skipped unless force.
+    Returns the number of bytes sent.
+    """
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    data = encode_zone_layout(layout, None if force else manager.shadow)
+    if data:
+        manager.send_zone_stream(data)
+    return len(data)
+
+def _send_zone_stream(self, data: bytes):
+    """Sends an encode_zone_layout() stream as it is and records it in the shadow."""
+    self.send_stream(data)
+    shadow = self.shadow
+    for message in _split_running_status(data):
+        if message[0] & 0xF0 == PROGRAM_CHANGE_STATUS:
+            shadow.set_program(message[0] & 0x0F, message[1])
+        else:
+            shadow.set_cc(message[0] & 0x0F, message[1], message[2])
+
+MidiManager.send_zone_stream = _send_zone_stream
 
 
 # ===================================================================
@@ -243,118 +887,1860 @@ OFF_ZONE_OCTAVE = 0x0001
 OFF_ZONE_LOW = 0x0004
 OFF_ZONE_HIGH = 0x0005
 
-# Block Sizes
-PART_BLOCK_SIZE = 0x0200  # 512 bytes
+# Block Sizes (bytes). Roland addresses carry 7 bits per byte, so blocks are 00 00 02 00
+# (parts) and 00 00 01 00 (zones) apart: zone 2 starts at 10 00 51 00, not 10 00 50 80.
+PART_BLOCK_SIZE = 0x0100  # 256 bytes
 ZONE_BLOCK_SIZE = 0x0080  # 128 bytes
 
-# --- Fixed SysEx Sender ---
-def _send_sysex_fixed(self, address: int, data: bytes):
-    if not self.is_connected:
-        raise GoRLibMIDIError("MIDI not connected")
+def _linear(address: int) -> int:
+    """A Roland address or size (7 bits per byte) as a plain number."""
+    return (address >> 3 & 0xFE00000) | (address >> 2 & 0x1FC000) | (address >> 1 & 0x3F80) | (address & 0x7F)
 
+def _roland(value: int) -> int:
+    """A plain number as a Roland address or size (7 bits per byte); the inverse of _linear."""
+    return (value << 3 & 0x7F000000) | (value << 2 & 0x7F0000) | (value << 1 & 0x7F00) | (value & 0x7F)
+
+def _address_add(address: int, offset: int) -> int:
+    """The address offset bytes after address, carrying into the next byte at 0x80."""
+    return _roland(_linear(address) + offset)
+
+def _part_address(part: int, offset: int = 0) -> int:
+    """Address of offset in the block of part 1-16."""
+    return _address_add(PART_BASE, (part - 1) * PART_BLOCK_SIZE + offset)
+
+def _zone_address(zone: int, offset: int = 0) -> int:
+    """Address of offset in the block of zone 1-16."""
+    return _address_add(ZONE_BASE, (zone - 1) * ZONE_BLOCK_SIZE + offset)
+
+_PART_START = _linear(PART_BASE)
+_ZONE_START = _linear(ZONE_BASE)
+
+# --- Device Shadow ---
+class DeviceShadow:
+    """
+    Last known device state, used to skip writes that would change nothing.
+    values/known mirror the 16 part blocks followed by the 16 zone blocks of the
+    temporary performance; channels holds 128 CCs + program per MIDI channel (0xFF = unknown).
+    """
+    SIZE = 16 * PART_BLOCK_SIZE + 16 * ZONE_BLOCK_SIZE
+    UNKNOWN = 0xFF
+
+    def __init__(self):
+        self.values = bytearray(self.SIZE)
+        self.known = bytearray(self.SIZE)
+        self.channels = bytearray([self.UNKNOWN]) * (16 * 129)
+
+    @staticmethod
+    def index(address: int) -> int | None:
+        """Offset of address in values/known, or None outside the shadowed space."""
+        i = _linear(address) - _PART_START
+        if 0 <= i < 16 * PART_BLOCK_SIZE:
+            return i
+        i = _linear(address) - _ZONE_START
+        if 0 <= i < 16 * ZONE_BLOCK_SIZE:
+            return 16 * PART_BLOCK_SIZE + i
+        return None
+
+    def get(self, address: int) -> int | None:
+        i = self.index(address)
+        return self.values[i] if i is not None and self.known[i] else None
+
+    def set(self, address: int, data: bytes):
+        start = self.index(address)
+        if start is not None and self.index(_address_add(address, len(data) - 1)) == start + len(data) - 1:
+            self.values[start:start + len(data)] = data
+            self.known[start:start + len(data)] = b'\x01' * len(data)
+            return
+        for offset, value in enumerate(data):
+            i = self.index(_address_add(address, offset))
+            if i is not None:
+                self.values[i] = value
+                self.known[i] = 1
+
+    def invalidate(self, address: int | None = None, size: int = 1):
+        """Forgets one range, or everything (including channel state) when address is None."""
+        if address is None:
+            self.known[:] = bytes(self.SIZE)
+            self.channels[:] = bytes([self.UNKNOWN]) * len(self.channels)
+            return
+        for offset in range(size):
+            i = self.index(_address_add(address, offset))
+            if i is not None:
+                self.known[i] = 0
+
+    def cc(self, channel: int, controller: int) -> int | None:
+        value = self.channels[channel * 129 + controller]
+        return None if value == self.UNKNOWN else value
+
+    def set_cc(self, channel: int, controller: int, value: int):
+        self.channels[channel * 129 + controller] = value & 0x7F
+
+    def program(self, channel: int) -> int | None:
+        value = self.channels[channel * 129 + 128]
+        return None if value == self.UNKNOWN else value
+
+    def set_program(self, channel: int, pc: int):
+        self.channels[channel * 129 + 128] = pc & 0x7F
+
+# --- SysEx Frame Builder ---
+# Default model ID for DT1/RQ1 messages; detect_model() sets a connection's own (e.g. a GO:KEYS)
+_model_id = bytes.fromhex(MODEL_IDS["GP"])
+
+def _active_model_id() -> bytes:
+    manager = _get_manager()
+    return (manager and manager.model_id) or _model_id
+
+# DT1 header (F0 .. address) and address byte sum for every parameter of the 16 part and zone
+# slots, built once per model; a frame is then header + data + checksum, nothing to encode.
+_frame_prefixes = {}  # model ID -> {address: (header, address sum)}
+
+def _dt1_prefix(address: int, model_id: bytes) -> tuple:
     addr_bytes = address.to_bytes(4, 'big')
-    payload = addr_bytes + data
+    return bytes((0xF0, 0x41, 0x10)) + model_id + bytes((DT1,)) + addr_bytes, sum(addr_bytes)
+
+def _prefixes_for(model_id: bytes) -> dict:
+    prefixes = _frame_prefixes.get(model_id)
+    if prefixes is None:
+        prefixes = {}
+        for n in range(16):
+            for offset in (OFF_PART_RX_CHAN, OFF_PART_RX_SW, OFF_PART_BANK_MSB, OFF_PART_BANK_LSB, OFF_PART_PC):
+                address = _part_address(n + 1, offset)
+                prefixes[address] = _dt1_prefix(address, model_id)
+            for offset in (OFF_ZONE_SW, OFF_ZONE_OCTAVE, OFF_ZONE_LOW, OFF_ZONE_HIGH):
+                address = _zone_address(n + 1, offset)
+                prefixes[address] = _dt1_prefix(address, model_id)
+        _frame_prefixes[model_id] = prefixes
+    return prefixes
+
+_prefixes_for(_model_id)
+
+def _sysex_frame(address: int, data: bytes, model_id: bytes | None = None) -> bytes:
+    """Builds one DT1 message (address + data + checksum) for model_id (default: the connected model)."""
+    model_id = model_id or _active_model_id()
+    prefix, address_sum = _prefixes_for(model_id).get(address) or _dt1_prefix(address, model_id)
+    checksum = (128 - (address_sum + sum(data)) % 128) & 0x7F
+    return prefix + bytes(data) + bytes((checksum, 0xF7))
+
+def _rq1_frame(address: int, size: int, model_id: bytes | None = None) -> list:
+    """Builds one RQ1 (data request) message for size bytes at address."""
+    payload = address.to_bytes(4, 'big') + _roland(size).to_bytes(4, 'big')
     checksum = (128 - sum(payload) % 128) & 0x7F
 
-    model_id = bytes.fromhex('0000003D')  # GO:PIANO
-    sysex = [0xF0, 0x41, 0x10] + list(model_id) + [0x12] + list(payload) + [checksum, 0xF7]
+    model_id = model_id or _active_model_id()
+    return [0xF0, 0x41, 0x10] + list(model_id) + [RQ1] + list(payload) + [checksum, 0xF7]
+
+def _parse_dt1(msg) -> tuple | None:
+    """Returns (address, data) for a checksum-valid Roland DT1 message, else None."""
+    if len(msg) < 14 or msg[1] != 0x41 or msg[7] != DT1 or msg[-1] != 0xF7:
+        return None
+    payload = bytes(msg[8:-2])
+    if (sum(payload) + msg[-2]) % 128:
+        return None
+    return int.from_bytes(payload[:4], 'big'), payload[4:]
+
+class SysExAssembler:
+    """Rebuilds complete SysEx messages from input packets that may split or batch them."""
+    MAX_SIZE = 0x10000
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.active = False  # inside a message whose F7 has not arrived yet
+
+    def feed(self, packet) -> list:
+        """Returns the SysEx messages completed by this packet."""
+        if not self.active and packet[0] == 0xF0 and packet[-1] == 0xF7 and 0xF7 not in packet[1:-1]:
+            return [bytes(packet)]  # the common case: one whole message
+        done = []
+        for byte in packet:
+            if byte == 0xF0:
+                self.buffer = bytearray([byte])
+                self.active = True
+            elif not self.active or byte >= 0xF8:  # real-time bytes may be interleaved
+                continue
+            elif byte == 0xF7:
+                self.buffer.append(byte)
+                done.append(bytes(self.buffer))
+                self.active = False
+            elif byte & 0x80 or len(self.buffer) >= self.MAX_SIZE:  # a status byte aborts the message
+                self.active = False
+            else:
+                self.buffer.append(byte)
+        return done
+
+def _sysex_block_start(address: int) -> int:
+    """Returns the start of the part/zone block holding address (or address itself outside them)."""
+    i = DeviceShadow.index(address)
+    if i is None:
+        return address
+    if i < 16 * PART_BLOCK_SIZE:
+        return _part_address(i // PART_BLOCK_SIZE + 1)
+    return _zone_address((i - 16 * PART_BLOCK_SIZE) // ZONE_BLOCK_SIZE + 1)
+
+SYSEX_MAX_GAP_FILL = 8  # bytes of known, unchanged data worth resending to save a message
+
+def _coalesce_writes(writes: dict, shadow: DeviceShadow | None = None) -> list:
+    """
+    Merges {address: value} writes into (address, data) runs.
+    A run only grows across adjacent addresses inside the same part or zone block.
+    Small gaps whose current value the shadow knows are filled in to join runs.
+    """
+    runs = []
+    start = prev = block = None
+    data = bytearray()
+    for address in sorted(writes):
+        pos = _linear(address)
+        gap = []
+        if shadow and prev is not None and 1 < pos - prev <= SYSEX_MAX_GAP_FILL + 1:
+            gap = [shadow.get(_roland(p)) for p in range(prev + 1, pos)]
+            if None in gap:
+                gap = []
+        if prev is not None and pos == prev + 1 + len(gap) and _sysex_block_start(address) == block:
+            data.extend(gap)
+            data.append(writes[address])
+        else:
+            if data:
+                runs.append((start, bytes(data)))
+            start, block = address, _sysex_block_start(address)
+            data = bytearray([writes[address]])
+        prev = pos
+    if data:
+        runs.append((start, bytes(data)))
+    return runs
+
+# --- Pacing ---
+class SysExPacer:
+    """
+    Decides how DT1 writes are paced.
+    'fixed':    wait fixed_delay after every message (the original 50 ms).
+    'verified': read every write back with RQ1, retry on mismatch and adapt the
+                delay to the lowest value the device keeps up with.
+    """
 
-    self.send_message(sysex)
-    time.sleep(0.05)  # Safe delay
+    def __init__(self, mode="fixed", fixed_delay=0.05, min_delay=0.002, max_delay=0.25, timeout=0.3, retries=3):
+        if mode not in ("fixed", "verified"):
+            raise ValueError(f"Unknown pacing mode '{mode}'")
+        self.mode = mode
+        self.fixed_delay = fixed_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.retries = retries
+        self.delay = fixed_delay  # current adaptive delay, starts at the safe value
+        self.turnaround = None    # smoothed RQ1 round trip in seconds
+        self.confirmed = 0
+        self.retried = 0
+
+    def success(self, round_trip: float):
+        self.confirmed += 1
+        self.turnaround = round_trip if self.turnaround is None else 0.8 * self.turnaround + 0.2 * round_trip
+        self.delay = max(self.min_delay, self.delay * 0.7)
+
+    def failure(self):
+        self.retried += 1
+        self.delay = min(self.max_delay, self.delay * 2 + (self.turnaround or 0))
+
+def _collect_reply(self, address: int, size: int) -> bytes | None:
+    """Joins buffered DT1 replies covering address..address+size. Caller holds _rx_cond."""
+    data = bytearray()
+    keys = []
+    while len(data) < size:
+        key = _address_add(address, len(data))
+        part = self._rx_replies.get(key)
+        if not part:
+            return None
+        keys.append(key)
+        data += part
+    for key in keys:
+        del self._rx_replies[key]
+    return bytes(data[:size])
+
+def _read_blocks(self, ranges: list, timeout: float = 0.5, window: int = 4) -> list:
+    """
+    Reads (address, size) ranges with pipelined RQ1s, at most `window` outstanding,
+    and returns their data in order (None where the device did not answer in time).
+    Replies split over several DT1 packets are joined.
+    """
+    if not self.midiin:
+        raise GoRLibMIDIError("No MIDI input port, cannot read from device")
+    with self._rx_cond:
+        for address, size in ranges:
+            end = _address_add(address, size)
+            for key in [k for k in self._rx_replies if address <= k < end]:
+                del self._rx_replies[key]
+
+    results = [None] * len(ranges)
+    pending = {}  # range index -> deadline
+    next_index = 0
+    while next_index < len(ranges) or pending:
+        while next_index < len(ranges) and len(pending) < window:
+            self.send_message(_rq1_frame(*ranges[next_index], self.model_id))
+            pending[next_index] = time.monotonic() + timeout
+            next_index += 1
+        with self._rx_cond:
+            progress = False
+            for i in list(pending):
+                data = self._collect_reply(*ranges[i])
+                if data is not None or time.monotonic() >= pending[i]:
+                    results[i] = data
+                    del pending[i]
+                    progress = True
+            if pending and not progress:
+                self._rx_cond.wait(max(0.0, min(pending.values()) - time.monotonic()))
+    return results
+
+def _request_data(self, address: int, size: int, timeout: float = 0.5) -> bytes | None:
+    """Sends an RQ1 and waits for the DT1 reply. Returns the data, or None on timeout."""
+    return self.read_blocks([(address, size)], timeout)[0]
+
+def _write_paced(self, address: int, data: bytes, frame=None):
+    """Sends one DT1 (prebuilt `frame` if given) and paces it according to self.pacer."""
+    pacer = self.pacer
+    if frame is None:
+        with LATENCY.measure("build"):
+            frame = _sysex_frame(address, data, self.model_id)
+    if pacer.mode != "verified" or not self.midiin:
+        self.send_message(frame)
+        _sleep(pacer.fixed_delay)  # Safe delay
+        return
+
+    for attempt in range(pacer.retries + 1):
+        self.send_message(frame)
+        _sleep(pacer.delay)
+        start = time.monotonic()
+        reply = self.request_data(address, len(data), pacer.timeout)
+        if reply is not None and reply[:len(data)] == data:
+            pacer.success(time.monotonic() - start)
+            return
+        pacer.failure()
+    raise GoRLibMIDIError(f"SysEx write to {address:08X} not confirmed after {pacer.retries + 1} attempts")
+
+MidiManager._collect_reply = _collect_reply
+MidiManager.read_blocks = _read_blocks
+MidiManager.request_data = _request_data
+MidiManager._write_paced = _write_paced
+
+# --- Fixed SysEx Sender ---
+def _send_sysex_fixed(self, address: int, data: bytes, force: bool = False):
+    if not self.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    if force:
+        self.shadow.invalidate(address, len(data))
+
+    # Bytes are collected and sent by flush_sysex() at the end of the (outermost) batch
+    with self.sysex_batch():
+        for i, value in enumerate(data):
+            self._sysex_pending[_address_add(address, i)] = value
+
+def _sysex_settle(self, seconds: float):
+    """Waits for the device (e.g. tone load). Inside a batch the wait happens after the flush."""
+    if self._sysex_batch_depth:
+        self._sysex_settle_time = max(self._sysex_settle_time, seconds)
+    else:
+        _sleep(seconds)
+
+def _flush_sysex(self):
+    """Sends the collected writes that change the device as the fewest DT1 messages."""
+    writes, self._sysex_pending = self._sysex_pending, {}
+    settle, self._sysex_settle_time = self._sysex_settle_time, 0.0
+    shadow = self.shadow
+    writes = {a: v for a, v in writes.items() if shadow.get(a) != v}
+    for address, data in _coalesce_writes(writes, shadow):
+        try:
+            self._write_paced(address, data)
+        except Exception:
+            shadow.invalidate(address, len(data))
+            raise
+        shadow.set(address, data)
+    if settle and writes:
+        _sleep(settle)
+
+@contextmanager
+def _sysex_batch(self):
+    """
+    Collects SysEx writes and sends them coalesced on exit.
+    Batches nest; only the outermost one flushes. Each thread has its own batch.
+    """
+    self._sysex_batch_depth += 1
+    try:
+        yield self
+    except BaseException:
+        # Never send half of a failed batch
+        self._sysex_batch_depth -= 1
+        if not self._sysex_batch_depth:
+            self._sysex_pending.clear()
+            self._sysex_settle_time = 0.0
+        raise
+    self._sysex_batch_depth -= 1
+    if not self._sysex_batch_depth:
+        self.flush_sysex()
 
 MidiManager._send_sysex_fixed = _send_sysex_fixed
+MidiManager.sysex_settle = _sysex_settle
+MidiManager.flush_sysex = _flush_sysex
+MidiManager.sysex_batch = _sysex_batch
+
+# --- Bulk Read ---
+def _decode_part(part: int, block: bytes) -> dict:
+    return {
+        "part": part,
+        "rx_channel": block[OFF_PART_RX_CHAN] + 1,
+        "rx_switch": bool(block[OFF_PART_RX_SW]),
+        "patch": (block[OFF_PART_BANK_MSB], block[OFF_PART_BANK_LSB], block[OFF_PART_PC]),
+    }
+
+def _decode_zone(zone: int, block: bytes) -> dict:
+    return {
+        "zone": zone,
+        "enabled": bool(block[OFF_ZONE_SW]),
+        "octave": block[OFF_ZONE_OCTAVE] - 64,
+        "low": block[OFF_ZONE_LOW],
+        "high": block[OFF_ZONE_HIGH],
+    }
+
+def _read_performance_state(self, timeout: float = 1.0) -> dict:
+    """
+    Reads all 16 part blocks and 16 zone blocks in one pipelined pass, loads them
+    into the shadow and returns {"parts": [...], "zones": [...]} (None where unanswered).
+    """
+    ranges = [(_part_address(n + 1), PART_BLOCK_SIZE) for n in range(16)]
+    ranges += [(_zone_address(n + 1), ZONE_BLOCK_SIZE) for n in range(16)]
+    blocks = self.read_blocks(ranges, timeout)
+
+    state = {"parts": [], "zones": []}
+    for i, ((address, size), block) in enumerate(zip(ranges, blocks)):
+        if block is not None:
+            self.shadow.set(address, block)
+        if i < 16:
+            state["parts"].append(_decode_part(i + 1, block) if block else None)
+        else:
+            state["zones"].append(_decode_zone(i - 15, block) if block else None)
+    return state
+
+def _resync_shadow(self) -> dict | None:
+    """
+    Forgets the shadow and, when an input port is open, reloads it from the device.
+    Returns the decoded state (see read_performance_state) or None without input.
+    """
+    self.shadow.invalidate()
+    if not self.midiin:
+        return None
+    return self.read_performance_state()
+
+MidiManager.read_performance_state = _read_performance_state
+MidiManager.resync_shadow = _resync_shadow
+
+@_timed
+def sync_from_device() -> dict | None:
+    """Reads the keyboard's current part/zone state into the shadow (e.g. right after connecting)."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    return manager.resync_shadow()
+
+def detect_model(timeout: float = 0.3) -> str | None:
+    """
+    Finds out which MODEL_IDS key ("GP"/"GK") the keyboard answers to by sending an RQ1 with
+    each model ID; only the matching model replies. All later SysEx to this connection uses it.
+    None if no reply.
+    """
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    previous = manager.model_id
+    for name, model_id in MODEL_IDS.items():
+        manager.model_id = bytes.fromhex(model_id)
+        if manager.request_data(PART_BASE, 1, timeout) is not None:
+            return name
+    manager.model_id = previous
+    return None
+
+def invalidate_shadow() -> None:
+    """Forgets the known device state so the next writes are all sent (e.g. after panel edits)."""
+    manager = _get_manager()
+    if manager:
+        manager.shadow.invalidate()
+
+def set_sysex_pacing(mode: str = "fixed", **options) -> SysExPacer:
+    """Switches the active connection to 'fixed' or 'verified' (RQ1 read-back) DT1 pacing."""
+    manager = _get_manager()
+    if not manager:
+        raise GoRLibMIDIError("MIDI not connected")
+    manager.pacer = SysExPacer(mode, **options)
+    return manager.pacer
 
 # --- Part Functions ---
+@_timed
 def part_receive_channel_SysEx(part: int, channel: int) -> None:
+    manager = _get_manager()
     if not 1 <= part <= 16 or not 1 <= channel <= 16:
         raise ValueError("Part/channel 1–16")
-    addr = PART_BASE + (part - 1) * PART_BLOCK_SIZE + OFF_PART_RX_CHAN
+    addr = _part_address(part, OFF_PART_RX_CHAN)
     value = channel - 1  # 0 for ch1, 1 for ch2, etc.
-    _midi_manager_instance._send_sysex_fixed(addr, bytes([value]))
+    manager._send_sysex_fixed(addr, bytes([value]))
 
+@_timed
 def part_enable_SysEx(part: int, on: bool = True) -> None:
+    manager = _get_manager()
     if not 1 <= part <= 16:
         raise ValueError("Part must be 1–16")
-    addr = PART_BASE + (part - 1) * PART_BLOCK_SIZE + OFF_PART_RX_SW
+    addr = _part_address(part, OFF_PART_RX_SW)
     value = 1 if on else 0
-    _midi_manager_instance._send_sysex_fixed(addr, bytes([value]))
+    manager._send_sysex_fixed(addr, bytes([value]))
 
+@_timed
 def part_patch_SysEx(part: int, bank_msb: int, bank_lsb: int = 0, pc: int = 0) -> None:
+    manager = _get_manager()
     if not 1 <= part <= 16:
         raise ValueError("Part must be 1–16")
-    base = PART_BASE + (part - 1) * PART_BLOCK_SIZE
+    base = _part_address(part)
     bank_msb &= 0x7F
     bank_lsb &= 0x7F
     pc &= 0x7F
 
-    _midi_manager_instance._send_sysex_fixed(base + OFF_PART_BANK_MSB, bytes([bank_msb]))
-    _midi_manager_instance._send_sysex_fixed(base + OFF_PART_BANK_LSB, bytes([bank_lsb]))
-    _midi_manager_instance._send_sysex_fixed(base + OFF_PART_PC, bytes([pc]))
-    time.sleep(0.1)  # Allow tone to load
+    with manager.sysex_batch():
+        manager._send_sysex_fixed(base + OFF_PART_BANK_MSB, bytes([bank_msb]))
+        manager._send_sysex_fixed(base + OFF_PART_BANK_LSB, bytes([bank_lsb]))
+        manager._send_sysex_fixed(base + OFF_PART_PC, bytes([pc]))
+        manager.sysex_settle(0.1)  # Allow tone to load
 
 # --- Zone Functions ---
+@_timed
 def zone_enable_SysEx(zone: int, on: bool = True) -> None:
+    manager = _get_manager()
     if not 1 <= zone <= 16:
         raise ValueError("Zone must be 1–16")
-    addr = ZONE_BASE + (zone - 1) * ZONE_BLOCK_SIZE + OFF_ZONE_SW
+    addr = _zone_address(zone, OFF_ZONE_SW)
     value = 1 if on else 0
-    _midi_manager_instance._send_sysex_fixed(addr, bytes([value]))
+    manager._send_sysex_fixed(addr, bytes([value]))
 
+@_timed
 def zone_octave_SysEx(zone: int, shift: int) -> None:
+    manager = _get_manager()
     if not -3 <= shift <= 3:
         raise ValueError("Octave shift -3 to +3")
-    addr = ZONE_BASE + (zone - 1) * ZONE_BLOCK_SIZE + OFF_ZONE_OCTAVE
+    addr = _zone_address(zone, OFF_ZONE_OCTAVE)
     value = shift + 64  # Correct: 61 for -3, 64 for 0, 67 for +3
-    _midi_manager_instance._send_sysex_fixed(addr, bytes([value]))
+    manager._send_sysex_fixed(addr, bytes([value]))
 
+@_timed
 def zone_key_range_SysEx(zone: int, low: int | None = None, high: int | None = None) -> None:
+    manager = _get_manager()
     if not 1 <= zone <= 16:
         raise ValueError("Zone must be 1–16")
-    base = ZONE_BASE + (zone - 1) * ZONE_BLOCK_SIZE
-    if low is not None:
-        low = max(0, min(127, low))
-        _midi_manager_instance._send_sysex_fixed(base + OFF_ZONE_LOW, bytes([low]))
-    if high is not None:
-        high = max(0, min(127, high))
-        _midi_manager_instance._send_sysex_fixed(base + OFF_ZONE_HIGH, bytes([high]))
-
+    base = _zone_address(zone)
+    with manager.sysex_batch():
+        if low is not None:
+            low = max(0, min(127, low))
+            manager._send_sysex_fixed(base + OFF_ZONE_LOW, bytes([low]))
+        if high is not None:
+            high = max(0, min(127, high))
+            manager._send_sysex_fixed(base + OFF_ZONE_HIGH, bytes([high]))
+
+@_timed
 def reset_to_default_SysEx() -> None:
     """Reset to factory-like state (all zones full, default patches) - optional"""
-    for i in range(1, 17):
-        part_enable_SysEx(i, True)
-        zone_enable_SysEx(i, True)
-        zone_octave_SysEx(i, 0)
-        zone_key_range_SysEx(i, low=0, high=127)
-    time.sleep(1)
-
+    manager = _get_manager()
+    with manager.sysex_batch():
+        for i in range(1, 17):
+            part_enable_SysEx(i, True)
+            zone_enable_SysEx(i, True)
+            zone_octave_SysEx(i, 0)
+            zone_key_range_SysEx(i, low=0, high=127)
+    _sleep(1)
+
+@_timed
 def setup_split_SysEx(lower_patch: tuple = (87, 66, 71), upper_patch: tuple = (87, 71, 40), split_point: int = 60, lower_octave: int = -1) -> None:
     """Clean split without disabling everything (avoids no-sound)"""
-    # Ensure the used parts/zones are enabled
-    # Lower
-    part_receive_channel_SysEx(1,1)
-    part_enable_SysEx(1, True)
-    part_patch_SysEx(1, *lower_patch)
-    zone_enable_SysEx(1, True)
-    #zone_octave_SysEx(1, lower_octave)
-    zone_key_range_SysEx(1, low=0, high=split_point)
-
-    # Upper
-    part_receive_channel_SysEx(2,1)
-    part_enable_SysEx(2, True)
-    part_patch_SysEx(2, *upper_patch)
-    zone_enable_SysEx(2, True)
-    zone_key_range_SysEx(2, low=split_point + 1, high=127)
-
-    # Optional: disable a few extra if layering from defaults
-    for i in range(3, 17):
-        zone_enable_SysEx(i, False)  # Disable extra zones to reduce potential layering
-
-    time.sleep(0.5)
+    manager = _get_manager()
+    with manager.sysex_batch():
+        # Ensure the used parts/zones are enabled
+        # Lower
+        part_receive_channel_SysEx(1,1)
+        part_enable_SysEx(1, True)
+        part_patch_SysEx(1, *lower_patch)
+        zone_enable_SysEx(1, True)
+        #zone_octave_SysEx(1, lower_octave)
+        zone_key_range_SysEx(1, low=0, high=split_point)
+
+        # Upper
+        part_receive_channel_SysEx(2,1)
+        part_enable_SysEx(2, True)
+        part_patch_SysEx(2, *upper_patch)
+        zone_enable_SysEx(2, True)
+        zone_key_range_SysEx(2, low=split_point + 1, high=127)
+
+        # Optional: disable a few extra if layering from defaults
+        for i in range(3, 17):
+            zone_enable_SysEx(i, False)  # Disable extra zones to reduce potential layering
+
+    _sleep(0.5)
 
 # Optional: full enable if you want all zones active
+@_timed
 def enable_all_zones_SysEx() -> None:
-    for i in range(1, 17):
-        part_enable_SysEx(i, True)
-        zone_enable_SysEx(i, True)
-        zone_octave_SysEx(i, 0)
-        zone_key_range_SysEx(i, low=0, high=127)
\ No newline at end of file
+    manager = _get_manager()
+    with manager.sysex_batch():
+        for i in range(1, 17):
+            part_enable_SysEx(i, True)
+            zone_enable_SysEx(i, True)
+            zone_octave_SysEx(i, 0)
+            zone_key_range_SysEx(i, low=0, high=127)
+
+
+# ===================================================================
+# PERFORMANCE SNAPSHOTS — full part/zone state stored as ready-to-send DT1 frames
+# ===================================================================
+
+PERFORMANCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'performances')
+
+def _state_from_shadow(shadow: DeviceShadow) -> dict:
+    """Decodes whatever the shadow knows into the read_performance_state() layout (None = unknown)."""
+    def field(address, convert=lambda v: v):
+        value = shadow.get(address)
+        return None if value is None else convert(value)
+
+    parts, zones = [], []
+    for n in range(16):
+        base = _part_address(n + 1)
+        patch = tuple(shadow.get(base + off) for off in (OFF_PART_BANK_MSB, OFF_PART_BANK_LSB, OFF_PART_PC))
+        parts.append({
+            "part": n + 1,
+            "rx_channel": field(base + OFF_PART_RX_CHAN, lambda v: v + 1),
+            "rx_switch": field(base + OFF_PART_RX_SW, bool),
+            "patch": None if None in patch else patch,
+        })
+        base = _zone_address(n + 1)
+        zones.append({
+            "zone": n + 1,
+            "enabled": field(base + OFF_ZONE_SW, bool),
+            "octave": field(base + OFF_ZONE_OCTAVE, lambda v: v - 64),
+            "low": field(base + OFF_ZONE_LOW),
+            "high": field(base + OFF_ZONE_HIGH),
+        })
+    return {"parts": parts, "zones": zones}
+
+def _state_writes(state: dict) -> dict:
+    """{address: value} for every known parameter of a performance state."""
+    writes = {}
+    for part in state.get("parts", []):
+        if not part:
+            continue
+        base = _part_address(part["part"])
+        if part.get("rx_channel") is not None:
+            writes[base + OFF_PART_RX_CHAN] = part["rx_channel"] - 1
+        if part.get("rx_switch") is not None:
+            writes[base + OFF_PART_RX_SW] = int(part["rx_switch"])
+        if part.get("patch") is not None:
+            msb, lsb, pc = part["patch"]
+            writes[base + OFF_PART_BANK_MSB] = msb & 0x7F
+            writes[base + OFF_PART_BANK_LSB] = lsb & 0x7F
+            writes[base + OFF_PART_PC] = pc & 0x7F
+    for zone in state.get("zones", []):
+        if not zone:
+            continue
+        base = _zone_address(zone["zone"])
+        if zone.get("enabled") is not None:
+            writes[base + OFF_ZONE_SW] = int(zone["enabled"])
+        if zone.get("octave") is not None:
+            writes[base + OFF_ZONE_OCTAVE] = zone["octave"] + 64
+        if zone.get("low") is not None:
+            writes[base + OFF_ZONE_LOW] = zone["low"]
+        if zone.get("high") is not None:
+            writes[base + OFF_ZONE_HIGH] = zone["high"]
+    return writes
+
+def compile_performance(state: dict, shadow: DeviceShadow | None = None) -> bytes:
+    """
+    Encodes a performance state as the fewest DT1 frames (one per contiguous run; gaps the
+    shadow knows are filled in) and returns them concatenated, i.e. a standard .syx blob.
+    """
+    blob = bytearray()
+    for address, data in _coalesce_writes(_state_writes(state), shadow):
+        blob += bytes(_sysex_frame(address, data))
+    return bytes(blob)
+
+def _split_sysex(blob: bytes) -> list:
+    """Splits a .syx blob into its F0...F7 messages."""
+    frames = []
+    start = blob.find(0xF0)
+    while start >= 0:
+        end = blob.find(0xF7, start)
+        if end < 0:
+            break
+        frames.append(blob[start:end + 1])
+        start = blob.find(0xF0, end)
+    return frames
+
+def _recall_frames(self, blob: bytes) -> int:
+    """
+    Streams precompiled DT1 frames as they are, skipping frames the shadow says are
+    already in place. Returns the number of frames sent.
+    """
+    sent = 0
+    patch_changed = False
+    for frame in _split_sysex(blob):
+        parsed = _parse_dt1(frame)
+        if parsed is None:
+            raise GoRLibMIDIError("Performance data is corrupt (bad DT1 frame)")
+        address, data = parsed
+        if all(self.shadow.get(_address_add(address, i)) == value for i, value in enumerate(data)):
+            continue
+        self._write_paced(address, data, frame)
+        self.shadow.set(address, data)
+        sent += 1
+        i = DeviceShadow.index(address)
+        offset = i % PART_BLOCK_SIZE if i is not None and i < 16 * PART_BLOCK_SIZE else None
+        if offset is not None and offset <= OFF_PART_PC < offset + len(data):
+            patch_changed = True
+    if patch_changed:
+        _sleep(0.1)  # Allow tones to load
+    return sent
+
+MidiManager.recall_frames = _recall_frames
+
+def _performance_path(name: str) -> str:
+    safe = "".join(c for c in name if c.isalnum() or c in " _-.").strip()
+    if not safe:
+        raise ValueError(f"Invalid performance name '{name}'")
+    return os.path.join(PERFORMANCE_DIR, safe + '.syx')
+
+@_timed
+def capture_performance() -> dict:
+    """Current part/zone state: read from the device when possible, otherwise from the shadow."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    if manager.midiin:
+        manager.read_performance_state()
+    return _state_from_shadow(manager.shadow)
+
+def _unknown_blocks(state: dict) -> list:
+    """"part N"/"zone N" for every part or zone of state that is missing or has an unknown field."""
+    unknown = []
+    for kind in ("parts", "zones"):
+        blocks = {block[kind[:-1]]: block for block in state.get(kind) or [] if block}
+        for n in range(1, 17):
+            block = blocks.get(n)
+            if block is None or None in block.values():
+                unknown.append(f"{kind[:-1]} {n}")
+    return unknown
+
+def save_performance(name: str, state: dict | None = None) -> str:
+    """
+    Compiles state (default: capture_performance()) to performances/<name>.syx. Returns the path.
+    Refuses to save unless every part and zone is fully known.
+    """
+    manager = _get_manager()
+    if state is None:
+        state = capture_performance()
+    unknown = _unknown_blocks(state)
+    if unknown:
+        raise GoRLibMIDIError(f"Cannot save a full performance, state unknown for {', '.join(unknown[:4])}"
+                              + (f" and {len(unknown) - 4} more" if len(unknown) > 4 else ""))
+    shadow = manager.shadow if manager else None
+    blob = compile_performance(state, shadow)
+    if not blob:
+        raise GoRLibMIDIError("Nothing known about the current performance to save")
+    path = _performance_path(name)
+    os.makedirs(PERFORMANCE_DIR, exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(blob)
+    os.replace(path + '.tmp', path)
+    return path
+
+def list_performances() -> list:
+    """Names of the saved performances, sorted."""
+    if not os.path.isdir(PERFORMANCE_DIR):
+        return []
+    return sorted(f[:-4] for f in os.listdir(PERFORMANCE_DIR) if f.endswith('.syx'))
+
+def delete_performance(name: str) -> None:
+    os.remove(_performance_path(name))
+
+@_timed
+def recall_performance(name: str) -> int:
+    """Streams a saved performance to the keyboard in one burst. Returns the number of DT1 frames sent."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    with open(_performance_path(name), 'rb') as f:
+        blob = f.read()
+    return manager.recall_frames(blob)
+
+
+# ===================================================================
+# PORT WATCHER — cached port list, hot-plug detection and auto-reconnect
+# ===================================================================
+
+def _port_key(name: str) -> str:
+    """Port name without ALSA's trailing client:port numbers, which can change on replug."""
+    return re.sub(r'\s+\d+:\d+$', '', name)
+
+def _replay_state(self) -> int:
+    """
+    Re-sends everything the shadow knows, e.g. after the keyboard was replugged or power
+    cycled and its state can no longer be trusted. Returns the number of messages sent.
+    """
+    shadow = self.shadow
+    blob = compile_performance(_state_from_shadow(shadow))
+    layout = {}
+    for channel in range(16):
+        zone = {}
+        patch = (shadow.cc(channel, CC_BANK_MSB), shadow.cc(channel, CC_BANK_LSB), shadow.program(channel))
+        if None not in patch:
+            zone["patch"] = patch
+        for key, cc in (("enabled", CC_ZONE_ENABLE), ("octave", CC_ZONE_OCTAVE), ("low", CC_ZONE_LOW), ("high", CC_ZONE_HIGH)):
+            value = shadow.cc(channel, cc)
+            if value is not None:
+                zone[key] = value >= 64 if key == "enabled" else value - 64 if key == "octave" else value
+        if zone.get("octave") is not None and not -4 <= zone["octave"] <= 4:
+            del zone["octave"]
+        if zone:
+            layout[channel + 1] = zone
+    stream = encode_zone_layout(layout)
+
+    shadow.invalidate()
+    sent = self.recall_frames(blob) if blob else 0
+    if stream:
+        self.send_stream(stream)
+        for message in _split_running_status(stream):
+            if message[0] & 0xF0 == PROGRAM_CHANGE_STATUS:
+                shadow.set_program(message[0] & 0x0F, message[1])
+            else:
+                shadow.set_cc(message[0] & 0x0F, message[1], message[2])
+            sent += 1
+    return sent
+
+MidiManager.replay_state = _replay_state
+
+class PortWatcher:
+    """
+    Background thread that keeps the output port list cached (get_output_ports() returns it
+    without touching ALSA) and follows the active connection's port: when it disappears the
+    connection is closed, when it comes back it is reopened and the last known state replayed.
+    callback(event, port) is called from the watcher thread with event "ports" (list changed),
+    "lost", "reconnected" or "failed".
+    """
+
+    def __init__(self, interval: float = 1.0, callback=None):
+        self.interval = interval
+        self.callback = callback
+        self.ports = None
+        self._lost = None   # (manager, port key) while the active port is unplugged
+        self._midiout = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="GoRLib port watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"GoRLib port watcher: {e}", file=sys.stderr)
+            self._stop.wait(self.interval)
+
+    def _notify(self, event, port=None):
+        if self.callback:
+            self.callback(event, port)
+
+    def poll(self):
+        """Enumerates the ports once and handles any change."""
+        if self._midiout is None:
+            self._midiout = rtmidi.MidiOut()
+        ports = self._midiout.get_ports()
+        changed = ports != self.ports
+        self.ports = ports
+
+        manager = _midi_manager_instance
+        if self._lost and self._lost[0] is not manager:
+            self._lost = None  # another connection was opened meanwhile
+        if manager and manager.port_name:
+            by_key = {_port_key(p): p for p in ports}
+            if self._lost is None:
+                if manager.is_connected and _port_key(manager.port_name) not in by_key:
+                    self._lost = (manager, _port_key(manager.port_name))
+                    manager.is_connected = False  # new sends fail fast while a running job winds down
+                    self._notify("lost", manager.port_name)
+                    try:
+                        manager.close_port()
+                    except Exception:
+                        pass
+            elif self._lost[1] in by_key:
+                self._reconnect(manager, by_key[self._lost[1]])
+        if changed:
+            self._notify("ports", ports)
+
+    def _reconnect(self, manager, port):
+        manager.port_name = port
+        try:
+            manager.open_port()
+            replayed = manager.submit(manager.replay_state)
+            self._lost = None
+        except Exception as e:
+            self._notify("failed", f"{port}: {e}")
+            return
+        replayed.add_done_callback(lambda f: self._notify("reconnected" if not f.exception() else "failed", port))
+
+def start_port_watcher(interval: float = 1.0, callback=None) -> PortWatcher:
+    """Starts (or restarts with new settings) the background port watcher; see PortWatcher."""
+    global _port_watcher
+    if _port_watcher:
+        _port_watcher.stop()
+    _port_watcher = PortWatcher(interval, callback)
+    _port_watcher.start()
+    return _port_watcher
+
+def stop_port_watcher() -> None:
+    global _port_watcher
+    if _port_watcher:
+        _port_watcher.stop()
+        _port_watcher = None
+
+
+# ===================================================================
+# MESSAGE TABLES — the whole patch library pre-encoded for rapid audition and bulk recall
+# ===================================================================
+
+_patch_table = None
+
+class PatchMessageTable:
+    """
+    Every patch of a library encoded once into flat byte tables, indexed by record number:
+    programs holds bank select + Program Change for each patch on each of the 16 channels
+    (B0 00 msb, B0 20 lsb, C0 pc: 8 bytes), part_frames the DT1 writing (msb, lsb, pc) into
+    each of the 16 parts (built once per model ID). Sending is a lookup and a slice.
+    """
+    PROGRAM_SIZE = 8
+
+    def __init__(self, ids):
+        self.ids = tuple(bytes((msb & 0x7F, lsb & 0x7F, pc & 0x7F)) for msb, lsb, pc in ids)
+        programs = bytearray(len(self.ids) * 16 * self.PROGRAM_SIZE)
+        at = 0
+        for msb, lsb, pc in self.ids:
+            for channel in range(16):
+                cc = CONTROL_CHANGE_STATUS | channel
+                programs[at:at + 8] = (cc, CC_BANK_MSB, msb, cc, CC_BANK_LSB, lsb, PROGRAM_CHANGE_STATUS | channel, pc)
+                at += 8
+        self.programs = memoryview(bytes(programs))
+        self.part_frames = {}  # model ID -> (frame size, frames)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def program(self, record: int, channel: int) -> memoryview:
+        at = (record * 16 + channel) * self.PROGRAM_SIZE
+        return self.programs[at:at + self.PROGRAM_SIZE]
+
+    def _build_part_frames(self, model_id: bytes) -> tuple:
+        prefixes = [_prefixes_for(model_id)[_part_address(n + 1, OFF_PART_BANK_MSB)] for n in range(16)]
+        size = len(prefixes[0][0]) + 5
+        frames = bytearray(len(self.ids) * 16 * size)
+        at = 0
+        for data in self.ids:
+            data_sum = sum(data)
+            for prefix, address_sum in prefixes:
+                frames[at:at + size] = prefix + data + bytes(((128 - (address_sum + data_sum) % 128) & 0x7F, 0xF7))
+                at += size
+        self.part_frames[model_id] = size, memoryview(bytes(frames))
+        return self.part_frames[model_id]
+
+    def part_frame(self, record: int, part: int, model_id: bytes | None = None) -> memoryview:
+        """The DT1 setting part (1-16) to patch record, for model_id (default: the connected model)."""
+        model_id = model_id or _active_model_id()
+        size, frames = self.part_frames.get(model_id) or self._build_part_frames(model_id)
+        at = (record * 16 + part - 1) * size
+        return frames[at:at + size]
+
+def set_patch_table(ids) -> PatchMessageTable:
+    """Pre-encodes a patch library ((msb, lsb, pc) per record) for zone_patch_record/part_patch_record_SysEx."""
+    global _patch_table
+    table = PatchMessageTable(ids)
+    if len(table):
+        table._build_part_frames(_active_model_id())
+    _patch_table = table
+    return table
+
+def get_patch_table() -> PatchMessageTable | None:
+    return _patch_table
+
+def _table_record(record: int) -> PatchMessageTable:
+    table = _patch_table
+    if table is None:
+        raise GoRLibMIDIError("No patch table loaded (set_patch_table)")
+    if not 0 <= record < len(table.ids):
+        raise ValueError(f"Patch record must be 0–{len(table.ids) - 1}, got {record}")
+    return table
+
+def _send_program_record(self, channel: int, table: PatchMessageTable, record: int, force: bool = False) -> bool:
+    """send_program() from the pre-encoded table: bank select + PC in one driver call where possible."""
+    msb, lsb, pc = table.ids[record]
+    shadow = self.shadow
+    if not force and shadow.program(channel) == pc and shadow.cc(channel, CC_BANK_MSB) == msb \
+            and shadow.cc(channel, CC_BANK_LSB) == lsb:
+        return False
+    messages = table.program(record, channel)
+    with self._send_lock:
+        if not self.midiout.is_port_open():
+            raise IOError("MIDI output port is not open.")
+        start = time.perf_counter()
+        write = getattr(self.midiout, 'send_stream', None)
+        if write:
+            write(messages)
+        else:
+            # rtmidi takes one message per call
+            send = self.midiout.send_message
+            send(messages[0:3])
+            send(messages[3:6])
+            send(messages[6:8])
+        LATENCY.record("send", time.perf_counter() - start)
+        LATENCY.sent()
+        if self.recorder:
+            self.recorder.write(messages)
+    shadow.set_cc(channel, CC_BANK_MSB, msb)
+    shadow.set_cc(channel, CC_BANK_LSB, lsb)
+    shadow.set_program(channel, pc)
+    return True
+
+MidiManager.send_program_record = _send_program_record
+
+@_timed
+def zone_patch_record(zone: int, record: int) -> None:
+    """zone_patch() for patch record of the loaded patch table."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    if not 1 <= zone <= 16:
+        raise ValueError(f"Zone must be 1–16, got {zone}")
+    table = _table_record(record)
+    manager.send_program_record(zone - 1, table, record)
+
+@_timed
+def part_patch_record_SysEx(part: int, record: int) -> None:
+    """part_patch_SysEx() for patch record of the loaded patch table, sent as its prebuilt DT1."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    if not 1 <= part <= 16:
+        raise ValueError("Part must be 1–16")
+    table = _table_record(record)
+    address = _part_address(part, OFF_PART_BANK_MSB)
+    data = table.ids[record]
+    if manager._sysex_batch_depth:
+        # Part of a larger batch: let it coalesce with the other writes
+        manager._send_sysex_fixed(address, data)
+        manager.sysex_settle(0.1)
+        return
+    if all(manager.shadow.get(_address_add(address, i)) == value for i, value in enumerate(data)):
+        return
+    try:
+        manager._write_paced(address, data, table.part_frame(record, part, manager.model_id))
+    except Exception:
+        manager.shadow.invalidate(address, len(data))
+        raise
+    manager.shadow.set(address, data)
+    _sleep(0.1)  # Allow tone to load
+
+
+# ===================================================================
+# CONNECTION POOL — several devices at once, one transmit thread each
+# ===================================================================
+
+class MidiPool:
+    """
+    Open connections to several devices (e.g. two GO: keyboards and a sound module), each with
+    its own transmit thread. run() queues a GoRLib call on every selected device; while it runs
+    on a device's thread every GoRLib function acts on that device, so the devices work in
+    parallel and a rig change takes as long as the slowest device, not the sum of all of them.
+    The pool is independent of the active connection (init_midi_connection).
+    """
+
+    def __init__(self):
+        self.managers = {}  # port name -> MidiManager
+        self._lock = threading.Lock()
+
+    def open(self, port_name: str) -> MidiManager:
+        """Connects port_name (if not already in the pool) and starts its transmit thread."""
+        with self._lock:
+            manager = self.managers.get(port_name)
+            if manager and manager.is_connected:
+                return manager
+        manager = MidiManager(port_name, async_send=True)
+        manager.open_port()
+        return self.add(manager)
+
+    def add(self, manager: MidiManager, name: str | None = None) -> MidiManager:
+        """Adds an already opened connection (virtual port, emulator) under name (default: its port)."""
+        manager.start_sender()
+        with self._lock:
+            old = self.managers.get(name or manager.port_name)
+            self.managers[name or manager.port_name] = manager
+        if old and old is not manager:
+            old.close_port()
+        return manager
+
+    def close(self, port_name: str) -> None:
+        with self._lock:
+            manager = self.managers.pop(port_name, None)
+        if manager:
+            manager.close_port()
+
+    def close_all(self) -> None:
+        with self._lock:
+            managers, self.managers = self.managers, {}
+        for manager in managers.values():
+            try:
+                manager.close_port()
+            except Exception:
+                pass
+
+    @property
+    def ports(self) -> list:
+        return list(self.managers)
+
+    def __len__(self):
+        return len(self.managers)
+
+    def __contains__(self, port_name):
+        return port_name in self.managers
+
+    def _select(self, ports) -> dict:
+        with self._lock:
+            if ports is None:
+                return {name: m for name, m in self.managers.items() if m.is_connected}
+            if isinstance(ports, str):
+                ports = (ports,)
+            missing = [name for name in ports if name not in self.managers]
+            if missing:
+                raise GoRLibMIDIError(f"Not in the MIDI pool: {', '.join(missing)}")
+            return {name: self.managers[name] for name in ports}
+
+    def run(self, func, *args, ports=None, callback=None, **kwargs) -> dict:
+        """
+        Queues func(*args, **kwargs) (e.g. GoRLib.zone_patch) on each selected device (default:
+        all connected ones) and returns {port: Future} at once. callback(port, future) is
+        called on each device's transmit thread when its call is done.
+        """
+        futures = {}
+        for name, manager in self._select(ports).items():
+            done = (lambda f, name=name: callback(name, f)) if callback else None
+            futures[name] = manager.submit(func, *args, callback=done, **kwargs)
+        return futures
+
+    def run_latest(self, key, func, *args, ports=None, delay=0.0, callback=None, **kwargs) -> dict:
+        """run() with submit_latest() semantics per device: newer calls with the same key win."""
+        futures = {}
+        for name, manager in self._select(ports).items():
+            done = (lambda f, name=name: callback(name, f)) if callback else None
+            futures[name] = manager.submit_latest(key, func, *args, delay=delay, callback=done, **kwargs)
+        return futures
+
+    def broadcast(self, func, *args, ports=None, timeout=None, **kwargs) -> dict:
+        """
+        run() and wait for every device. Returns {port: result}; a device whose call failed
+        (or did not finish within timeout) maps to the exception instead.
+        """
+        futures = self.run(func, *args, ports=ports, **kwargs)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results = {}
+        for name, future in futures.items():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                results[name] = future.result(remaining)
+            except Exception as e:
+                results[name] = e
+        return results
+
+
+# ===================================================================
+# SETLISTS — the next song is loaded into idle parts while the current one plays
+# ===================================================================
+
+SETLIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'setlists')
+SETLIST_BANK = 8        # songs use parts/zones 1-8; they are played from parts 1-8 or 9-16
+SETLIST_PARK_CHANNEL = 16  # receive channel of staged (silent) parts
+
+class Setlist:
+    """
+    Songs (setups, see setup_state) played in order. The two halves of the 16 parts/zones take
+    turns: while a song plays from one half, the next song's patches are loaded into the other
+    half with its zones off and its parts parked on SETLIST_PARK_CHANNEL, so the tones have
+    loaded long before they are needed. Changing song is then only zone switches and receive
+    channel flips: no patch writes and no tone-load wait. Methods send MIDI; run them with submit().
+    """
+
+    def __init__(self, songs: list, name: str = ""):
+        self.name = name
+        self.titles = []
+        self.states = []
+        for n, song in enumerate(songs, 1):
+            if not isinstance(song, dict):
+                raise ValueError(f"Song {n}: a song is a JSON object, got {song!r}")
+            self.titles.append(str(song.get("name") or f"Song {n}"))
+            try:
+                self.states.append(self._song_state(song))
+            except (KeyError, TypeError, ValueError) as e:
+                # A malformed song must not get past load as anything but a ValueError
+                raise ValueError(f"Song {n} ({self.titles[-1]}): {e}") from e
+        self.live = None       # song index playing
+        self.live_bank = None  # part offset (0 or SETLIST_BANK) it plays from
+        self.staged = None     # song index loaded, silent, in the other half
+
+    @staticmethod
+    def _song_state(song: dict) -> dict:
+        state = setup_state(song)
+        for key, number in (("parts", "part"), ("zones", "zone")):
+            used = []
+            for entry in state[key]:
+                if entry[number] <= SETLIST_BANK:
+                    used.append(entry)
+                elif set(entry) - {number, "enabled"} or entry.get("enabled"):
+                    raise ValueError(f"setlist songs can only use parts and zones 1–{SETLIST_BANK}")
+            state[key] = used
+        return state
+
+    @classmethod
+    def load(cls, name: str) -> "Setlist":
+        """Reads setlists/<name>.json: {"songs": [{"name": ..., <setup>}, ...]}."""
+        path = os.path.join(SETLIST_DIR, name + '.json')
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read setlist {path}: {e}")
+        songs = data.get("songs") if isinstance(data, dict) else None
+        if not songs or not isinstance(songs, list):
+            raise ValueError(f"Setlist {name} has no songs")
+        return cls(songs, name)
+
+    def __len__(self):
+        return len(self.states)
+
+    @property
+    def idle_bank(self) -> int:
+        return SETLIST_BANK if self.live_bank == 0 else 0
+
+    def _stage_writes(self, song: int, bank: int) -> dict:
+        """The song loaded into bank, silent: parts parked, zones configured but off."""
+        state = self.states[song]
+        parts = {n: {"part": n + bank, "rx_channel": SETLIST_PARK_CHANNEL} for n in range(1, SETLIST_BANK + 1)}
+        for part in state["parts"]:
+            parts[part["part"]] = dict(part, part=part["part"] + bank, rx_channel=SETLIST_PARK_CHANNEL)
+        zones = {n: {"zone": n + bank, "enabled": False} for n in range(1, SETLIST_BANK + 1)}
+        for zone in state["zones"]:
+            zones[zone["zone"]] = dict(zone, zone=zone["zone"] + bank, enabled=False)
+        return {"parts": list(parts.values()), "zones": list(zones.values())}
+
+    def _flip_writes(self, song: int, bank: int) -> tuple:
+        """(zones, parts) states taking song (staged in bank) live and muting the other half."""
+        state = self.states[song]
+        old_bank = SETLIST_BANK - bank
+        zones = [{"zone": zone["zone"] + bank, "enabled": zone["enabled"]}
+                 for zone in state["zones"] if zone.get("enabled") is not None]
+        # Everything in the old half not already off/parked (per the shadow) is skipped by recall_frames
+        zones += [{"zone": n + old_bank, "enabled": False} for n in range(1, SETLIST_BANK + 1)]
+        # A part without an explicit channel receives on its own number, as on the factory setup
+        parts = [{"part": part["part"] + bank, "rx_channel": part.get("rx_channel") or part["part"]}
+                 for part in state["parts"]]
+        parts += [{"part": n + old_bank, "rx_channel": SETLIST_PARK_CHANNEL} for n in range(1, SETLIST_BANK + 1)]
+        return {"zones": zones}, {"parts": parts}
+
+    def _send(self, state: dict) -> int:
+        manager = _get_manager()
+        if not manager or not manager.is_connected:
+            raise GoRLibMIDIError("MIDI not connected")
+        return manager.recall_frames(compile_performance(state, manager.shadow))
+
+    def stage(self, song: int) -> int:
+        """Loads song into the idle half (slow part: patch writes and tone load). Returns frames sent."""
+        if not 0 <= song < len(self):
+            raise ValueError(f"Song must be 1–{len(self)}, got {song + 1}")
+        self.staged = None
+        sent = self._send(self._stage_writes(song, self.idle_bank))
+        self.staged = song
+        return sent
+
+    def stage_next(self) -> int:
+        """Stages the song after the live one (nothing at the end of the set)."""
+        if self.live is None or self.live + 1 >= len(self) or self.staged == self.live + 1:
+            return 0
+        return self.stage(self.live + 1)
+
+    @_timed
+    def go(self, song: int) -> int:
+        """
+        Makes song live: instant if it is staged, otherwise it is staged first. Returns the
+        number of frames the switch itself took; queue stage_next() afterwards.
+        """
+        if self.staged != song:
+            self.stage(song)
+        bank = self.idle_bank
+        zones, parts = self._flip_writes(song, bank)
+        # Zone switches first: they decide what the keys play, the channels only matter for MIDI in
+        sent = self._send(zones) + self._send(parts)
+        self.live, self.live_bank, self.staged = song, bank, None
+        return sent
+
+def list_setlists() -> list:
+    """Names of the setlists in SETLIST_DIR, sorted."""
+    if not os.path.isdir(SETLIST_DIR):
+        return []
+    return sorted(f[:-5] for f in os.listdir(SETLIST_DIR) if f.endswith('.json'))
+
+
+# ===================================================================
+# RECENT AND FAVORITE PATCHES — one-press recall of pre-encoded zone messages
+# ===================================================================
+
+PATCH_MEMORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'patch_memory.json')
+RECENT_SIZE = 16  # recently used patches kept; the oldest is dropped
+PATCH_MEMORY_SAVE_DELAY = 2.0  # seconds between a patch send and the recent list being written
+
+class PatchMemory:
+    """
+    Recently used patches (newest first, at most `size`) and pinned favorites. Every entry keeps
+    the zone stream selecting it (bank select, PC and zone enable, see encode_zone_layout), so
+    recalling one is a single send with no patch lookup or encoding. Saved to `path` as JSON.
+    """
+
+    def __init__(self, path: str | None = None, size: int = RECENT_SIZE):
+        self.path = path or PATCH_MEMORY_PATH
+        self.size = size
+        # Lists are replaced, never changed in place: entries are added from the MIDI transmit thread
+        self.recent = []
+        self.favorites = []
+        self._save_lock = threading.Lock()
+        self._save_timer = None  # pending delayed save (see save_soon)
+
+    @staticmethod
+    def entry(name: str, patch, zone: int) -> dict:
+        msb, lsb, pc = (v & 0x7F for v in patch)
+        return {"name": name, "patch": (msb, lsb, pc), "zone": zone,
+                "data": encode_zone_layout({zone: {"patch": (msb, lsb, pc), "enabled": True}})}
+
+    @staticmethod
+    def _same(a: dict, b: dict) -> bool:
+        return a["patch"] == b["patch"] and a["zone"] == b["zone"]
+
+    def used(self, entry: dict) -> None:
+        """
+        Moves entry (see entry()) to the front of the recent list, dropping the oldest. Only memory
+        changes here (it runs in send callbacks); the file is written later by save_soon().
+        """
+        self.recent = ([entry] + [e for e in self.recent if not self._same(e, entry)])[:self.size]
+        self.save_soon()
+
+    def previous(self) -> dict | None:
+        """The sound used before the current one."""
+        recent = self.recent
+        return recent[1] if len(recent) > 1 else None
+
+    def is_favorite(self, entry: dict) -> bool:
+        return any(self._same(e, entry) for e in self.favorites)
+
+    def toggle_favorite(self, entry: dict) -> bool:
+        """Pins entry, or unpins it if it already is a favorite. True if it is now a favorite."""
+        if self.is_favorite(entry):
+            self.favorites = [e for e in self.favorites if not self._same(e, entry)]
+        else:
+            self.favorites = self.favorites + [entry]
+        self.save()
+        return self.is_favorite(entry)
+
+    def save_soon(self):
+        """Saves PATCH_MEMORY_SAVE_DELAY seconds from now on a timer thread; changes until then share that save."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(PATCH_MEMORY_SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+        atexit.register(self.flush)  # a pending save is not lost when the program just exits
+
+    def flush(self):
+        """Writes a pending save_soon() now."""
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is None:
+            return
+        timer.cancel()
+        atexit.unregister(self.flush)
+        try:
+            self.save()
+        except OSError as e:
+            print(f"GoRLib: recent patches not saved: {e}", file=sys.stderr)
+
+    def save(self):
+        def dump(entries):
+            return [{"name": e["name"], "patch": list(e["patch"]), "zone": e["zone"], "data": e["data"].hex()}
+                    for e in entries]
+        with self._save_lock:
+            with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({"recent": dump(self.recent), "favorites": dump(self.favorites)}, f, indent=1)
+            os.replace(self.path + '.tmp', self.path)
+
+    @classmethod
+    def load(cls, path: str | None = None, size: int = RECENT_SIZE) -> "PatchMemory":
+        """Reads path (default PATCH_MEMORY_PATH); a missing file gives empty lists. Raises ValueError if it is unreadable."""
+        memory = cls(path, size)
+        path = memory.path
+        if not os.path.exists(path):
+            return memory
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            entries = {}
+            for key in ("recent", "favorites"):
+                entries[key] = [{"name": e["name"], "patch": tuple(e["patch"]), "zone": e["zone"],
+                                 "data": bytes.fromhex(e["data"])} for e in data.get(key, [])]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Cannot read {path}: {e}")
+        memory.recent = entries["recent"][:size]
+        memory.favorites = entries["favorites"]
+        return memory
+
+@_timed
+def recall_patch(entry: dict) -> None:
+    """Sends a PatchMemory entry's stored zone stream as it is."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    manager.send_zone_stream(entry["data"])
+
+
+# ===================================================================
+# TRAFFIC RECORDER — timestamped log of everything sent and received, and its replay
+# ===================================================================
+
+RECORDING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recordings')
+
+# --- Recording Layout (little endian) ---
+# header:  magic, version, wall-clock start (time.time())
+# record:  microseconds since the previous record, flags (bit 0: incoming), length, then the
+#          bytes as one driver call carried them (a message, a SysEx, or a running-status stream)
+RECORDING_MAGIC = b'GoRT'
+RECORDING_VERSION = 1
+RECORDING_HEADER = struct.Struct('<4sHd')
+RECORD = struct.Struct('<IBH')
+RECORD_INCOMING = 0x01
+
+class TrafficRecorder:
+    """
+    Appends every message a MidiManager sends or receives to a recording file. A write is a
+    clock read, a struct pack and a bytearray append under a lock; the file is written in
+    FLUSH_BYTES chunks, so recording costs a few microseconds per message.
+    """
+    FLUSH_BYTES = 0x10000
+
+    def __init__(self, path: str):
+        self.path = path
+        self.messages = 0
+        self._file = open(path, 'wb')
+        self._file.write(RECORDING_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, time.time()))
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._last_us = time.monotonic_ns() // 1000
+        atexit.register(self.close)  # the buffered tail is not lost when the program just exits
+
+    def write(self, message, incoming: bool = False):
+        """Logs one message (any thread)."""
+        now_us = time.monotonic_ns() // 1000
+        with self._lock:
+            if self._file is None:
+                return
+            delta = min(now_us - self._last_us, 0xFFFFFFFF)  # a silence over 71 minutes is cut short
+            self._last_us = now_us
+            self._buffer += RECORD.pack(delta, RECORD_INCOMING if incoming else 0, len(message))
+            self._buffer.extend(message)
+            self.messages += 1
+            if len(self._buffer) >= self.FLUSH_BYTES:
+                self._file.write(self._buffer)
+                self._buffer.clear()
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.write(self._buffer)
+                self._buffer.clear()
+                self._file.flush()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        atexit.unregister(self.close)
+
+def read_recording(path: str) -> tuple:
+    """Returns (wall-clock start, [(seconds since start, incoming, bytes), ...]) of a recording."""
+    with open(path, 'rb') as f:
+        blob = f.read()
+    try:
+        magic, version, started = RECORDING_HEADER.unpack_from(blob, 0)
+    except struct.error:
+        raise ValueError(f"{path} is not a GoRLib recording")
+    if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+        raise ValueError(f"{path} is not a GoRLib recording (or an old version)")
+    records = []
+    at = RECORDING_HEADER.size
+    elapsed_us = 0
+    while at + RECORD.size <= len(blob):
+        delta, flags, size = RECORD.unpack_from(blob, at)
+        at += RECORD.size
+        if at + size > len(blob):
+            break  # cut off mid-record (the recording was not closed)
+        elapsed_us += delta
+        records.append((elapsed_us / 1e6, bool(flags & RECORD_INCOMING), blob[at:at + size]))
+        at += size
+    return started, records
+
+def _start_recording(self, path: str) -> TrafficRecorder:
+    """Logs this connection's traffic to path until stop_recording()."""
+    self.stop_recording()
+    self.recorder = TrafficRecorder(path)
+    return self.recorder
+
+def _stop_recording(self) -> TrafficRecorder | None:
+    recorder, self.recorder = self.recorder, None
+    if recorder:
+        recorder.close()
+    return recorder
+
+MidiManager.start_recording = _start_recording
+MidiManager.stop_recording = _stop_recording
+
+def start_recording(path: str | None = None) -> str:
+    """Records the active connection's traffic to path (default: recordings/<date-time>.gor). Returns the path."""
+    manager = _get_manager()
+    if not manager:
+        raise GoRLibMIDIError("MIDI not connected")
+    if path is None:
+        os.makedirs(RECORDING_DIR, exist_ok=True)
+        path = os.path.join(RECORDING_DIR, time.strftime("%Y%m%d-%H%M%S") + '.gor')
+    return manager.start_recording(path).path
+
+def stop_recording() -> TrafficRecorder | None:
+    """Ends the recording (if any) and returns its recorder (path, messages)."""
+    manager = _get_manager()
+    return manager.stop_recording() if manager else None
+
+def get_recorder() -> TrafficRecorder | None:
+    """The active connection's recorder while it is recording."""
+    manager = _get_manager()
+    return manager.recorder if manager else None
+
+def list_recordings() -> list:
+    """Recording files in RECORDING_DIR, newest first."""
+    if not os.path.isdir(RECORDING_DIR):
+        return []
+    return sorted((f for f in os.listdir(RECORDING_DIR) if f.endswith('.gor')), reverse=True)
+
+REPLAY_TIMINGS = ("original", "fast", "paced")
+
+def replay_recording(path: str, timing: str = "original") -> int:
+    """
+    Sends the outgoing messages of a recording to the active connection. timing:
+      original  with the gaps they had when recorded
+      fast      back to back, as fast as the port takes them
+      paced     back to back, but DT1 writes go through the current SysEx pacing (see
+                set_sysex_pacing), so pacing strategies can be compared on the same traffic
+    The replay bypasses the shadow, which is cleared afterwards. Returns the number of records sent.
+    """
+    if timing not in REPLAY_TIMINGS:
+        raise ValueError(f"Unknown replay timing '{timing}', expected one of {', '.join(REPLAY_TIMINGS)}")
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    outgoing = [(t, data) for t, incoming, data in read_recording(path)[1] if not incoming]
+    sent = 0
+    try:
+        start = time.monotonic() - (outgoing[0][0] if outgoing else 0.0)
+        for t, data in outgoing:
+            if timing == "original":
+                wait = start + t - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            if data[0] != 0xF0:
+                manager.send_stream(data)
+            else:
+                dt1 = _parse_dt1(data) if timing == "paced" else None
+                if dt1:
+                    manager._write_paced(dt1[0], dt1[1], data)
+                else:
+                    manager.send_message(data)
+            sent += 1
+    finally:
+        manager.shadow.invalidate()
+    return sent
+
+
+# ===================================================================
+# COMMAND LINE — headless control and declarative setups (no pygame needed)
+# ===================================================================
+
+def _setup_int(where: str, key: str, value, low: int, high: int) -> int:
+    """value if it is an int in low..high, else a ValueError naming where/key."""
+    if not isinstance(value, int) or isinstance(value, bool) or not low <= value <= high:
+        raise ValueError(f"{where}: {key} must be an integer {low}–{high}, got {value!r}")
+    return value
+
+def _setup_switch(where: str, key: str, value) -> bool:
+    if not isinstance(value, bool):
+        raise ValueError(f"{where}: {key} must be true or false, got {value!r}")
+    return value
+
+def _resolve_patch(patch, where: str = "") -> tuple:
+    """(msb, lsb, pc) from a [msb, lsb, pc] list (PC 1-128, as in patches.json) or a patch name."""
+    where = f"{where} patch" if where else "Patch"
+    if isinstance(patch, str):
+        import GoRPatches
+        hits = GoRPatches.load().search(patch, 10)
+        exact = [p for p in hits if p["name"].lower() == patch.strip().lower()]
+        if not hits:
+            raise ValueError(f"{where}: no patch named '{patch}'")
+        return tuple((exact or hits)[0]["id"])
+    if not (isinstance(patch, (list, tuple)) and len(patch) == 3):
+        raise ValueError(f"{where}: invalid patch {patch!r} (expected [MSB, LSB, PC] or a patch name)")
+    return (_setup_int(where, "MSB", patch[0], 0, 127), _setup_int(where, "LSB", patch[1], 0, 127),
+            _setup_int(where, "PC", patch[2], 1, 128))
+
+def _setup_list(setup: dict, key: str) -> list:
+    entries = setup.get(key, [])
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise ValueError(f"{key} must be a list of objects")
+    return entries
+
+def setup_state(setup: dict) -> dict:
+    """
+    Turns a declarative setup into a performance state for compile_performance():
+      {"split": {"point": 60, "lower": PATCH, "upper": PATCH, "lower_octave": -1},
+       "layer": [PATCH, PATCH, ...],
+       "parts": [{"part": 1, "patch": PATCH, "rx_channel": 1, "rx_switch": true}, ...],
+       "zones": [{"zone": 1, "enabled": true, "octave": 0, "low": 0, "high": 127}, ...]}
+    PATCH is [MSB, LSB, PC] or a patch name. split/layer set up parts and zones 1..n on
+    channel 1 and switch the other zones off (as setup_split_SysEx); explicit parts/zones
+    entries are applied on top. Anything left out is not touched.
+    Raises ValueError naming the offending key for any missing, mistyped or out-of-range field.
+    """
+    parts, zones = {}, {}
+    if "split" in setup and "layer" in setup:
+        raise ValueError("A setup can have a split or a layer, not both")
+    if "split" in setup:
+        split = setup["split"]
+        if not isinstance(split, dict):
+            raise ValueError("split must be an object")
+        for key in ("lower", "upper"):
+            if key not in split:
+                raise ValueError(f"split: missing '{key}' patch")
+        point = _setup_int("split", "point", split.get("point", 60), 1, 126)
+        sounds = [(split["lower"], 0, point, "split lower"), (split["upper"], point + 1, 127, "split upper")]
+    elif "layer" in setup:
+        layer = setup["layer"]
+        if not isinstance(layer, list) or not 1 <= len(layer) <= 16:
+            raise ValueError("A layer needs 1–16 patches")
+        sounds = [(patch, 0, 127, f"layer {n}") for n, patch in enumerate(layer, 1)]
+    else:
+        sounds = []
+    for n, (patch, low, high, where) in enumerate(sounds, 1):
+        parts[n] = {"part": n, "rx_channel": 1, "rx_switch": True, "patch": _resolve_patch(patch, where)}
+        zones[n] = {"zone": n, "enabled": True, "low": low, "high": high}
+    if sounds:
+        for n in range(len(sounds) + 1, 17):
+            zones[n] = {"zone": n, "enabled": False}
+        if setup.get("split", {}).get("lower_octave") is not None:
+            zones[1]["octave"] = _setup_int("split", "lower_octave", setup["split"]["lower_octave"], -3, 3)
+
+    for entry in _setup_list(setup, "parts"):
+        n = entry.get("part")
+        if not isinstance(n, int) or isinstance(n, bool) or not 1 <= n <= 16:
+            raise ValueError(f"Part must be 1–16, got {n!r}")
+        where = f"Part {n}"
+        part = parts.setdefault(n, {"part": n})
+        if entry.get("rx_channel") is not None:
+            part["rx_channel"] = _setup_int(where, "rx_channel", entry["rx_channel"], 1, 16)
+        if entry.get("rx_switch") is not None:
+            part["rx_switch"] = _setup_switch(where, "rx_switch", entry["rx_switch"])
+        if entry.get("patch") is not None:
+            part["patch"] = _resolve_patch(entry["patch"], where)
+    for entry in _setup_list(setup, "zones"):
+        n = entry.get("zone")
+        if not isinstance(n, int) or isinstance(n, bool) or not 1 <= n <= 16:
+            raise ValueError(f"Zone must be 1–16, got {n!r}")
+        where = f"Zone {n}"
+        zone = zones.setdefault(n, {"zone": n})
+        if entry.get("enabled") is not None:
+            zone["enabled"] = _setup_switch(where, "enabled", entry["enabled"])
+        if entry.get("octave") is not None:
+            zone["octave"] = _setup_int(where, "octave", entry["octave"], -3, 3)
+        for key in ("low", "high"):
+            if entry.get(key) is not None:
+                zone[key] = _setup_int(where, key, entry[key], 0, 127)
+    return {"parts": [parts[n] for n in sorted(parts)], "zones": [zones[n] for n in sorted(zones)]}
+
+def load_setup(path: str) -> dict:
+    """Reads a setup JSON file (see setup_state)."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            setup = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot read {path}: {e}")
+    if not isinstance(setup, dict):
+        raise ValueError(f"{path}: a setup is a JSON object")
+    return setup
+
+@_timed
+def apply_setup(setup: dict) -> int:
+    """Compiles a declarative setup and streams it in one pass; returns the number of DT1 frames sent."""
+    manager = _get_manager()
+    if not manager or not manager.is_connected:
+        raise GoRLibMIDIError("MIDI not connected")
+    return manager.recall_frames(compile_performance(setup_state(setup), manager.shadow))
+
+def _find_port(name: str | None) -> str | None:
+    """Exact port name, else the only port containing name (case-insensitive)."""
+    if name is None:
+        return None
+    ports = get_output_ports()
+    if name in ports:
+        return name
+    matches = [p for p in ports if name.lower() in p.lower()]
+    if len(matches) != 1:
+        raise GoRLibMIDIError(f"{'No' if not matches else 'More than one'} MIDI output port matches '{name}'")
+    return matches[0]
+
+def _connect(args):
+    init_midi_connection(_find_port(args.port))
+    if args.record:
+        start_recording(args.record)
+    if args.model == "auto":
+        model = detect_model()
+        if model is None:
+            raise GoRLibMIDIError("The keyboard did not answer (model detection)")
+    elif args.model:
+        _get_manager().model_id = bytes.fromhex(MODEL_IDS[args.model])
+    set_sysex_pacing(args.pacing)
+    if args.sync:
+        sync_from_device()
+
+def _cmd_ports(args):
+    print("Outputs:")
+    for i, name in enumerate(get_output_ports()):
+        print(f"  {i}: {name}")
+    print("Inputs:")
+    for i, name in enumerate(rtmidi.MidiIn().get_ports()):
+        print(f"  {i}: {name}")
+
+def _cmd_patch(args):
+    if len(args.patch) == 3 and all(v.isdigit() for v in args.patch):
+        patch = _resolve_patch([int(v) for v in args.patch])
+    else:
+        patch = _resolve_patch(" ".join(args.patch))
+    _connect(args)
+    if args.sysex:
+        part_patch_SysEx(args.zone, *patch)
+        if not args.no_enable:
+            with _get_manager().sysex_batch():
+                part_enable_SysEx(args.zone, True)
+                zone_enable_SysEx(args.zone, True)
+    else:
+        zone_patch(args.zone, *patch)
+        if not args.no_enable:
+            zone_enable(args.zone, True)
+    print(f"Zone {args.zone}: {patch[0]},{patch[1]},{patch[2]}")
+
+def _cmd_apply(args):
+    setup = load_setup(args.setup)
+    if args.out:
+        # Compile only: a standard .syx any SysEx librarian (or `recall`) can send
+        blob = compile_performance(setup_state(setup))
+        with open(args.out, 'wb') as f:
+            f.write(blob)
+        print(f"{len(_split_sysex(blob))} DT1 frames ({len(blob)} bytes) -> {args.out}")
+        return
+    _connect(args)
+    start = time.perf_counter()
+    sent = apply_setup(setup)
+    print(f"{sent} DT1 frames sent in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+def _cmd_recall(args):
+    _connect(args)
+    print(f"{recall_performance(args.name)} DT1 frames sent")
+
+def _cmd_replay(args):
+    _connect(args)
+    start = time.perf_counter()
+    sent = replay_recording(args.recording, args.timing)
+    print(f"{sent} messages replayed ({args.timing}) in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+def _cmd_dump(args):
+    started, records = read_recording(args.recording)
+    print(f"# {args.recording}: recorded {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(started))}, {len(records)} messages")
+    for t, incoming, data in records:
+        print(f"{t:12.6f}  {'IN ' if incoming else 'OUT'}  {data.hex(' ').upper()}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Control a Roland GO:PIANO / GO:KEYS without the GO:R UI.")
+    parser.add_argument('--port', help="MIDI output port (name or unique part of it; default: first port)")
+    parser.add_argument('--model', choices=list(MODEL_IDS) + ["auto"], help="SysEx model ID (default GP)")
+    parser.add_argument('--pacing', choices=("fixed", "verified"), default="fixed", help="DT1 pacing")
+    parser.add_argument('--sync', action='store_true', help="read the keyboard's state first and only send changes")
+    parser.add_argument('--record', metavar='FILE', help="log all MIDI traffic of the command to FILE (see replay, dump)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('ports', help="list MIDI ports").set_defaults(run=_cmd_ports)
+
+    patch = commands.add_parser('patch', help="send a patch to a zone")
+    patch.add_argument('zone', type=int, help="zone / part 1-16")
+    patch.add_argument('patch', nargs='+', help="MSB LSB PC, or a patch name")
+    patch.add_argument('--sysex', action='store_true', help="set the part by SysEx instead of bank select + PC")
+    patch.add_argument('--no-enable', action='store_true', help="do not switch the zone on")
+    patch.set_defaults(run=_cmd_patch)
+
+    apply = commands.add_parser('apply', help="apply a setup file (parts, zones, split, layer) in one pass")
+    apply.add_argument('setup', help="setup JSON file")
+    apply.add_argument('--out', help="only compile the setup to this .syx file")
+    apply.set_defaults(run=_cmd_apply)
+
+    recall = commands.add_parser('recall', help="recall a saved performance")
+    recall.add_argument('name')
+    recall.set_defaults(run=_cmd_recall)
+
+    replay = commands.add_parser('replay', help="send the outgoing traffic of a recording again")
+    replay.add_argument('recording', help="file written by --record (or the UI)")
+    replay.add_argument('--timing', choices=REPLAY_TIMINGS, default="original",
+                        help="recorded gaps, back to back, or back to back with the --pacing DT1 pacing")
+    replay.set_defaults(run=_cmd_replay)
+
+    dump = commands.add_parser('dump', help="print a recording as text")
+    dump.add_argument('recording')
+    dump.set_defaults(run=_cmd_dump)
+
+    args = parser.parse_args(argv)
+    try:
+        args.run(args)
+    except (GoRLibMIDIError, ValueError, OSError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if _midi_manager_instance:
+            recorder = _midi_manager_instance.stop_recording()
+            if recorder:
+                print(f"{recorder.messages} messages recorded -> {recorder.path}", file=sys.stderr)
+            _midi_manager_instance.close_port()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+# GoRPatches.py
+# Compiles patches.json into a compact binary index (patches.idx) that is memory-mapped at startup,
+# so the UI never has to parse the JSON on a cold start. The index is rebuilt automatically
+# whenever patches.json changes.
+import argparse, bisect, json, mmap, os, struct, sys
+from collections import Counter
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+JSON_PATH = os.path.join(SCRIPT_DIR, 'patches.json')
+INDEX_PATH = os.path.join(SCRIPT_DIR, 'patches.idx')
+
+# --- Index Layout (little endian) ---
+# header:    magic, version, source size, source mtime (ns), category count, patch count
+# category:  name, first patch record, patch count
+# patch:     bank MSB, bank LSB, PC, name (NUL padded)
+MAGIC = b'GoRP'
+VERSION = 1
+HEADER = struct.Struct('<4sHIqII')
+CATEGORY = struct.Struct('<16sII')
+PATCH = struct.Struct('<BBB21s')
+NAME_MAX = 21
+CATEGORY_MAX = 16
+
+# --- Custom exception
+class PatchIndexError(ValueError):
+    """Raised when patches.json is invalid or the index cannot be read"""
+    pass
+
+
+# --- Validation ---
+def _clip(text: str, size: int) -> bytes:
+    """text as UTF-8, cut to at most size bytes without splitting a character."""
+    return text.encode('utf-8')[:size].decode('utf-8', 'ignore').encode('utf-8')
+
+def _reject_duplicate_keys(warnings):
+    def hook(pairs):
+        keys = Counter(k for k, _ in pairs)
+        for key, count in keys.items():
+            if count > 1:
+                # json.load keeps the last value; make that visible instead of silent
+                kept = [v for k, v in pairs if k == key][-1]
+                warnings.append(f"Duplicate key '{key}' in {dict(pairs).get('name', 'object')!r}, using {kept!r}")
+        return dict(pairs)
+    return hook
+
+def load_patch_list(json_path=JSON_PATH):
+    """Parses and validates patches.json. Returns (patches, warnings); raises PatchIndexError on bad data."""
+    warnings = []
+    try:
+        with open(json_path, encoding='utf-8') as f:
+            data = json.load(f, object_pairs_hook=_reject_duplicate_keys(warnings))
+    except (OSError, json.JSONDecodeError) as e:
+        raise PatchIndexError(f"Cannot read {json_path}: {e}")
+
+    patches = data.get("FULL_LIST") if isinstance(data, dict) else None
+    if not isinstance(patches, list):
+        raise PatchIndexError("patches.json has no FULL_LIST array")
+
+    seen = {}
+    categories = {}  # stored (clipped) category name -> full name
+    for n, patch in enumerate(patches, 1):
+        pid = patch.get("id")
+        # PCs are numbered 1-128 as in the Roland sound lists
+        if not (isinstance(pid, list) and len(pid) == 3 and all(isinstance(v, int) for v in pid)
+                and 0 <= pid[0] <= 127 and 0 <= pid[1] <= 127 and 0 <= pid[2] <= 128):
+            raise PatchIndexError(f"Patch #{n} has an invalid id {pid!r} (expected [MSB 0-127, LSB 0-127, PC 0-128])")
+        if not isinstance(patch.get("name"), str) or not patch["name"]:
+            raise PatchIndexError(f"Patch #{n} {pid} has no name")
+        category = patch.get("category", "OTHER")
+        if not isinstance(category, str) or not category:
+            raise PatchIndexError(f"Patch #{n} '{patch['name']}' has an invalid category {category!r}")
+        stored = _clip(category, CATEGORY_MAX)
+        if stored not in categories:
+            categories[stored] = category
+            if len(stored) < len(category.encode('utf-8')):
+                warnings.append(f"Category '{category}' longer than {CATEGORY_MAX} bytes, truncated")
+        elif categories[stored] != category:
+            # Both would share one span in the index, mixing their patches
+            raise PatchIndexError(f"Categories '{categories[stored]}' and '{category}' are the same in their"
+                                  f" first {CATEGORY_MAX} bytes")
+        if len(patch["name"].encode('utf-8')) > NAME_MAX:
+            warnings.append(f"Patch #{n} name '{patch['name']}' longer than {NAME_MAX} bytes, truncated")
+        if tuple(pid) in seen:
+            warnings.append(f"Patch #{n} '{patch['name']}' reuses id {pid} of '{seen[tuple(pid)]}'")
+        seen.setdefault(tuple(pid), patch["name"])
+    return patches, warnings
+
+
+# --- Build ---
+def compile_index(patches, source_size=0, source_mtime_ns=0) -> bytes:
+    """Packs patches into the index format, grouped by category in order of first appearance."""
+    by_category = {}
+    for patch in patches:
+        by_category.setdefault(patch.get("category", "OTHER"), []).append(patch)
+
+    out = bytearray(HEADER.pack(MAGIC, VERSION, source_size, source_mtime_ns, len(by_category), len(patches)))
+    first = 0
+    for cat, members in by_category.items():
+        out += CATEGORY.pack(_clip(cat, CATEGORY_MAX), first, len(members))
+        first += len(members)
+    for members in by_category.values():
+        for patch in members:
+            out += PATCH.pack(*patch["id"], _clip(patch["name"], NAME_MAX))
+    return bytes(out)
+
+def build_index(json_path=JSON_PATH, index_path=INDEX_PATH) -> list:
+    """Validates patches.json and (re)writes the index file. Returns the validation warnings."""
+    stat = os.stat(json_path)
+    patches, warnings = load_patch_list(json_path)
+    blob = compile_index(patches, stat.st_size, stat.st_mtime_ns)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, index_path)
+    return warnings
+
+
+# --- Reader ---
+class PatchList:
+    """Read-only sequence of the patch records of one category, decoded on access."""
+
+    def __init__(self, index, first, count):
+        self._index = index
+        self._first = first
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("patch index out of range")
+        return self._index.patch(self._first + i)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._index.patch(self._first + i)
+
+class PatchIndex:
+    """Memory-mapped view of patches.idx. Only the small category table is decoded up front."""
+
+    def __init__(self, buffer):
+        self._buf = buffer
+        magic, version, self.source_size, self.source_mtime_ns, n_cat, self.patch_count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise PatchIndexError("Not a GO:R patch index (or an old version)")
+        self._records_at = HEADER.size + n_cat * CATEGORY.size
+        if len(buffer) != self._records_at + self.patch_count * PATCH.size:
+            raise PatchIndexError("Patch index is truncated")
+
+        self.categories = []       # category names in display order
+        self._category_span = {}   # name -> (first record, count)
+        self._category_starts = []  # first record of each category, for record -> category lookups
+        self._search = None
+        for i in range(n_cat):
+            name, first, count = CATEGORY.unpack_from(buffer, HEADER.size + i * CATEGORY.size)
+            name = name.rstrip(b'\0').decode('utf-8')
+            self.categories.append(name)
+            self._category_span[name] = (first, count)
+            self._category_starts.append(first)
+
+    @classmethod
+    def open(cls, index_path=INDEX_PATH):
+        with open(index_path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def is_stale(self, json_path=JSON_PATH) -> bool:
+        stat = os.stat(json_path)
+        return (stat.st_size, stat.st_mtime_ns) != (self.source_size, self.source_mtime_ns)
+
+    def patch(self, record: int) -> dict:
+        """Decodes one record (global number across all categories)."""
+        msb, lsb, pc, name = PATCH.unpack_from(self._buf, self._records_at + record * PATCH.size)
+        category = self.categories[bisect.bisect_right(self._category_starts, record) - 1]
+        return {"id": [msb, lsb, pc], "category": category, "name": name.rstrip(b'\0').decode('utf-8', 'replace'), "index": record}
+
+    def ids(self) -> list:
+        """(bank MSB, bank LSB, PC) of every record, in record order."""
+        return [PATCH.unpack_from(self._buf, self._records_at + record * PATCH.size)[:3]
+                for record in range(self.patch_count)]
+
+    def count(self, category: str) -> int:
+        return self._category_span.get(category, (0, 0))[1]
+
+    def patches(self, category: str) -> PatchList:
+        first, count = self._category_span.get(category, (0, 0))
+        return PatchList(self, first, count)
+
+    def __len__(self):
+        return self.patch_count
+
+    def __contains__(self, category):
+        return category in self._category_span
+
+    def search_index(self):
+        """The n-gram search index over all patch names, built on first use."""
+        if self._search is None:
+            self._search = PatchSearch([self.patch(i)["name"] for i in range(self.patch_count)])
+        return self._search
+
+    def search(self, query: str, limit: int = 50) -> list:
+        """Patch dicts matching query (substring first, then fuzzy), best first."""
+        return [self.patch(i) for i in self.search_index().search(query, limit)]
+
+# --- Search ---
+class PatchSearch:
+    """
+    Name search over the patch list. Every 1-, 2- and 3-gram of every (lower-cased) name maps to
+    the records containing it, so a query only ever scans the names sharing its rarest n-gram.
+    """
+
+    def __init__(self, names):
+        self.names = [name.lower() for name in names]
+        self.grams = {}  # n-gram -> tuple of record numbers (ascending)
+        postings = {}
+        for record, name in enumerate(self.names):
+            for n in (1, 2, 3):
+                for i in range(len(name) - n + 1):
+                    postings.setdefault(name[i:i + n], set()).add(record)
+        for gram, records in postings.items():
+            self.grams[gram] = tuple(sorted(records))
+
+    def _candidates(self, query):
+        n = min(3, len(query))
+        grams = {query[i:i + n] for i in range(len(query) - n + 1)}
+        return min((self.grams.get(g, ()) for g in grams), key=len)
+
+    def search(self, query: str, limit: int = 50) -> list:
+        """
+        Record numbers whose name contains query (prefix and word-start matches first),
+        followed by fuzzy matches: names containing the query letters in order.
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+        names = self.names
+
+        ranked = []
+        for record in self._candidates(query):
+            pos = names[record].find(query)
+            if pos >= 0:
+                word_start = pos == 0 or names[record][pos - 1] in " -/"
+                ranked.append((0 if pos == 0 else 1 if word_start else 2, pos, record))
+        ranked.sort()
+        hits = [record for _, _, record in ranked[:limit]]
+        if len(hits) >= limit:
+            return hits
+
+        # Fuzzy: all query letters in order; candidates must contain every letter
+        letters = set(query.replace(" ", ""))
+        candidates = set(min((self.grams.get(c, ()) for c in letters), key=len))
+        for c in letters:
+            candidates.intersection_update(self.grams.get(c, ()))
+        seen = set(hits)
+        fuzzy = []
+        for record in candidates - seen:
+            span = _subsequence_span(query.replace(" ", ""), names[record])
+            if span is not None:
+                fuzzy.append((span, record))
+        fuzzy.sort()
+        return hits + [record for _, record in fuzzy[:limit - len(hits)]]
+
+def _subsequence_span(query, name):
+    """Length of the shortest-from-first-letter window of name holding query in order, or None."""
+    start = pos = name.find(query[0])
+    if pos < 0:
+        return None
+    for c in query[1:]:
+        pos = name.find(c, pos + 1)
+        if pos < 0:
+            return None
+    return pos - start + 1
+
+
+def load(json_path=JSON_PATH, index_path=INDEX_PATH) -> PatchIndex:
+    """
+    Opens the patch index, rebuilding it first when it is missing or older than patches.json.
+    If the index cannot be written (read-only card) it is compiled in memory instead.
+    """
+    try:
+        index = PatchIndex.open(index_path)
+        if not index.is_stale(json_path):
+            return index
+    except (OSError, ValueError, struct.error):
+        pass
+
+    try:
+        for warning in build_index(json_path, index_path):
+            print(f"GoRPatches: {warning}", file=sys.stderr)
+        return PatchIndex.open(index_path)
+    except (OSError, ValueError, struct.error):
+        # Read-only card, or an index written by an older version that cannot be opened
+        stat = os.stat(json_path)
+        patches, _ = load_patch_list(json_path)
+        return PatchIndex(compile_index(patches, stat.st_size, stat.st_mtime_ns))
+
+
+# --- Command Line ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate patches.json and compile the GO:R patch index.")
+    parser.add_argument('--json', default=JSON_PATH, help="source patch list")
+    parser.add_argument('--out', default=INDEX_PATH, help="index file to write")
+    parser.add_argument('--check', action='store_true', help="only validate, do not write the index")
+    parser.add_argument('--strict', action='store_true', help="treat warnings as errors")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.check:
+            patches, warnings = load_patch_list(args.json)
+        else:
+            warnings = build_index(args.json, args.out)
+            patches = PatchIndex.open(args.out)
+    except PatchIndexError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    for warning in warnings:
+        print(f"WARNING: {warning}", file=sys.stderr)
+    print(f"{len(patches)} patches OK" + ("" if args.check else f" -> {args.out}"))
+    return 1 if args.strict and warnings else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
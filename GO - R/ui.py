@@ -1,43 +1,117 @@
-import sys, os, time, json, pygame
+import sys, os, time
+STARTUP_T0 = time.perf_counter()
+PROFILE_STARTUP = '--profile-startup' in sys.argv[1:]
+import threading
+from collections import OrderedDict
 from enum import Enum
+import pygame
+
+# ==================== STARTUP ====================
+# Only what the first frame needs runs before it. The MIDI backend and the patch index load on
+# background threads; the joystick and glyph warm-up run in the first idle moments after it.
+STARTUP_PHASES = []   # (where, phase, seconds)
+_phase_start = STARTUP_T0
+
+def startup_phase(name):
+    """Records the main-thread time since the previous phase."""
+    global _phase_start
+    now = time.perf_counter()
+    STARTUP_PHASES.append(("main", name, now - _phase_start))
+    _phase_start = now
+
+class Deferred:
+    """Runs func on a background thread from startup on; get() waits for its result."""
+
+    def __init__(self, name, func):
+        self.name = name
+        self._func = func
+        self._result = self._error = None
+        self._thread = threading.Thread(target=self._run, name=f"GO:R {name}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self._result = self._func()
+        except Exception as e:
+            self._error = e
+        STARTUP_PHASES.append(("background", self.name, time.perf_counter() - start))
+
+    def ready(self):
+        return not self._thread.is_alive()
+
+    def get(self):
+        self._thread.join()
+        if self._error:
+            raise self._error
+        return self._result
+
+startup_phase("python + pygame import")
 
 # ==================== MIDI ====================
-try:
-    import GoRLib
-    connect_midi = GoRLib.init_midi_connection
-    send_patch = GoRLib.zone_patch
-    get_ports = GoRLib.get_output_ports
-    enable_zone = GoRLib.zone_enable
-    MIDI_AVAILABLE = True
-except:
-    MIDI_AVAILABLE = False
-    def connect_midi(p): return False
-    def send_patch(*a): pass
-    def get_ports(): return ["MOCK_PORT_1", "MOCK_PORT_2"]
+# GoRLib (and with it rtmidi/ALSA) is imported in the background; midi_backend() waits for it
+GoRLib = None
+LATENCY = None
+MIDI_AVAILABLE = False
+
+def _load_midi_backend():
+    global GoRLib, LATENCY, MIDI_AVAILABLE
+    try:
+        import GoRLib as lib
+    except Exception:
+        return False
+    GoRLib, LATENCY, MIDI_AVAILABLE = lib, lib.LATENCY, True
+    return True
+
+_midi_backend = Deferred("MIDI backend import", _load_midi_backend)
+
+def midi_backend():
+    """True once GoRLib is loaded, False if it cannot be (mock ports). Blocks while it is loading."""
+    return _midi_backend.get()
+
+def connect_midi(p):
+    if not midi_backend():
+        return False
+    if not GoRLib.init_midi_connection(p, async_send=True):  # sends never block the UI
+        return False
+    GoRLib.set_receive_callback(on_midi_in)
+    return True
+
+def send_patch(zone, msb, lsb, pc, record=None):
+    # Library patches go out pre-encoded from the patch table once it is built
+    if record is not None and GoRLib.get_patch_table():
+        GoRLib.zone_patch_record(zone, record)
+    else:
+        GoRLib.zone_patch(zone, msb, lsb, pc)
+def enable_zone(zone, on=True): GoRLib.zone_enable(zone, on)
+def get_ports(): return GoRLib.get_output_ports() if midi_backend() else ["MOCK_PORT_1", "MOCK_PORT_2"]
 
 # ==================== PATCHES ====================
+import GoRPatches
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-with open(os.path.join(SCRIPT_DIR, 'patches.json')) as f:
-    data = json.load(f).get("FULL_LIST", [])
-PATCHES_BY_CATEGORY = {}
-CATEGORY_LIST = []
-for patch in data:
-    cat = patch.get("category", "OTHER")
-    if cat not in CATEGORY_LIST:
-        CATEGORY_LIST.append(cat)   
-    PATCHES_BY_CATEGORY.setdefault(cat, []).append(patch)
+_patch_index = Deferred("patch index", GoRPatches.load)  # memory-mapped patches.idx, rebuilt when patches.json changes
+
+def patch_index():
+    return _patch_index.get()
 
 # ==================== PYGAME ====================
-pygame.init()
+# Only the modules GO:R uses (pygame.init() would also bring up audio); joystick after first frame
+pygame.display.init()
+pygame.font.init()
 GScreenWidth, GScreenHeight = pygame.display.get_desktop_sizes()[0]
 screen = pygame.display.set_mode((GScreenWidth, GScreenHeight))
 pygame.display.set_caption('GO:R MIDI Selector')
+startup_phase("display init")
 
-FONT_PATH = pygame.font.match_font('dejavusansmono')
+# Checked before asking fontconfig: match_font shells out to fc-list, which is slow on SD cards
+FONT_FILES = ('/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf', '/usr/share/fonts/TTF/DejaVuSansMono.ttf',
+              '/usr/share/fonts/dejavu/DejaVuSansMono.ttf', '/usr/share/fonts/dejavu-sans-mono-fonts/DejaVuSansMono.ttf')
+FONT_PATH = next((f for f in FONT_FILES if os.path.exists(f)), None) or pygame.font.match_font('dejavusansmono')
 FONT_LARGE = pygame.font.Font(FONT_PATH, 36)
 FONT_MEDIUM = pygame.font.Font(FONT_PATH, 24)
 FONT_SMALL = pygame.font.Font(FONT_PATH, 18)
 FONT_DEBUG = pygame.font.Font(FONT_PATH, 14)
+startup_phase("fonts")
 
 COLOR_BG = (10, 10, 20)
 COLOR_ACCENT = (0, 150, 255)
@@ -50,9 +124,7 @@ COLOR_DEBUG = (255, 255, 0)
 HEADER_HEIGHT = 85
 CLOCK = pygame.time.Clock()
 
-pygame.joystick.init()
-joystick = pygame.joystick.Joystick(0) if pygame.joystick.get_count() > 0 else None
-if joystick: joystick.init()
+joystick = None  # opened by init_joystick() once the first frame is up
 
 # ==================== GLOBALS ====================
 
@@ -63,6 +135,12 @@ message_text = ""
 message_timer = 0
 SHOW_DEBUG = False
 DEBUG_MESSAGE = "Ready"
+last_midi_in = 0.0   # time.time() of the last message from the keyboard (header activity light)
+# Audition mode: patches go to AUDITION_ZONE (0 = off) as the selection moves, once it
+# has rested for AUDITION_DELAY_MS; anything skipped over while scrolling is never sent
+AUDITION_ZONE = 0
+AUDITION_DELAYS_MS = (0, 100, 150, 250, 400)
+AUDITION_DELAY_MS = 150
 
 
 # ==================== UTILITY FUNCTIONS ====================
@@ -70,6 +148,7 @@ DEBUG_MESSAGE = "Ready"
 def set_debug(msg):
     global DEBUG_MESSAGE
     DEBUG_MESSAGE = msg
+    if SHOW_DEBUG: request_redraw()
 
 class InputAction(Enum):
     UP = 1
@@ -83,6 +162,8 @@ class InputAction(Enum):
     ACTION_2 = 9   #X
     ACTION_3 = 10  #Y  
     EXIT = 11          
+    RECENT = 12    # Recent/favorite patches, from any screen
+    PREVIOUS = 13  # back to the previous patch, from any screen
 
 def decode_keystroke(e):
     """Convert pygame event → InputAction. Shows raw button numbers in debug overlay."""
@@ -107,6 +188,8 @@ def decode_keystroke(e):
             return InputAction.ACTION_1
         if e.key == pygame.K_BACKSPACE:
             return InputAction.BACK
+        if e.key == pygame.K_TAB:       return InputAction.RECENT
+        if e.key == pygame.K_BACKQUOTE: return InputAction.PREVIOUS
 
     # Gamepad — using YOUR exact mapping
     if joystick:
@@ -115,6 +198,8 @@ def decode_keystroke(e):
             if e.button == 4:   return InputAction.BACK        # B
             if e.button == 6:   return InputAction.ACTION_2    # X 
             if e.button == 5:  return InputAction.ACTION_3    # Y 
+            if e.button == 9:   return InputAction.RECENT      # Select
+            if e.button == 7:   return InputAction.PREVIOUS    # R
             if e.button == 10:  pygame.quit(); sys.exit()      # Start
 
         if e.type == pygame.JOYHATMOTION:
@@ -135,37 +220,161 @@ def decode_keystroke(e):
 
     return None
 
+def send_zone_patch(zone, msb, lsb, pc, record=None):
+    """Patch + enable for one zone; queued as a single job on the MIDI transmit thread."""
+    send_patch(zone, msb, lsb, pc, record)
+    enable_zone(zone, True)
+
+def sync_device_state():
+    """Reads the keyboard's part/zone state in the background so unchanged settings are not resent."""
+    def on_synced(future):
+        if future.exception():
+            set_debug(f"Device sync failed: {future.exception()}")
+            return
+        state = future.result()
+        if state is None:
+            set_debug("Device sync skipped: no MIDI input")
+        else:
+            set_debug(f"Device sync: {sum(p is not None for p in state['parts'])}/16 parts read")
+    GoRLib.submit(GoRLib.sync_from_device, callback=on_synced)
+
+PATCH_MEMORY = None  # GoRLib.PatchMemory (recent/favorite patches), loaded after the first frame
+
+def remember_patch(entry):
+    """Puts a GoRLib.PatchMemory entry at the top of the recent list (any thread; saved shortly after)."""
+    if PATCH_MEMORY:
+        PATCH_MEMORY.used(entry)
+
+def recall_entry(entry):
+    """Sends a recent/favorite patch from its stored messages; replaces a pending send to the same zone."""
+    def on_sent(future):
+        global GLastPatchSent
+        if future.cancelled():
+            return
+        if future.exception():
+            show_message(f"ERROR: {future.exception()}")
+            return
+        GLastPatchSent = entry['name']
+        remember_patch(entry)
+        show_message(f"{entry['name']} → Zone {entry['zone']}")
+    GoRLib.submit_latest(("zone", entry['zone']), GoRLib.recall_patch, entry, callback=on_sent)
+
+def recall_previous():
+    """One press back to the sound used before the current one (pressing again swaps back)."""
+    if midi_status != "Connected":
+        show_message("ERROR: Connect MIDI port first!")
+        return
+    entry = PATCH_MEMORY.previous() if PATCH_MEMORY else None
+    if entry is None:
+        show_message("No previous patch")
+        return
+    recall_entry(entry)
+
 # ==================== SCREEN DRAWING AND RENDER FUNCTIONS ====================
 
+TEXT_CACHE_SIZE = 512           # rendered text surfaces kept (LRU)
+_text_cache = OrderedDict()     # (text, font, color) -> Surface
+_frame_ops = []                 # draw calls of the frame being built
+_last_frame_ops = None          # draw calls currently on the display
+
+def render_text(text, font, color):
+    """font.render with a bounded LRU cache; unchanged labels are never re-rendered."""
+    key = (text, font, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surf
+
 def draw_text(text, font, color, x, y, align='left'):
-    surf = font.render(text, True, color)
+    surf = render_text(text, font, color)
     rect = surf.get_rect()
     if align == 'center': rect.centerx = x; rect.centery = y
     elif align == 'right': rect.right = x; rect.top = y
     else: rect.topleft = (x, y)
-    screen.blit(surf, rect)
+    _frame_ops.append(('blit', surf, tuple(rect)))
+
+def draw_rect(color, rect, border_radius=0):
+    _frame_ops.append(('rect', color, tuple(rect), border_radius))
+
+def draw_surface(surf, pos):
+    _frame_ops.append(('blit', surf, (*pos, *surf.get_size())))
+
+def _paint(op):
+    if op[0] == 'blit':
+        screen.blit(op[1], op[2][:2])
+    elif op[0] == 'strip':
+        screen.blit(op[1], op[2][:2], op[3])
+    elif op[0] == 'rect':
+        pygame.draw.rect(screen, op[1], op[2], border_radius=op[3])
+    else:
+        screen.fill(op[1])
+
+def _dirty_rects(old_ops, new_ops):
+    """Screen areas whose draw calls differ between two frames (None = whole screen)."""
+    if old_ops is None:
+        return None
+    changed = set(old_ops).symmetric_difference(new_ops)
+    if any(op[0] == 'fill' for op in changed):
+        return None
+    if [op for op in old_ops if op not in changed] != [op for op in new_ops if op not in changed]:
+        return None  # the same draws reordered or repeated: overlaps may now paint differently
+    return [pygame.Rect(op[2]) for op in changed]
 
 def draw_header():
-    pygame.draw.rect(screen, COLOR_SELECTED, (0, 0, GScreenWidth, HEADER_HEIGHT))
+    draw_rect(COLOR_SELECTED, (0, 0, GScreenWidth, HEADER_HEIGHT))
     draw_text("G O : R", FONT_LARGE, COLOR_WHITE, GScreenWidth//2, 20, 'center')
     status_color = COLOR_STATUS_OK if midi_status == "Connected" else COLOR_STATUS_FAIL
     name = CURRENT_MIDI_PORT_NAME.split(":", 1)[1].strip() if ":" in CURRENT_MIDI_PORT_NAME else CURRENT_MIDI_PORT_NAME
     draw_text(f"{midi_status} - {name}", FONT_SMALL, status_color, 20, 40)
     draw_text(f"Current Patch: {GLastPatchSent}", FONT_SMALL, COLOR_WHITE, 20, 60)
+    if time.time() - last_midi_in < MIDI_IN_LIGHT_SECONDS:
+        draw_text("MIDI IN", FONT_SMALL, COLOR_STATUS_OK, GScreenWidth-20, 40, 'right')
 
 def draw_button_helper(text):
     draw_text(text, FONT_SMALL, COLOR_ACCENT, GScreenWidth//2, GScreenHeight-10, 'center')
 
+LATENCY_OVERLAY_STAGES = ("event_wait", "handler", "input_to_send", "send", "sleep", "frame")
+_latency_lines = ([], 0.0)  # (overlay lines, time computed)
+
+def latency_overlay_lines():
+    """Percentile lines for the debug overlay, recomputed at most twice a second."""
+    global _latency_lines
+    lines, computed = _latency_lines
+    if time.time() - computed > 0.5:
+        lines = []
+        for stage in LATENCY_OVERLAY_STAGES:
+            row = LATENCY.summary(stage)
+            if row:
+                lines.append(f"{stage:<13} n={row['count']:<6} p50 {row['p50']:7.2f}  p95 {row['p95']:7.2f}  p99 {row['p99']:7.2f}  max {row['max']:7.2f} ms")
+        _latency_lines = (lines, time.time())
+    return lines
+
 def draw_debug_overlay():
     if not SHOW_DEBUG: return
-    pygame.draw.rect(screen, COLOR_BG, (0, GScreenHeight-55, GScreenWidth, 20))
+    if LATENCY:
+        lines = latency_overlay_lines()
+        y = GScreenHeight - 55 - 16*len(lines)
+        draw_rect(COLOR_BG, (0, y, GScreenWidth, 16*len(lines)))
+        for line in lines:
+            draw_text(line, FONT_DEBUG, COLOR_DEBUG, 5, y)
+            y += 16
+    draw_rect(COLOR_BG, (0, GScreenHeight-55, GScreenWidth, 20))
     draw_text(f"DEBUG: {DEBUG_MESSAGE}", FONT_DEBUG, COLOR_DEBUG, 5, GScreenHeight-35)
 
+_message_overlay = None
+
 def draw_show_message():
+    global _message_overlay
     if message_text and time.time() < message_timer:
-        overlay = pygame.Surface((GScreenWidth, 50), pygame.SRCALPHA)
-        overlay.fill((50,50,50,180))
-        screen.blit(overlay, (0, GScreenHeight//2-25))
+        if _message_overlay is None:
+            _message_overlay = pygame.Surface((GScreenWidth, 50), pygame.SRCALPHA)
+            _message_overlay.fill((50,50,50,180))
+        draw_surface(_message_overlay, (0, GScreenHeight//2-25))
 
         msg_upper = message_text.upper()
         if any(error in msg_upper for error in ["ERROR", "FAILED", "FIRST"]):
@@ -181,9 +390,122 @@ def show_message(text, duration=2):
     global message_text, message_timer
     message_text = text
     message_timer = time.time() + duration
+    request_redraw()
+
+# ==================== SCHEDULING ====================
+# The main loop sleeps until input arrives, a timed element on screen (message, MIDI IN
+# light, debug stats) changes, or another thread calls request_redraw().
+REDRAW_EVENT = pygame.USEREVENT + 1
+BURST_FPS = 60              # frame rate while scrolling/animating
+BURST_SECONDS = 0.3         # how long each input keeps the burst going
+IDLE_WAIT_MS = 5000         # longest sleep with nothing scheduled
+MIDI_IN_LIGHT_SECONDS = 0.15
+# SDL only truly blocks in pygame.event.wait on these video drivers; elsewhere (KMSDRM on
+# handhelds, dummy) it spins on 1 ms sleeps, so there input is polled every INPUT_POLL_MS
+BLOCKING_WAIT = pygame.display.get_driver() in ('x11', 'wayland', 'windows', 'cocoa')
+INPUT_POLL_MS = 33          # same input latency as the old 30 FPS loop
+_wake = threading.Event()
+burst_until = 0.0
+
+def request_redraw():
+    """Wakes the main loop for a new frame; safe to call from MIDI threads."""
+    if not _wake.is_set():
+        _wake.set()
+        if BLOCKING_WAIT:
+            pygame.event.post(pygame.event.Event(REDRAW_EVENT))
+
+def wait_for_events(timeout_ms):
+    """Blocks up to timeout_ms for input or a request_redraw() and returns the queued events."""
+    if BLOCKING_WAIT:
+        return [pygame.event.wait(timeout_ms)] + pygame.event.get()
+    deadline = time.perf_counter() + timeout_ms / 1000
+    while True:
+        events = pygame.event.get()
+        remaining = deadline - time.perf_counter()
+        if events or remaining <= 0 or _wake.is_set():
+            return events
+        _wake.wait(min(remaining, INPUT_POLL_MS / 1000))
+
+# Holding UP/DOWN repeats it: after REPEAT_DELAY_MS every REPEAT_START_MS, each interval
+# REPEAT_ACCEL times the one before, down to REPEAT_MIN_MS
+REPEAT_DELAY_MS = 300
+REPEAT_START_MS = 120
+REPEAT_MIN_MS = 20
+REPEAT_ACCEL = 0.85
+REPEAT_MAX_PER_FRAME = 3
+_held = None  # [action, next repeat (perf_counter), interval (s)] while UP/DOWN is held
+
+def track_held(e, action):
+    """Starts/stops the UP/DOWN repeat from the press and release events."""
+    global _held
+    if action in (InputAction.UP, InputAction.DOWN):
+        _held = [action, time.perf_counter() + REPEAT_DELAY_MS / 1000, REPEAT_START_MS / 1000]
+    elif _held and (e.type == pygame.KEYUP and e.key in (pygame.K_UP, pygame.K_DOWN)
+                    or e.type == pygame.JOYHATMOTION and e.value[1] == 0
+                    or e.type == pygame.JOYAXISMOTION and e.axis == 1 and abs(e.value) <= 0.5):
+        _held = None
+
+def held_repeats():
+    """The held action once for every repeat now due (at most REPEAT_MAX_PER_FRAME)."""
+    if not _held:
+        return []
+    now = time.perf_counter()
+    due = []
+    while _held[1] <= now and len(due) < REPEAT_MAX_PER_FRAME:
+        due.append(_held[0])
+        _held[2] = max(REPEAT_MIN_MS / 1000, _held[2] * REPEAT_ACCEL)
+        _held[1] += _held[2]
+    _held[1] = max(_held[1], now)  # a slow frame does not queue up a burst of catch-up steps
+    return due
+
+def request_burst(seconds=BURST_SECONDS):
+    """Renders at BURST_FPS for the next few seconds (animations, held scrolling)."""
+    global burst_until
+    burst_until = max(burst_until, time.perf_counter() + seconds)
+
+_ports_changed = threading.Event()  # set by the port watcher, handled by the main loop
+
+def on_port_event(event, port):
+    """Port watcher callback (watcher thread): port list changes and keyboard hot-plug."""
+    global midi_status, CURRENT_MIDI_PORT_NAME
+    if event == "ports":
+        _ports_changed.set()  # screens are only touched on the pygame thread (see apply_port_changes)
+    elif event == "lost":
+        midi_status = "Reconnecting"
+        show_message("ERROR: MIDI port lost - waiting for the keyboard", 3)
+    elif event == "reconnected":
+        midi_status = "Connected"
+        CURRENT_MIDI_PORT_NAME = port
+        show_message("MIDI reconnected, state restored")
+    elif event == "failed":
+        show_message(f"Reconnect FAILED: {port}")
+    request_redraw()
+
+def on_midi_in(message):
+    # rtmidi thread: messages are captured by GoRLib's InputRing, this only wakes the loop
+    global last_midi_in
+    last_midi_in = time.time()
+    request_redraw()
+
+def next_wait_ms():
+    """How long the main loop may sleep before something on screen is due to change."""
+    if time.perf_counter() < burst_until or _held:
+        return 1000 // BURST_FPS
+    now = time.time()
+    deadlines = [t for t in (message_timer if message_text else 0, last_midi_in + MIDI_IN_LIGHT_SECONDS) if t > now]
+    if SHOW_DEBUG and LATENCY:
+        deadlines.append(now + 0.5)  # latency stats refresh
+    if isinstance(current, MidiMonitorScreen) and now - last_midi_in < MONITOR_RATE_WINDOW + 0.5:
+        deadlines.append(now + 0.25)  # message rate winding down
+    if not deadlines:
+        return IDLE_WAIT_MS
+    return max(1, min(IDLE_WAIT_MS, int((min(deadlines) - now) * 1000) + 1))
 
 def render_screen():
-    screen.fill(COLOR_BG)
+    """Builds the frame's draw calls and repaints only if they changed since the last frame."""
+    global _frame_ops, _last_frame_ops
+    start = time.perf_counter()
+    _frame_ops = [('fill', COLOR_BG)]
     draw_header()
     current.draw()
 
@@ -191,8 +513,123 @@ def render_screen():
 
     draw_debug_overlay()
 
-    pygame.display.flip()
-    CLOCK.tick(30) #FPS
+    if _frame_ops != _last_frame_ops:
+        dirty = _dirty_rects(_last_frame_ops, _frame_ops)
+        for op in _frame_ops:
+            _paint(op)
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+        _last_frame_ops = _frame_ops
+        if LATENCY: LATENCY.record("frame", time.perf_counter() - start)
+    CLOCK.tick(BURST_FPS)  # caps the frame rate when input floods in
+
+# ==================== SCROLL LIST ====================
+
+STRIP_ROWS = 16          # rows rendered together into one strip surface
+STRIP_CACHE_SIZE = 24    # strips kept (LRU), shared by every list
+SCROLL_RATE = 18.0       # how fast the view catches up with the selection (1/s)
+_strip_cache = OrderedDict()  # (list key, font, color, strip number) -> Surface
+
+class ScrollList:
+    """
+    Virtualized menu list. Rows are rendered STRIP_ROWS at a time into strip surfaces (cached
+    across screens under `key`), and a frame only blits the visible sub-rectangles of one or two
+    strips plus the highlighted row, however long the list is. The view follows the selection
+    pixel by pixel instead of jumping a row at a time.
+
+    Row geometry is relative to the row's top: text at (text_x, text_dy), highlight box at
+    (highlight_x, highlight_dy) sized highlight_size.
+    """
+
+    def __init__(self, key, count, label, top, rows, row_height, anchor, text_x, text_dy,
+                 highlight_x, highlight_dy, highlight_size, highlight_color=COLOR_ACCENT, radius=5,
+                 font=FONT_MEDIUM, color=COLOR_WHITE, selected_color=COLOR_BG, selected_label=None):
+        self.key = key
+        self.count = count
+        self.label = label                      # row number -> text
+        self.selected_label = selected_label or label
+        self.top = top
+        self.rows = rows                        # rows in view
+        self.row_height = row_height
+        self.anchor = anchor                    # view row the selection is kept on while it can be
+        self.text_x, self.text_dy = text_x, text_dy
+        self.highlight = (highlight_x, highlight_dy, *highlight_size)
+        self.highlight_color, self.radius = highlight_color, radius
+        self.font, self.color, self.selected_color = font, color, selected_color
+        # Text can reach past the bottom of its row; strip rows start that much lower so each
+        # holds all of its own text and none of its neighbour's
+        ink = font.render("Ag|[y_", True, color).get_bounding_rect()
+        self.shift = max(0, min(text_dy + ink.bottom - row_height, text_dy + ink.top))
+        self.offset = None   # list pixel at the top of the view
+        self._drawn_at = 0.0
+
+    def _strip(self, n):
+        cache_key = (self.key, self.font, self.color, n)
+        surf = _strip_cache.get(cache_key)
+        if surf is None:
+            first = n * STRIP_ROWS
+            rows = [self.font.render(self.label(i), True, self.color)
+                    for i in range(first, min(self.count, first + STRIP_ROWS))]
+            surf = pygame.Surface((max(r.get_width() for r in rows), len(rows) * self.row_height), pygame.SRCALPHA)
+            for i, row in enumerate(rows):
+                surf.blit(row, (0, i * self.row_height + self.text_dy - self.shift))
+            _strip_cache[cache_key] = surf
+            if len(_strip_cache) > STRIP_CACHE_SIZE:
+                _strip_cache.popitem(last=False)
+        else:
+            _strip_cache.move_to_end(cache_key)
+        return surf
+
+    def prerender(self, selected=0):
+        """Renders the strips around selected ahead of the first frame."""
+        if not self.count:
+            return
+        n = selected // STRIP_ROWS
+        for i in range(max(0, n - 1), min(n + 2, (self.count - 1) // STRIP_ROWS + 1)):
+            self._strip(i)
+
+    def _blit_rows(self, y0, y1, offset):
+        """Queues the part of the list between list pixels y0 and y1."""
+        height = STRIP_ROWS * self.row_height
+        last = (self.count - 1) // STRIP_ROWS
+        for n in range(max(0, y0 // height), min(last, (y1 - 1) // height) + 1):
+            start = n * height
+            a = max(y0, start)
+            b = min(y1, start + (STRIP_ROWS if n < last else self.count - n * STRIP_ROWS) * self.row_height)
+            if a < b:
+                surf = self._strip(n)
+                area = (0, a - start, surf.get_width(), b - a)
+                _frame_ops.append(('strip', surf, (self.text_x, self.top + self.shift + a - offset, area[2], area[3]), area))
+
+    def draw(self, selected):
+        if not self.count:
+            return
+        rh = self.row_height
+        view = self.rows * rh
+        selected_y = selected * rh
+        target = max(0, min(selected - self.anchor, self.count - self.rows)) * rh
+        now = time.perf_counter()
+        if self.offset is None:
+            self.offset = float(target)
+        elif abs(target - self.offset) > 0.5:
+            dt = min(now - self._drawn_at, 1 / BURST_FPS)  # after an idle wait, move one frame's worth
+            self.offset += (target - self.offset) * min(1.0, dt * SCROLL_RATE)
+            request_burst(1 / BURST_FPS)
+        else:
+            self.offset = float(target)
+        # The highlighted row is always fully in view, however far the animation has to go
+        self.offset = max(selected_y + rh - view, min(selected_y, self.offset))
+        self._drawn_at = now
+        offset = round(self.offset)
+
+        hx, hdy, hw, hh = self.highlight
+        y = self.top + selected_y - offset
+        draw_rect(self.highlight_color, (hx, y + hdy, hw, hh), border_radius=self.radius)
+        self._blit_rows(offset, selected_y, offset)
+        self._blit_rows(selected_y + rh, offset + view, offset)
+        draw_text(self.selected_label(selected), self.font, self.selected_color, self.text_x, y + self.text_dy)
 
 # ==================== MENU BASE ====================
 
@@ -206,7 +643,14 @@ class MenuScreen:
 
 class MainMenu(MenuScreen):
     
-    OPTIONS = ["Select MIDI Port", "Patches", "Zones", "Performances", "Settings", "Exit"]
+    OPTIONS = ["Select MIDI Port", "Patches", "Search Patches", "Recent & Favorites", "Zones", "Performances", "Setlists", "MIDI Monitor", "Settings", "Exit"]
+    ROWS = 8
+
+    def __init__(self):
+        super().__init__()
+        self.list = ScrollList("main menu", len(self.OPTIONS), self.OPTIONS.__getitem__, HEADER_HEIGHT+15, self.ROWS, 45,
+                               anchor=self.ROWS-1, text_x=70, text_dy=10, highlight_x=50, highlight_dy=0,
+                               highlight_size=(GScreenWidth-100, 45), selected_label=lambda i: f"> {self.OPTIONS[i]} <")
     
     def handle(self, action):
         set_debug(f"MainMenu | sel:{self.selected_menu_index} | key:{action}")
@@ -221,46 +665,49 @@ class MainMenu(MenuScreen):
                     show_message("ERROR: Connect MIDI port first!")
                     return self
                 return CategorySelectionScreen()
-            if i==2: return ZoneManagementScreen()
-            if i==3: return PerformanceMangementScreen()
-            if i==4: return SettingsScreen()
-            if i==5: return "exit"
+            if i==2: return SearchScreen()
+            if i==3: return RecentPatchesScreen(self)
+            if i==4: return ZoneManagementScreen()
+            if i==5: return PerformanceMangementScreen()
+            if i==6: return SetlistScreen()
+            if i==7: return MidiMonitorScreen()
+            if i==8: return SettingsScreen()
+            if i==9: return "exit"
         if action==InputAction.BACK: return "exit"
 
         return self
     
     def draw(self):
         #draw_header()
-        
-        y = HEADER_HEIGHT + 25
-        
-        for i, opt in enumerate(self.OPTIONS):
-            y_pos = y + i*50
-            if i == self.selected_menu_index:
-                pygame.draw.rect(screen, COLOR_ACCENT, (50, y_pos-10, GScreenWidth-100, 50), border_radius=5)
-                draw_text(f"> {opt} <", FONT_MEDIUM, COLOR_BG, 70, y_pos)
-            else:
-                draw_text(opt, FONT_MEDIUM, COLOR_WHITE, 70, y_pos)
-        
+        self.list.draw(self.selected_menu_index)
         draw_button_helper("A: Select | B/Esc: Back/Exit | START: Exit")
 
 class MidiSelectionScreen(MenuScreen):
 
     def on_enter(self):
-        self.ports = get_ports()
         self.selected_menu_index = 0
+        self.refresh()
+
+    def refresh(self):
+        """Re-reads the port list (instant once the port watcher keeps it cached)."""
+        self.ports = get_ports()
+        self.selected_menu_index = min(self.selected_menu_index, max(0, len(self.ports)-1))
+        self.list = ScrollList(("ports", tuple(self.ports)), len(self.ports), self.ports.__getitem__, 145, 8, 40,
+                               anchor=4, text_x=70, text_dy=12, highlight_x=50, highlight_dy=0,
+                               highlight_size=(GScreenWidth-100, 40))
     
     def handle(self, action):
         set_debug(f"MidiMenu | sel:{self.selected_menu_index}/{len(self.ports)} | key:{action}")
         if action==InputAction.UP:   self.selected_menu_index = max(0, self.selected_menu_index-1)
         if action==InputAction.DOWN: self.selected_menu_index = min(len(self.ports)-1, self.selected_menu_index+1)
         if action==InputAction.BACK: return MainMenu()
-        if action==InputAction.ACTION_1:
+        if action==InputAction.ACTION_1 and self.ports:
             global midi_status, CURRENT_MIDI_PORT_NAME
             if connect_midi(self.ports[self.selected_menu_index]):
                 midi_status = "Connected"
                 CURRENT_MIDI_PORT_NAME = self.ports[self.selected_menu_index]
                 show_message("Connected!")
+                sync_device_state()
             else:
                 show_message("Connection FAILED!")
             return MainMenu()
@@ -272,25 +719,28 @@ class MidiSelectionScreen(MenuScreen):
         if not self.ports:
             draw_text("No MIDI Output Ports Found.", FONT_MEDIUM, COLOR_STATUS_FAIL, GScreenWidth//2, 200, 'center')
         else:
-            start = max(0, self.selected_menu_index - 4)
-            for i in range(start, min(start+8, len(self.ports))):
-                y = 150 + (i-start)*40
-                if i == self.selected_menu_index:
-                    pygame.draw.rect(screen, COLOR_ACCENT, (50, y-5, GScreenWidth-100, 40), border_radius=5)
-                    draw_text(self.ports[i], FONT_MEDIUM, COLOR_BG, 70, y+7)
-                else:
-                    draw_text(self.ports[i], FONT_MEDIUM, COLOR_WHITE, 70, y+7)
+            self.list.draw(self.selected_menu_index)
         draw_button_helper("A: Connect | B: Back")
 
+def category_list():
+    index = patch_index()
+    label = lambda i: f"{index.categories[i]}  ({index.count(index.categories[i])} patches)"
+    return ScrollList("categories", len(index.categories), label, 145, 10, 26, anchor=5, text_x=70, text_dy=3,
+                      highlight_x=50, highlight_dy=0, highlight_size=(GScreenWidth-100, 31), radius=8)
+
 class CategorySelectionScreen(MenuScreen):
 
+    def on_enter(self):
+        self.categories = patch_index().categories
+        self.list = category_list()
+
     def handle(self, action):
-        set_debug(f"CategoryMenu | sel:{self.selected_menu_index}/{len(CATEGORY_LIST)} | key:{action}")
+        set_debug(f"CategoryMenu | sel:{self.selected_menu_index}/{len(self.categories)} | key:{action}")
         
         if action==InputAction.UP:   self.selected_menu_index = max(0, self.selected_menu_index-1)
-        if action==InputAction.DOWN: self.selected_menu_index = min(len(CATEGORY_LIST)-1, self.selected_menu_index+1)
+        if action==InputAction.DOWN: self.selected_menu_index = min(len(self.categories)-1, self.selected_menu_index+1)
         if action==InputAction.BACK: return MainMenu()
-        if action==InputAction.ACTION_1: return PatchSelectionScreen(CATEGORY_LIST[self.selected_menu_index])
+        if action==InputAction.ACTION_1: return PatchSelectionScreen(self.categories[self.selected_menu_index])
 
         return self
     
@@ -298,16 +748,7 @@ class CategorySelectionScreen(MenuScreen):
         #draw_header()
         draw_text("Select Patch Category:", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 105, 'center')
 
-        start = max(0, self.selected_menu_index - 5)
-        for i in range(start, min(start+10, len(CATEGORY_LIST))):
-            cat = CATEGORY_LIST[i]
-            cnt = len(PATCHES_BY_CATEGORY.get(cat, []))
-            y = 140 + (i-start)*26
-            if i == self.selected_menu_index:
-                pygame.draw.rect(screen, COLOR_ACCENT, (50, y+5, GScreenWidth-100, 31), border_radius=8)
-                draw_text(f"{cat}  ({cnt} patches)", FONT_MEDIUM, COLOR_BG, 70, y+8)
-            else:
-                draw_text(f"{cat}  ({cnt} patches)", FONT_MEDIUM, COLOR_WHITE, 70, y+8)
+        self.list.draw(self.selected_menu_index)
 
         draw_button_helper("A: Enter Category | B: Back")
 
@@ -315,14 +756,40 @@ class PatchSelectionScreen(MenuScreen):
     def __init__(self, category):
         super().__init__()
         self.category = category
-        self.patches = PATCHES_BY_CATEGORY[category]
+        self.patches = patch_index().patches(category)
         self.zone_input_mode = False
         self.zone_input = ""  
-
-    def send_to_zone(self, patch, zone):
-        global GLastPatchSent
+        self.list = ScrollList(("patches", category), len(self.patches), self.row_label, 110, 12, 26, anchor=6,
+                               text_x=40, text_dy=2, highlight_x=20, highlight_dy=0, highlight_size=(GScreenWidth-40, 26),
+                               highlight_color=COLOR_SELECTED, radius=3, selected_color=COLOR_ACCENT)
+        self.list.prerender()
+
+    def row_label(self, i):
+        p = self.patches[i]
+        return f"{i + 1:03d}. [{p['id'][0]:02d},{p['id'][1]:02d},{p['id'][2]:03d}] {p['name']}"
+
+    def send_to_zone(self, patch, zone, delay=0.0, remember=True):
+        """
+        Sends patch to zone; a newer send to the same zone replaces this one if it has not gone out yet.
+        Unless remember is False (audition), it goes on the recent patches list once sent.
+        """
         msb, lsb, pc = patch['id']
 
+        def on_sent(future):
+            # Runs on the MIDI transmit thread once the messages are out
+            global GLastPatchSent
+            if future.cancelled():  # superseded by a newer selection
+                return
+            try:
+                future.result()
+            except Exception as e:
+                show_message(f"ERROR: {e}")
+                return
+            GLastPatchSent = patch['name']
+            if remember:
+                remember_patch(GoRLib.PatchMemory.entry(patch['name'], patch['id'], zone))
+            show_message(f"{patch['name']} → Zone {zone}")
+
         try:
             #time.sleep(0.5)
 
@@ -353,15 +820,11 @@ class PatchSelectionScreen(MenuScreen):
 
 
 
-            send_patch(zone, msb, lsb, pc)
-            GoRLib.zone_enable(zone, True)
+            GoRLib.submit_latest(("zone", zone), send_zone_patch, zone, msb, lsb, pc, patch.get('index'), delay=delay, callback=on_sent)
             #if(zone == 1):
             #    GoRLib.zone_key_range(zone, 0, 63)
             #else:
             #   GoRLib.zone_key_range(zone, 64, 127)
-
-            GLastPatchSent = patch['name']
-            show_message(f"{patch['name']} → Zone {zone}")
         except Exception as e:
             show_message(f"ERROR: {e}")                   
         
@@ -397,6 +860,7 @@ class PatchSelectionScreen(MenuScreen):
             return self
 
         # — Normal navigation —
+        previous_index = self.selected_menu_index
         if action == InputAction.UP:
             self.selected_menu_index = max(0, self.selected_menu_index - 1)
         elif action == InputAction.DOWN:
@@ -411,6 +875,9 @@ class PatchSelectionScreen(MenuScreen):
         if midi_status != "Connected":
             return self
 
+        if AUDITION_ZONE and self.selected_menu_index != previous_index:
+            self.send_to_zone(self.patches[self.selected_menu_index], AUDITION_ZONE, AUDITION_DELAY_MS / 1000, remember=False)
+
         # — A button: Ask for zone 1-16 —
         if action == InputAction.ACTION_1:
             self.zone_input_mode = True
@@ -428,25 +895,190 @@ class PatchSelectionScreen(MenuScreen):
         return self
 
     def draw(self):
-        draw_header()
-        start = max(0, self.selected_menu_index - 6)
-        for i in range(start, min(start+12, len(self.patches))):
+        self.list.draw(self.selected_menu_index)
+
+        # Dynamic helper text
+        if self.zone_input_mode:
+            zone = self.zone_input or "1"
+            draw_button_helper(f"Select Zone (1-16): {zone:>2}   ↑↓=Change   A=Send   B=Cancel")
+        elif AUDITION_ZONE:
+            draw_button_helper(f"Audition → Zone {AUDITION_ZONE} | A: Select Zone | X: To Zone 1 | Y: To Zone 2 | B: Back")
+        else:
+            draw_button_helper("A: Select Zone | X: To Zone 1 | Y: To Zone 2 | B: Back")
+
+# Characters the d-pad cycles through; "" = no character chosen yet
+SEARCH_CHARSET = [""] + list("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 +-.&'")
+
+class SearchScreen(PatchSelectionScreen):
+    """
+    Incremental search over every patch name. Editing: UP/DOWN pick the character at the
+    cursor (results follow live), RIGHT keeps it, LEFT deletes, A moves into the results.
+    X/Y send the highlighted result straight to zone 1/2.
+    """
+
+    def __init__(self):
+        MenuScreen.__init__(self)
+        self.category = "SEARCH"
+        self.patches = []
+        self.zone_input_mode = False
+        self.zone_input = ""
+        self.query = ""
+        self.char_index = 0
+        self.browse = False
+
+    def on_enter(self):
+        patch_index().search_index()  # built once here so no keystroke pays for it
+
+    def full_query(self):
+        return self.query + SEARCH_CHARSET[self.char_index]
+
+    def refresh(self):
+        self.patches = patch_index().search(self.full_query(), limit=100)
+        self.selected_menu_index = 0
+
+    def handle_key(self, e):
+        """Typing on a real keyboard edits the query directly. True if the key was consumed."""
+        if self.browse or self.zone_input_mode:
+            return False
+        if e.key == pygame.K_BACKSPACE:
+            self.char_index = 0
+            self.query = self.query[:-1]
+        elif e.unicode and e.unicode.upper() in SEARCH_CHARSET[1:]:
+            self.char_index = 0
+            self.query += e.unicode.upper()
+        else:
+            return False
+        self.refresh()
+        return True
+
+    def handle(self, action):
+        set_debug(f"Search | '{self.full_query()}' | {len(self.patches)} hits | key:{action}")
+
+        if self.zone_input_mode or (self.browse and action in (InputAction.UP, InputAction.DOWN, InputAction.LEFT, InputAction.RIGHT, InputAction.ACTION_1)):
+            return super().handle(action)
+
+        if action in (InputAction.ACTION_2, InputAction.ACTION_3):
+            if not self.patches:
+                return self
+            if midi_status != "Connected":
+                show_message("ERROR: Connect MIDI port first!")
+                return self
+            self.send_to_zone(self.patches[self.selected_menu_index], 1 if action == InputAction.ACTION_2 else 2)
+            return self
+
+        if self.browse:
+            if action == InputAction.BACK:
+                self.browse = False
+            return self
+
+        if action == InputAction.UP:
+            self.char_index = (self.char_index + 1) % len(SEARCH_CHARSET)
+        elif action == InputAction.DOWN:
+            self.char_index = (self.char_index - 1) % len(SEARCH_CHARSET)
+        elif action == InputAction.RIGHT:
+            self.query = self.full_query()
+            self.char_index = 0
+        elif action == InputAction.LEFT:
+            if self.char_index:
+                self.char_index = 0
+            else:
+                self.query = self.query[:-1]
+        elif action == InputAction.ACTION_1:
+            self.browse = bool(self.patches)
+            return self
+        elif action == InputAction.BACK:
+            return MainMenu()
+        else:
+            return self
+        self.refresh()
+        return self
+
+    def draw(self):
+        cursor = SEARCH_CHARSET[self.char_index] or "_"
+        draw_text(f"Search: {self.query}[{cursor}]", FONT_MEDIUM, COLOR_WHITE if not self.browse else COLOR_ACCENT, 40, 95)
+
+        start = max(0, self.selected_menu_index - 5)
+        for i in range(start, min(start+10, len(self.patches))):
             p = self.patches[i]
-            actual_idx = start + i
-            txt = f"{actual_idx + 1:03d}. [{p['id'][0]:02d},{p['id'][1]:02d},{p['id'][2]:03d}] {p['name']}"
-            y = 110 + (i-start)*26
-            if i == self.selected_menu_index:
-                pygame.draw.rect(screen, COLOR_SELECTED, (20, y, GScreenWidth-40, 26), border_radius=3)
+            txt = f"[{p['id'][0]:02d},{p['id'][1]:02d},{p['id'][2]:03d}] {p['name']}  {p['category']}"
+            y = 130 + (i-start)*26
+            if self.browse and i == self.selected_menu_index:
+                draw_rect(COLOR_SELECTED, (20, y, GScreenWidth-40, 26), border_radius=3)
                 draw_text(txt, FONT_MEDIUM, COLOR_ACCENT, 40, y+2)
             else:
                 draw_text(txt, FONT_MEDIUM, COLOR_WHITE, 40, y+2)
+        if self.full_query() and not self.patches:
+            draw_text("No matching patches", FONT_MEDIUM, COLOR_STATUS_FAIL, GScreenWidth//2, 200, 'center')
 
-        # Dynamic helper text
         if self.zone_input_mode:
             zone = self.zone_input or "1"
             draw_button_helper(f"Select Zone (1-16): {zone:>2}   ↑↓=Change   A=Send   B=Cancel")
+        elif self.browse:
+            draw_button_helper("A: Select Zone | X: To Zone 1 | Y: To Zone 2 | B: Edit Search")
         else:
-            draw_button_helper("A: Select Zone | X: To Zone 1 | Y: To Zone 2 | B: Back")
+            draw_button_helper("↑↓: Letter | →: Next | ←: Delete | A: Results | X/Y: Send Top | B: Back")
+
+class RecentPatchesScreen(MenuScreen):
+    """
+    Recently used and favorite patches (TAB / Select from any screen). LEFT/RIGHT switch list,
+    A recalls the patch to the zone it was sent to, X pins/unpins it, B returns to `back`.
+    """
+    TABS = ("Recent", "Favorites")
+
+    def __init__(self, back=None):
+        super().__init__()
+        self.back = back or MainMenu()
+        self.tab = 0
+
+    def items(self):
+        if not PATCH_MEMORY:
+            return []
+        return PATCH_MEMORY.favorites if self.tab else PATCH_MEMORY.recent
+
+    def handle(self, action):
+        items = self.items()
+        set_debug(f"RecentMenu | {self.TABS[self.tab]} | sel:{self.selected_menu_index}/{len(items)} | key:{action}")
+        if action==InputAction.UP:   self.selected_menu_index = max(0, self.selected_menu_index-1)
+        if action==InputAction.DOWN: self.selected_menu_index = min(len(items)-1, self.selected_menu_index+1)
+        if action in (InputAction.LEFT, InputAction.RIGHT):
+            self.tab = 1 - self.tab
+            self.selected_menu_index = 0
+        if action==InputAction.BACK: return self.back
+        if action in (InputAction.ACTION_1, InputAction.ACTION_2) and items:
+            entry = items[min(self.selected_menu_index, len(items)-1)]
+            if action == InputAction.ACTION_2:
+                try:
+                    pinned = PATCH_MEMORY.toggle_favorite(entry)
+                except OSError as e:
+                    show_message(f"ERROR: {e}")
+                    return self
+                show_message(f"{entry['name']} {'added to' if pinned else 'removed from'} favorites")
+                self.selected_menu_index = min(self.selected_menu_index, max(0, len(self.items())-1))
+            elif midi_status != "Connected":
+                show_message("ERROR: Connect MIDI port first!")
+            else:
+                recall_entry(entry)
+        return self
+
+    def draw(self):
+        tabs = "   ".join(f"[{t}]" if i == self.tab else t for i, t in enumerate(self.TABS))
+        draw_text(tabs, FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 105, 'center')
+        items = self.items()
+        if not items:
+            empty = "No favorites yet: X pins a recent patch." if self.tab else "No patches sent yet."
+            draw_text(empty, FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 200, 'center')
+        start = max(0, self.selected_menu_index - 4)
+        for i in range(start, min(start+8, len(items))):
+            entry = items[i]
+            pin = "*" if self.tab == 0 and PATCH_MEMORY.is_favorite(entry) else " "
+            txt = f"{pin} {entry['name']}  → Zone {entry['zone']}"
+            y = 150 + (i-start)*40
+            if i == self.selected_menu_index:
+                draw_rect(COLOR_ACCENT, (50, y-5, GScreenWidth-100, 40), border_radius=5)
+                draw_text(txt, FONT_MEDIUM, COLOR_BG, 70, y+7)
+            else:
+                draw_text(txt, FONT_MEDIUM, COLOR_WHITE, 70, y+7)
+        draw_button_helper("A: Recall | X: Favorite On/Off | ←/→: Recent/Favorites | `/R: Previous | B: Back")
 
 class ZoneManagementScreen(MenuScreen):
 
@@ -461,26 +1093,262 @@ class ZoneManagementScreen(MenuScreen):
         draw_button_helper("B: Back")
 
 class PerformanceMangementScreen(MenuScreen):
+    """Saved performances (full part/zone snapshots). A: recall, X: save current as new, Y: overwrite selected."""
+
+    def on_enter(self):
+        self.names = GoRLib.list_performances() if midi_backend() else []
+        self.selected_menu_index = min(self.selected_menu_index, max(0, len(self.names)-1))
+
+    def save(self, name):
+        def on_saved(future):
+            if future.exception():
+                show_message(f"ERROR: {future.exception()}")
+                return
+            self.names = GoRLib.list_performances()
+            self.selected_menu_index = self.names.index(name) if name in self.names else 0
+            show_message(f"Saved {name}")
+        GoRLib.submit(GoRLib.save_performance, name, callback=on_saved)
+
+    def recall(self, name):
+        def on_recalled(future):
+            if future.exception():
+                show_message(f"ERROR: {future.exception()}")
+            else:
+                show_message(f"{name} recalled ({future.result()} changes sent)")
+        GoRLib.submit(GoRLib.recall_performance, name, callback=on_recalled)
 
     def handle(self, action):
-        set_debug(f"PerformanceMenu | sel:{self.selected_menu_index} | key:{action}")
+        set_debug(f"PerformanceMenu | sel:{self.selected_menu_index}/{len(self.names)} | key:{action}")
+        if action==InputAction.UP:   self.selected_menu_index = max(0, self.selected_menu_index-1)
+        if action==InputAction.DOWN: self.selected_menu_index = min(len(self.names)-1, self.selected_menu_index+1)
         if action==InputAction.BACK: return MainMenu()
+
+        if action in (InputAction.ACTION_1, InputAction.ACTION_2, InputAction.ACTION_3):
+            if midi_status != "Connected":
+                show_message("ERROR: Connect MIDI port first!")
+                return self
+            try:
+                if action == InputAction.ACTION_2:
+                    n = 1
+                    while f"PERF {n:02d}" in self.names: n += 1
+                    self.save(f"PERF {n:02d}")
+                elif self.names:
+                    name = self.names[self.selected_menu_index]
+                    if action == InputAction.ACTION_1: self.recall(name)
+                    else: self.save(name)
+            except Exception as e:
+                show_message(f"ERROR: {e}")
         return self
-    
-    def draw(self):    
-        draw_text("Performances feature coming soon!", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, GScreenHeight//2, 'center')
-        draw_button_helper("B: Back")
+
+    def draw(self):
+        draw_text("Performances:", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 105, 'center')
+        if not self.names:
+            draw_text("No saved performances yet.", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 200, 'center')
+        start = max(0, self.selected_menu_index - 4)
+        for i in range(start, min(start+8, len(self.names))):
+            y = 150 + (i-start)*40
+            if i == self.selected_menu_index:
+                draw_rect(COLOR_ACCENT, (50, y-5, GScreenWidth-100, 40), border_radius=5)
+                draw_text(self.names[i], FONT_MEDIUM, COLOR_BG, 70, y+7)
+            else:
+                draw_text(self.names[i], FONT_MEDIUM, COLOR_WHITE, 70, y+7)
+        draw_button_helper("A: Recall | X: Save Current as New | Y: Overwrite | B: Back")
+
+SETLIST = None  # the GoRLib.Setlist being played; stays active when leaving the screen
+
+class SetlistScreen(MenuScreen):
+    """
+    Setlists (setlists/<name>.json). Playing one, the next song is loaded into idle parts in
+    the background, so A/RIGHT switches songs without the tone-load gap.
+    """
+
+    def on_enter(self):
+        self.names = GoRLib.list_setlists() if midi_backend() else []
+        self.staging = False
+        self.target = SETLIST.live if SETLIST else None  # last song asked for (may not be live yet)
+        if SETLIST:
+            self.selected_menu_index = SETLIST.live if SETLIST.live is not None else 0
+        else:
+            self.selected_menu_index = min(self.selected_menu_index, max(0, len(self.names)-1))
+
+    def start(self, name):
+        global SETLIST
+        try:
+            SETLIST = GoRLib.Setlist.load(name)
+        except ValueError as e:
+            show_message(f"ERROR: {e}")
+            return
+        self.selected_menu_index = 0
+        self.go(0)
+
+    def go(self, song):
+        setlist = SETLIST
+        self.target = song
+        def on_live(future):
+            if future.cancelled():  # a newer song change replaced this one
+                return
+            if future.exception():
+                show_message(f"ERROR: {future.exception()}")
+                return
+            show_message(f"{song+1}. {setlist.titles[song]}")
+            self.stage_next(setlist)
+        GoRLib.submit_latest(("setlist", "go"), setlist.go, song, callback=on_live)
+
+    def stage_next(self, setlist):
+        def on_staged(future):
+            self.staging = False
+            if future.exception():
+                show_message(f"ERROR: {future.exception()}")
+            request_redraw()
+        self.staging = True
+        GoRLib.submit(setlist.stage_next, callback=on_staged)
+
+    def handle(self, action):
+        global SETLIST
+        items = SETLIST.titles if SETLIST else self.names
+        set_debug(f"SetlistMenu | sel:{self.selected_menu_index}/{len(items)} | key:{action}")
+        if action==InputAction.UP:   self.selected_menu_index = max(0, self.selected_menu_index-1)
+        if action==InputAction.DOWN: self.selected_menu_index = min(len(items)-1, self.selected_menu_index+1)
+        if action==InputAction.BACK: return MainMenu()
+        if action in (InputAction.ACTION_1, InputAction.LEFT, InputAction.RIGHT) and items:
+            if midi_status != "Connected":
+                show_message("ERROR: Connect MIDI port first!")
+                return self
+            if not SETLIST:
+                if action == InputAction.ACTION_1: self.start(self.names[self.selected_menu_index])
+                return self
+            song = self.selected_menu_index
+            if action != InputAction.ACTION_1:
+                song = self.target if self.target is not None else -1
+                song = max(0, min(len(items)-1, song + (1 if action == InputAction.RIGHT else -1)))
+                self.selected_menu_index = song
+            self.go(song)
+        if action==InputAction.ACTION_2 and SETLIST:
+            SETLIST = None
+            self.on_enter()
+        return self
+
+    def draw(self):
+        if not SETLIST:
+            draw_text("Setlists:", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 105, 'center')
+            items = self.names
+            if not items:
+                draw_text("No setlists in setlists/ yet.", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 200, 'center')
+        else:
+            draw_text(f"Setlist: {SETLIST.name}", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 105, 'center')
+            items = []
+            for i, title in enumerate(SETLIST.titles):
+                mark = "→" if i == SETLIST.live else "+" if i == SETLIST.staged else " "
+                items.append(f"{mark} {i+1}. {title}")
+        start = max(0, self.selected_menu_index - 4)
+        for i in range(start, min(start+7, len(items))):
+            y = 150 + (i-start)*40
+            if i == self.selected_menu_index:
+                draw_rect(COLOR_ACCENT, (50, y-5, GScreenWidth-100, 40), border_radius=5)
+                draw_text(items[i], FONT_MEDIUM, COLOR_BG, 70, y+7)
+            else:
+                draw_text(items[i], FONT_MEDIUM, COLOR_WHITE, 70, y+7)
+        if not SETLIST:
+            draw_button_helper("A: Play Setlist | B: Back")
+        else:
+            draw_button_helper(f"A: Go | ←/→: Prev/Next{' (loading)' if self.staging else ''} | X: Close | B: Back")
+
+MONITOR_RATE_WINDOW = 1.0   # seconds the msg/s figure averages over
+MONITOR_CC_ROWS = 6
+MONITOR_SYSEX_ROWS = 4
+
+class MidiMonitorScreen(MenuScreen):
+    """Live view of what the keyboard sends: held notes, recent CCs, message rate and SysEx log."""
+
+    def on_enter(self):
+        self.ring = GoRLib.get_input_ring() if midi_backend() else None
+        self.seq = self.ring.written if self.ring else 0
+        self.clear()
+
+    def clear(self):
+        self.notes = bytearray(128)   # velocity of held notes (any channel)
+        self.ccs = OrderedDict()      # (channel, controller) -> value, most recent last
+        self.sysex = []               # hex lines, newest last
+        self.total = 0
+
+    def update(self):
+        """Folds everything captured since the last frame into the meters."""
+        if not self.ring:
+            return
+        self.seq, messages = self.ring.read(self.seq, limit=self.ring.capacity)
+        for _, _, msg in messages:
+            self.total += 1
+            status = msg[0] & 0xF0
+            if msg[0] == 0xF0:
+                hex_bytes = msg.hex(' ').upper()
+                self.sysex = (self.sysex + [hex_bytes if len(hex_bytes) <= 60 else hex_bytes[:57] + '...'])[-MONITOR_SYSEX_ROWS:]
+            elif status == 0x90 and len(msg) == 3 and msg[2]:
+                self.notes[msg[1]] = msg[2]
+            elif status in (0x80, 0x90) and len(msg) == 3:
+                self.notes[msg[1]] = 0
+            elif status == 0xB0 and len(msg) == 3:
+                key = (msg[0] & 0x0F, msg[1])
+                self.ccs.pop(key, None)
+                self.ccs[key] = msg[2]
+                while len(self.ccs) > MONITOR_CC_ROWS:
+                    self.ccs.popitem(last=False)
+
+    def handle(self, action):
+        set_debug(f"MidiMonitor | seq:{self.seq} | key:{action}")
+        if action==InputAction.BACK: return MainMenu()
+        if action==InputAction.ACTION_1: self.clear()
+        return self
+
+    def draw(self):
+        draw_text("MIDI Monitor", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 105, 'center')
+        if not self.ring:
+            draw_text("Connect MIDI port first!", FONT_MEDIUM, COLOR_STATUS_FAIL, GScreenWidth//2, 200, 'center')
+            draw_button_helper("B: Back")
+            return
+        self.update()
+        rate = self.ring.rate(MONITOR_RATE_WINDOW)
+        draw_text(f"{rate:.0f} msg/s   {self.total} received", FONT_SMALL, COLOR_WHITE, 20, 130)
+
+        # Notes: one column per key, height = velocity
+        left, top, height = 20, 160, 60
+        key_width = (GScreenWidth - 2 * left) / 128
+        draw_rect(COLOR_SELECTED, (left, top, GScreenWidth - 2 * left, height))
+        for note, velocity in enumerate(self.notes):
+            if velocity:
+                bar = max(2, velocity * height // 127)
+                draw_rect(COLOR_ACCENT, (left + int(note * key_width), top + height - bar, max(2, int(key_width)), bar))
+
+        # Most recently changed controllers
+        y = top + height + 15
+        bar_left, bar_width = 200, GScreenWidth - 200 - left
+        for (channel, controller), value in reversed(self.ccs.items()):
+            draw_text(f"Ch{channel + 1:<2} CC{controller:<3} {value:>3}", FONT_SMALL, COLOR_WHITE, left, y)
+            draw_rect(COLOR_SELECTED, (bar_left, y + 2, bar_width, 14))
+            draw_rect(COLOR_STATUS_OK, (bar_left, y + 2, max(1, value * bar_width // 127), 14))
+            y += 22
+
+        y = top + height + 15 + MONITOR_CC_ROWS * 22 + 5
+        draw_text("SysEx:" if self.sysex else "SysEx: -", FONT_SMALL, COLOR_WHITE, left, y)
+        for line in reversed(self.sysex):
+            y += 18
+            draw_text(line, FONT_DEBUG, COLOR_DEBUG, left, y)
+        draw_button_helper("A: Clear | B: Back")
 
 class SettingsScreen(MenuScreen):
 
-    OPTIONS = ["Debug Overlay: OFF", "Back"]
+    OPTIONS = ["Debug Overlay: OFF", "Audition: OFF", "Audition Delay: 150 ms", "Export Latency Stats", "Record MIDI Traffic: OFF", "Back"]
 
     def on_enter(self):
         self.OPTIONS[0] = f"Debug Overlay: {'ON' if SHOW_DEBUG else 'OFF'}"
+        self.OPTIONS[1] = f"Audition: {f'Zone {AUDITION_ZONE}' if AUDITION_ZONE else 'OFF'}"
+        self.OPTIONS[2] = f"Audition Delay: {AUDITION_DELAY_MS} ms"
+        recording = MIDI_AVAILABLE and GoRLib.get_recorder() is not None
+        self.OPTIONS[4] = f"Record MIDI Traffic: {'ON' if recording else 'OFF'}"
     
     def handle(self, action):
         set_debug(f"SettingsMenu | sel:{self.selected_menu_index} | key:{action}")
-        if action in (InputAction.UP, InputAction.DOWN): self.selected_menu_index = 1 - self.selected_menu_index
+        if action==InputAction.UP:   self.selected_menu_index = max(0, self.selected_menu_index-1)
+        if action==InputAction.DOWN: self.selected_menu_index = min(len(self.OPTIONS)-1, self.selected_menu_index+1)
         if action==InputAction.BACK: return MainMenu()
         if action==InputAction.ACTION_1:
             if self.selected_menu_index == 0:
@@ -488,6 +1356,41 @@ class SettingsScreen(MenuScreen):
                 SHOW_DEBUG = not SHOW_DEBUG
                 self.OPTIONS[0] = f"Debug Overlay: {'ON' if SHOW_DEBUG else 'OFF'}"
                 show_message(f"Debug Overlay is now {'ON' if SHOW_DEBUG else 'OFF'}")
+            elif self.selected_menu_index == 1:
+                # OFF -> Zone 1 -> Zone 2 -> OFF
+                global AUDITION_ZONE
+                AUDITION_ZONE = (AUDITION_ZONE + 1) % 3
+                self.on_enter()
+                show_message(f"Audition is now {'Zone ' + str(AUDITION_ZONE) if AUDITION_ZONE else 'OFF'}")
+            elif self.selected_menu_index == 2:
+                global AUDITION_DELAY_MS
+                i = AUDITION_DELAYS_MS.index(AUDITION_DELAY_MS) if AUDITION_DELAY_MS in AUDITION_DELAYS_MS else -1
+                AUDITION_DELAY_MS = AUDITION_DELAYS_MS[(i + 1) % len(AUDITION_DELAYS_MS)]
+                self.on_enter()
+            elif self.selected_menu_index == 3:
+                if not LATENCY:
+                    show_message("ERROR: MIDI library not loaded")
+                    return self
+                path = os.path.join(SCRIPT_DIR, 'latency_stats.json')
+                try:
+                    LATENCY.export(path)
+                    show_message("Latency stats saved to latency_stats.json")
+                except OSError as e:
+                    show_message(f"ERROR: {e}")
+            elif self.selected_menu_index == 4:
+                # Everything sent and received goes to recordings/<date-time>.gor (GoRLib.py dump/replay)
+                if midi_status != "Connected":
+                    show_message("ERROR: Connect MIDI port first!")
+                    return self
+                try:
+                    recorder = GoRLib.stop_recording()
+                    if recorder:
+                        show_message(f"{recorder.messages} messages saved to {os.path.basename(recorder.path)}", 3)
+                    else:
+                        show_message(f"Recording to {os.path.basename(GoRLib.start_recording())}")
+                except OSError as e:
+                    show_message(f"ERROR: {e}")
+                self.on_enter()
             else:
                 return MainMenu()
         return self
@@ -497,9 +1400,9 @@ class SettingsScreen(MenuScreen):
         draw_text("Settings", FONT_MEDIUM, COLOR_WHITE, GScreenWidth//2, 105, 'center')
         y = 160
         for i, opt in enumerate(self.OPTIONS):
-            y_pos = y + i*70
+            y_pos = y + i*55
             if i == self.selected_menu_index:
-                pygame.draw.rect(screen, COLOR_ACCENT, (50, y_pos-10, GScreenWidth-100, 50), border_radius=5)
+                draw_rect(COLOR_ACCENT, (50, y_pos-10, GScreenWidth-100, 50), border_radius=5)
                 draw_text(f"> {opt} <", FONT_MEDIUM, COLOR_BG, 70, y_pos)
             else:
                 draw_text(opt, FONT_MEDIUM, COLOR_WHITE, 70, y_pos)
@@ -507,23 +1410,139 @@ class SettingsScreen(MenuScreen):
 
 # ==================== MAIN LOOP ====================
 
+# ==================== DEFERRED STARTUP ====================
+
+def start_port_watcher():
+    if midi_backend():
+        GoRLib.start_port_watcher(callback=on_port_event)
+
+def init_joystick():
+    global joystick
+    pygame.joystick.init()
+    if pygame.joystick.get_count() > 0:
+        joystick = pygame.joystick.Joystick(0)
+        joystick.init()
+
+GLYPH_WARMUP = "".join(chr(c) for c in range(32, 127)) + "→↑↓←"
+
+def warm_glyphs():
+    """Renders every glyph once and pre-renders the category list."""
+    for font in (FONT_LARGE, FONT_MEDIUM, FONT_SMALL):
+        font.render(GLYPH_WARMUP, True, COLOR_WHITE)
+    category_list().prerender()
+
+def build_patch_table():
+    """Pre-encodes every patch's MIDI messages on a background thread (GoRLib.set_patch_table)."""
+    if midi_backend():
+        Deferred("patch message table", lambda: GoRLib.set_patch_table(patch_index().ids()))
+
+def load_patch_memory():
+    global PATCH_MEMORY
+    if not midi_backend():
+        return
+    try:
+        PATCH_MEMORY = GoRLib.PatchMemory.load()
+    except ValueError as e:
+        PATCH_MEMORY = GoRLib.PatchMemory()
+        show_message(f"ERROR: {e}", 3)
+
+# (ready, step, name): run one per loop pass after the first frame, once ready() is true
+STARTUP_STEPS = [(lambda: True, init_joystick, "joystick init"),
+                 (_midi_backend.ready, start_port_watcher, "port watcher"),
+                 (_midi_backend.ready, load_patch_memory, "recent patches"),
+                 (_patch_index.ready, warm_glyphs, "glyph warm-up"),
+                 (_patch_index.ready, build_patch_table, "patch table")]
+first_frame_at = None
+
+def run_startup_step():
+    """Runs the next deferred startup step if it can run now. True while steps are left."""
+    global _phase_start
+    if STARTUP_STEPS and STARTUP_STEPS[0][0]():
+        _, step, name = STARTUP_STEPS.pop(0)
+        _phase_start = time.perf_counter()
+        step()
+        startup_phase(name)
+    if STARTUP_STEPS or not (_midi_backend.ready() and _patch_index.ready()):
+        return True
+    if PROFILE_STARTUP:
+        print_startup_profile()
+    return False
+
+def print_startup_profile():
+    print("GO:R startup profile (ms)")
+    for where, name, seconds in STARTUP_PHASES:
+        print(f"  {where:<12}{name:<26}{seconds * 1000:8.1f}")
+    print(f"  first interactive frame {(first_frame_at - STARTUP_T0) * 1000:.1f} ms after ui.py started")
+    sys.stdout.flush()
+
+def apply_port_changes():
+    """Main loop: re-reads the port list on the port selection screen after the watcher saw a change."""
+    if _ports_changed.is_set():
+        _ports_changed.clear()
+        if isinstance(current, MidiSelectionScreen):
+            current.refresh()
+
+def dispatch(key):
+    """Runs one input action on the current screen and switches screen if it asks to."""
+    global current, _held
+    start = time.perf_counter()
+    if key == InputAction.PREVIOUS:
+        recall_previous()
+        next_screen = current
+    elif key == InputAction.RECENT:
+        next_screen = current.back if isinstance(current, RecentPatchesScreen) else RecentPatchesScreen(current)
+    else:
+        next_screen = current.handle(key)
+    if LATENCY: LATENCY.record("handler", time.perf_counter() - start)
+
+    if next_screen == "exit":
+        pygame.quit(); sys.exit()
+    if next_screen is not current:
+        _held = None
+        current = next_screen
+        current.on_enter()
+
 current = MainMenu()
 current.on_enter()
+starting = True
 
 while True:
-    for e in pygame.event.get():
+    render_screen()
+    if first_frame_at is None:
+        startup_phase("first frame")
+        first_frame_at = time.perf_counter()
+    if starting:
+        starting = run_startup_step()
+
+    # Sleep until something happens, then take everything that queued up meanwhile
+    events = wait_for_events(10 if starting else next_wait_ms())
+    woke = time.perf_counter()
+    _wake.clear()
+    for e in events:
         if e.type == pygame.QUIT:
             pygame.quit(); sys.exit()
+        if e.type in (pygame.NOEVENT, REDRAW_EVENT):
+            continue
+
+        # Screens with text entry get first look at keyboard input
+        if e.type == pygame.KEYDOWN and hasattr(current, 'handle_key') and current.handle_key(e):
+            continue
 
         key = decode_keystroke(e)
+        track_held(e, key)
 
         if key:
-            next_screen = current.handle(key)
-
-            if next_screen == "exit":
-                pygame.quit(); sys.exit()
-            if next_screen is not current:
-                current = next_screen
-                current.on_enter()
-
-    render_screen()
\ No newline at end of file
+            request_burst()
+            if LATENCY:
+                LATENCY.record("event_wait", time.perf_counter() - woke)  # time spent behind earlier events
+                LATENCY.mark_input()
+            dispatch(key)
+
+    apply_port_changes()
+
+    # Held UP/DOWN keeps stepping, faster the longer it is held
+    for key in held_repeats():
+        if not _held:  # the screen changed
+            break
+        request_burst()
+        dispatch(key)
\ No newline at end of file